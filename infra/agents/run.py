@@ -5,7 +5,6 @@ import pysqlite3
 
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
-import asyncio
 import logging
 import os
 import sys
@@ -16,6 +15,7 @@ from infra.agents.data_index_agent import DataIndexAgent
 from infra.agents.math_agent import MathAgent
 from infra.embeddings.providers import OpenAIEmbeddingProvider
 from infra.llm.providers import OpenAIProvider
+from infra.utils import run_async
 from infra.vector_stores.weaviate import WeaviateVectorStore
 
 
@@ -49,4 +49,4 @@ if __name__ == "__main__":
         for event in events:
             event["messages"][-1].pretty_print()
 
-    sys.exit(asyncio.run(run()))
+    sys.exit(run_async(run()))
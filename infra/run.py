@@ -4,12 +4,11 @@ import pysqlite3
 
 
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
-import asyncio
+import json
 import logging
 import os
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from multiprocessing import Pool
 
 from infra.acquisition.sec_fetcher import (
     DataFormat,
@@ -24,6 +23,7 @@ from infra.preprocessing.html_parser import HTMLParser
 from infra.preprocessing.markdown_splitter import MarkdownSplitter
 from infra.preprocessing.pdf_parser import PDFParser
 from infra.preprocessing.sec_parser import SECParser, SECSplitter
+from infra.utils import run_async
 from infra.vector_stores.chromadb import ChromaVectorStore
 
 
@@ -34,26 +34,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def save_docs(docs, step, ticker, doc_type: FilingType, ext):
+def save_docs(docs, step, ticker, doc_type: FilingType):
     """
-    Save the documents to a specified location.
+    Save the documents for a pipeline step to a single JSONL file.
+
+    Each line holds the document source, its chunk index and the text, so a
+    whole batch costs one file open and one flush instead of one per chunk.
     """
-    for i, doc in enumerate(docs):
-        url_hash = hash(doc.metadata.get("source", "unknown"))
-        output_path = f"cache/saved_documents/{step}/{ticker}_{doc_type.value}_{url_hash}_{i}.{ext}"
-        # Create directory if it doesn't exist
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
-        # Write all documents to the file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(f"{doc.page_content}\n\n")
-
-        logger.info(
-            f"Document {doc.metadata.get('source', 'unknown')}, index {i} written to {output_path}"
+    output_path = f"cache/saved_documents/{step}/{ticker}_{doc_type.value}.jsonl"
+    # Create directory if it doesn't exist
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    # Write all documents to the file in one pass
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.writelines(
+            json.dumps(
+                {
+                    "source": doc.metadata.get("source", "unknown"),
+                    "chunk_id": i,
+                    "text": doc.page_content,
+                }
+            )
+            + "\n"
+            for i, doc in enumerate(docs)
         )
 
+    logger.info(f"{len(docs)} documents written to {output_path}")
+
 
 if __name__ == "__main__":
 
@@ -79,15 +88,15 @@ if __name__ == "__main__":
 
             docs = await loader.load(filings)
             print(f"Number of documents: {len(docs)}")
-            # save_docs(docs, "load", ticker, doc_type, "html")
+            # save_docs(docs, "load", ticker, doc_type)
 
             documents = parser.parse(docs)
             print(f"Number of documents: {len(documents)}")
-            # save_docs(documents, "parse", ticker, doc_type, "md")
+            # save_docs(documents, "parse", ticker, doc_type)
 
             split_docs = await splitter.split_documents(documents)
             print(f"Number of documents: {len(split_docs)}")
-            # save_docs(split_docs, "split", ticker, doc_type, "md")
+            # save_docs(split_docs, "split", ticker, doc_type)
 
             # embedding_model = embeddings.get_embedding_model()
             # # vector_store.add_documents(split_docs, embedding_model)
@@ -105,11 +114,11 @@ if __name__ == "__main__":
             # retrieved_docs = retriever.invoke(
             #     "How does Goldman Sachs make money from market making activities?"
             # )
-            # save_docs(retrieved_docs, "retrieve", ticker, doc_type, "md")
+            # save_docs(retrieved_docs, "retrieve", ticker, doc_type)
             return None
         except Exception as e:
             logger.error(f"Error fetching {ticker} {doc_type.value} filings: {e}")
             raise
 
     # Run
-    sys.exit(asyncio.run(infra_run()))
+    sys.exit(run_async(infra_run()))
@@ -14,28 +14,21 @@ import pysqlite3
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
 import argparse
-import asyncio
 import logging
 import os
 import sys
 
-from infra.orchestration.controller import HybridController
-
-from infra.acquisition.sec_fetcher import DataFormat, FilingType
-
 # from infra.agents.base import LangChainAgent
 from infra.embeddings.providers import OpenAIEmbeddingProvider
 from infra.llm.providers import OpenAIProvider
+from infra.orchestration.controller import HybridController
+from infra.utils import run_async
 
 # from infra.prompting.strategies import BasicPromptStrategy
-from infra.tools.pipelines import IndexingPipelineTool
 from infra.vector_stores.chromadb import ChromaVectorStore
 
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Set up logging; handlers are configured in main() from --log-level
 logger = logging.getLogger(__name__)
 
 
@@ -207,4 +200,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -6,11 +6,11 @@ This module provides tools specifically for debugging and observing agent behavi
 These tools are useful during development to understand what's happening.
 """
 
-import json
 import logging
 import pprint
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Optional, Type
 
+import orjson
 from pydantic import BaseModel
 
 from infra.tools.base import BaseTool
@@ -69,21 +69,23 @@ class EchoTool(BaseTool):
         Returns:
             A string containing the echoed message and metadata
         """
-        # Log all inputs in detail
-        logger.info(f"🔍 ECHO TOOL RECEIVED INPUT")
-        logger.info(f"📝 Message: {message}")
-
-        if metadata:
-            logger.info(f"📋 Metadata:")
-            formatted_metadata = pprint.pformat(metadata, indent=2)
-            for line in formatted_metadata.split("\n"):
-                logger.info(f"   {line}")
-
-        if kwargs:
-            logger.info(f"🔧 Additional kwargs:")
-            formatted_kwargs = pprint.pformat(kwargs, indent=2)
-            for line in formatted_kwargs.split("\n"):
-                logger.info(f"   {line}")
+        # Log all inputs in detail; pretty-printing is skipped entirely when
+        # INFO records would be discarded anyway
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔍 ECHO TOOL RECEIVED INPUT")
+            logger.info("📝 Message: %s", message)
+
+            if metadata:
+                logger.info("📋 Metadata:")
+                formatted_metadata = pprint.pformat(metadata, indent=2)
+                for line in formatted_metadata.split("\n"):
+                    logger.info("   %s", line)
+
+            if kwargs:
+                logger.info("🔧 Additional kwargs:")
+                formatted_kwargs = pprint.pformat(kwargs, indent=2)
+                for line in formatted_kwargs.split("\n"):
+                    logger.info("   %s", line)
 
         # Build response
         response = {
@@ -92,10 +94,15 @@ class EchoTool(BaseTool):
             "additional_args": kwargs,
         }
 
+        # Serialize once and reuse it for both the log line and the result
+        serialized = orjson.dumps(
+            response, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
         # Log the response
-        logger.info(f"↩️ ECHO TOOL RESPONSE: {json.dumps(response, indent=2)}")
+        logger.info("↩️ ECHO TOOL RESPONSE: %s", serialized)
 
-        return json.dumps(response, indent=2)
+        return serialized
 
 
 # class TracingTool(BaseTool):
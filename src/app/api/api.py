@@ -22,6 +22,7 @@ For end users:
 """
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.api.endpoints import (
     export,
@@ -33,8 +34,10 @@ from app.api.endpoints import (
 
 
 # Create the main API router
-# This router will include all other routers and be included in the main app
-api_router = APIRouter()
+# This router will include all other routers and be included in the main app.
+# Responses are serialized with orjson, which is several times faster than the
+# stdlib json used by the default JSONResponse; included routers inherit it
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include SEC analysis endpoints
 api_router.include_router(
@@ -17,12 +17,26 @@ How it fits in the architecture:
 - Provides an interface for frontend financial analysis requests
 """
 
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+import numpy as np
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
@@ -36,6 +50,30 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter()
 
+# Model builds block for minutes on LLM calls, so they run on a dedicated
+# pool of worker threads instead of the event loop that serves requests
+MODELING_WORKERS = 4
+_modeling_executor = ThreadPoolExecutor(
+    max_workers=MODELING_WORKERS, thread_name_prefix="financial-modeling"
+)
+
+
+async def _build_financial_model(**kwargs: Any) -> Dict[str, Any]:
+    """
+    Build a financial model on the modeling worker pool.
+
+    Args:
+        **kwargs: Arguments for ai_financial_modeler.build_financial_model
+
+    Returns:
+        The financial model
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _modeling_executor,
+        functools.partial(ai_financial_modeler.build_financial_model, **kwargs),
+    )
+
 
 # Request/response models
 class ModelingRequest(BaseModel):
@@ -98,7 +136,7 @@ async def generate_financial_model(request: ModelingRequest):
 
     try:
         # Build the financial model
-        financial_model = ai_financial_modeler.build_financial_model(
+        financial_model = await _build_financial_model(
             ticker=request.ticker,
             years_historical=request.years_historical,
             years_projection=request.years_projection,
@@ -163,6 +201,8 @@ async def generate_financial_model_async(
             "estimated_completion_time": datetime.now().timestamp()
             + 300,  # Estimate 5 minutes
             "result": None,
+            # Set once the job completes or fails, to wake WebSocket watchers
+            "done": asyncio.Event(),
         }
 
         # Add the background task
@@ -192,6 +232,49 @@ async def generate_financial_model_async(
         )
 
 
+def _job_status(job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Describe the current state of a modeling job.
+
+    Args:
+        job_id: Job ID
+        job: The job entry
+
+    Returns:
+        Job status and results if complete
+    """
+    # If the job is complete, return the results
+    if job["status"] == "completed":
+        return {
+            "job_id": job_id,
+            "ticker": job["ticker"],
+            "status": "completed",
+            "completed_at": job.get("completed_at"),
+            "result": job["result"],
+        }
+
+    # If the job failed, return the error
+    if job["status"] == "failed":
+        return {
+            "job_id": job_id,
+            "ticker": job["ticker"],
+            "status": "failed",
+            "error": job.get("error"),
+            "failed_at": job.get("failed_at"),
+        }
+
+    # If the job is still pending, return the status
+    return {
+        "job_id": job_id,
+        "ticker": job["ticker"],
+        "status": "pending",
+        "created_at": job["created_at"],
+        "estimated_completion_time": datetime.fromtimestamp(
+            job["estimated_completion_time"]
+        ),
+    }
+
+
 @router.get("/model/job/{job_id}", summary="Get modeling job status")
 async def get_modeling_job_status(job_id: str):
     """
@@ -216,38 +299,7 @@ async def get_modeling_job_status(job_id: str):
                 status_code=404, detail=f"Modeling job {job_id} not found"
             )
 
-        job = modeling_jobs[job_id]
-
-        # If the job is complete, return the results
-        if job["status"] == "completed":
-            return {
-                "job_id": job_id,
-                "ticker": job["ticker"],
-                "status": "completed",
-                "completed_at": job.get("completed_at"),
-                "result": job["result"],
-            }
-
-        # If the job failed, return the error
-        if job["status"] == "failed":
-            return {
-                "job_id": job_id,
-                "ticker": job["ticker"],
-                "status": "failed",
-                "error": job.get("error"),
-                "failed_at": job.get("failed_at"),
-            }
-
-        # If the job is still pending, return the status
-        return {
-            "job_id": job_id,
-            "ticker": job["ticker"],
-            "status": "pending",
-            "created_at": job["created_at"],
-            "estimated_completion_time": datetime.fromtimestamp(
-                job["estimated_completion_time"]
-            ),
-        }
+        return _job_status(job_id, modeling_jobs[job_id])
 
     except HTTPException as e:
         raise e
@@ -258,6 +310,87 @@ async def get_modeling_job_status(job_id: str):
         )
 
 
+@router.websocket("/model/job/{job_id}/ws")
+async def watch_modeling_job(websocket: WebSocket, job_id: str):
+    """
+    Push the status of an asynchronous modeling job over a WebSocket.
+
+    Sends the current status as soon as the client connects and, if the job
+    is still pending, sends the final status the moment the job completes or
+    fails, then closes. If the client disconnects first, the watcher stops
+    waiting and is dropped. Clients that cannot use WebSockets can poll
+    /model/job/{job_id} instead.
+
+    Parameters:
+    - **job_id**: The ID of the job to watch
+    """
+    await websocket.accept()
+
+    job = modeling_jobs.get(job_id)
+    if job is None:
+        await websocket.close(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason=f"Modeling job {job_id} not found",
+        )
+        return
+
+    try:
+        await _send_job_status(websocket, job_id, job)
+        if job["status"] == "pending":
+            # Race the job against the client going away, so a disconnected
+            # watcher doesn't linger until the job finishes
+            done = asyncio.create_task(job["done"].wait())
+            disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+            try:
+                finished, _ = await asyncio.wait(
+                    {done, disconnected}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                done.cancel()
+                disconnected.cancel()
+            if disconnected in finished:
+                logger.info(f"Watcher of modeling job {job_id} disconnected")
+                return
+            await _send_job_status(websocket, job_id, job)
+
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info(f"Watcher of modeling job {job_id} disconnected")
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """
+    Wait until the client disconnects, discarding any messages it sends.
+
+    Args:
+        websocket: The connected WebSocket
+    """
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+async def _send_job_status(
+    websocket: WebSocket, job_id: str, job: Dict[str, Any]
+) -> None:
+    """
+    Send the status of a modeling job as a JSON text message.
+
+    Args:
+        websocket: The connected WebSocket
+        job_id: Job ID
+        job: The job entry
+    """
+    # Results hold datetimes and numpy values, which orjson serializes
+    message = orjson.dumps(
+        _job_status(job_id, job),
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+    await websocket.send_text(message.decode())
+
+
 async def process_modeling_job(
     job_id: str,
     ticker: str,
@@ -277,7 +410,7 @@ async def process_modeling_job(
     """
     try:
         # Build the financial model
-        financial_model = ai_financial_modeler.build_financial_model(
+        financial_model = await _build_financial_model(
             ticker=ticker,
             years_historical=years_historical,
             years_projection=years_projection,
@@ -299,6 +432,9 @@ async def process_modeling_job(
         modeling_jobs[job_id]["failed_at"] = datetime.now()
         modeling_jobs[job_id]["error"] = str(e)
 
+    finally:
+        modeling_jobs[job_id]["done"].set()
+
 
 @router.get("/{symbol}/quick-model", summary="Get quick financial model summary")
 async def get_quick_model(
@@ -351,38 +487,39 @@ async def get_quick_model(
 
                 # Calculate growth rates if we have enough data
                 if len(revenue_data) >= 2:
-                    growth_rates = []
-                    for i in range(1, len(revenue_data)):
-                        current = revenue_data[i]["value"]
-                        previous = revenue_data[i - 1]["value"]
-                        if previous and current:
-                            growth_rate = (current - previous) / previous * 100
-                            growth_rates.append(
-                                {
-                                    "year": revenue_data[i]["year"],
-                                    "growth_rate": growth_rate,
-                                }
-                            )
-
-                    summary["historical_growth_rates"] = growth_rates
+                    # Missing values count as zero and are skipped, as are
+                    # the years either side of them
+                    values = np.array(
+                        [r["value"] or 0.0 for r in revenue_data], dtype=np.float64
+                    )
+                    years_index = np.array(
+                        [r["year"] for r in revenue_data[1:]], dtype=object
+                    )
+                    valid = (values[1:] != 0) & (values[:-1] != 0)
+                    previous = values[:-1][valid]
+                    growth = (values[1:][valid] - previous) / previous * 100
+
+                    summary["historical_growth_rates"] = [
+                        {"year": year, "growth_rate": growth_rate}
+                        for year, growth_rate in zip(
+                            years_index[valid].tolist(), growth.tolist()
+                        )
+                    ]
 
                     # Project forward using average growth rate
-                    if growth_rates:
-                        avg_growth_rate = sum(
-                            g["growth_rate"] for g in growth_rates
-                        ) / len(growth_rates)
+                    if growth.size:
+                        avg_growth_rate = float(growth.mean())
                         last_revenue = revenue_data[-1]["value"]
                         last_year = int(revenue_data[-1]["year"])
 
-                        projected_revenue = []
-                        for i in range(1, 4):  # Project 3 years forward
-                            year = last_year + i
-                            revenue = last_revenue * (1 + avg_growth_rate / 100) ** i
-                            projected_revenue.append(
-                                {"year": str(year), "projected_revenue": revenue}
-                            )
-
-                        summary["projected_revenue"] = projected_revenue
+                        # Project 3 years forward
+                        projections = last_revenue * np.cumprod(
+                            np.full(3, 1 + avg_growth_rate / 100)
+                        )
+                        summary["projected_revenue"] = [
+                            {"year": str(last_year + i), "projected_revenue": revenue}
+                            for i, revenue in enumerate(projections.tolist(), start=1)
+                        ]
                         summary["assumed_growth_rate"] = avg_growth_rate
 
         return summary
@@ -0,0 +1,75 @@
+"""
+JSON Files
+----------
+
+This module reads and writes the JSON cache files kept by the services.
+
+What this file does:
+1. Serializes with orjson, which is several times faster than stdlib json
+2. Offers async variants that run the file I/O in a worker thread, so
+   concurrent analyses keep running
+
+How it fits in the architecture:
+- Used by the services for their on-disk caches
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Union
+
+import orjson
+
+
+# Analysis results are built with pandas/numpy and may use int keys (years);
+# anything else orjson cannot serialize is written as its string form
+_DUMP_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        The decoded JSON data
+    """
+    return orjson.loads(Path(path).read_bytes())
+
+
+def dump_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data to a JSON file, indented by two spaces.
+
+    Args:
+        path: Path of the JSON file
+        data: The data to serialize
+    """
+    Path(path).write_bytes(orjson.dumps(data, default=str, option=_DUMP_OPTIONS))
+
+
+async def read_json(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file without blocking the event loop.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        The decoded JSON data
+    """
+    return await asyncio.to_thread(load_json, path)
+
+
+async def write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data to a JSON file without blocking the event loop.
+
+    Args:
+        path: Path of the JSON file
+        data: The data to serialize
+    """
+    await asyncio.to_thread(dump_json, path, data)
@@ -0,0 +1,79 @@
+"""
+OpenAI Client
+-------------
+
+This module provides the process-wide OpenAI clients used by the AI services.
+
+What this file does:
+1. Lazily creates one async OpenAI client per event loop and one sync client
+2. Backs each with a pooled HTTP client so keep-alive connections are reused
+
+How it fits in the architecture:
+- Shared by the analyst, filing analyzer, trends and modeler services
+- Replaces a client (and connection pool) per service instance, so every
+  request after the first skips the TCP and TLS handshake
+- Async connection pools only work on the loop that opened them, so async
+  clients are kept per running loop
+"""
+
+import asyncio
+import functools
+import logging
+import weakref
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 100
+
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Return the async OpenAI client of the running event loop.
+
+    The client is created on first use in each loop. Must be called from a
+    coroutine.
+
+    Returns:
+        The shared AsyncOpenAI client for the running loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        logger.info("Creating shared async OpenAI client")
+        client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(limits=_limits()),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Return the shared sync OpenAI client, creating it on first use.
+
+    Returns:
+        The shared OpenAI client
+    """
+    logger.info("Creating shared OpenAI client")
+    return OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=httpx.Client(limits=_limits()),
+    )
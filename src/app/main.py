@@ -20,6 +20,7 @@ import logging
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.api import api_router
 from app.core.config import settings
@@ -40,6 +41,7 @@ app = FastAPI(
     description=settings.PROJECT_DESCRIPTION,  # Description of what the API does
     version=settings.VERSION,  # Current version of the API
     openapi_url=f"{settings.API_V1_STR}/openapi.json",  # URL to access API documentation
+    default_response_class=ORJSONResponse,  # Serialize responses with orjson
 )
 
 # Set up CORS middleware
@@ -26,6 +26,7 @@ Financial importance:
 - Combines quantitative and qualitative factors for holistic assessment
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -35,9 +36,11 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.json_files import read_json, write_json
+from app.core.openai_client import get_async_openai_client
 from app.services.ai_financial_modeler import AIFinancialModeler
 from app.services.financial_data_aggregator import financial_data_aggregator
 
@@ -151,6 +154,32 @@ Here is the financial data and analysis: {financial_and_competitor_data}
 """
 
 
+def _sentence_containing(text: str, needle: str) -> Optional[str]:
+    """
+    Return the first ". "-separated sentence of text that contains needle.
+
+    Rather than splitting the whole text into sentences, this finds the needle
+    and scans outward to the nearest separators, so it stops at the first hit.
+
+    Args:
+        text: The text to search
+        needle: The substring to look for
+
+    Returns:
+        The stripped sentence, or None if no single sentence contains needle
+    """
+    idx = text.find(needle)
+    while idx != -1:
+        end = text.find(". ", idx)
+        # Skip occurrences that straddle a sentence separator
+        if end == -1 or end >= idx + len(needle):
+            start = text.rfind(". ", 0, idx)
+            start = 0 if start == -1 else start + 2
+            return text[start : len(text) if end == -1 else end].strip()
+        idx = text.find(needle, idx + 1)
+    return None
+
+
 class AIAnalyst:
     """
     AI-driven financial analyst service that uses LLMs to generate
@@ -161,10 +190,14 @@ class AIAnalyst:
         """Initialize the AI analyst."""
         self.cache_dir = Path(settings.DATA_DIR) / "financial_analysis"
         os.makedirs(self.cache_dir, exist_ok=True)
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
         self.financial_modeler = AIFinancialModeler()
 
-    def generate_investment_analysis(
+    @property
+    def openai_client(self) -> AsyncOpenAI:
+        """The OpenAI client of the running event loop."""
+        return get_async_openai_client()
+
+    async def generate_investment_analysis(
         self,
         ticker: str,
         years_historical: int = 5,
@@ -188,8 +221,7 @@ class AIAnalyst:
         # Check cache if not forcing refresh
         if not force_refresh and cache_file.exists():
             try:
-                with open(cache_file) as f:
-                    cached_data = json.load(f)
+                cached_data = await read_json(cache_file)
 
                 # Check if cache is recent (within 3 days)
                 cache_date = datetime.fromisoformat(
@@ -220,20 +252,24 @@ class AIAnalyst:
 
         # 3. Generate investment analysis
         logger.info(f"Generating investment analysis for {ticker}")
-        analysis = self._generate_analysis_with_ai(ticker, financial_model, peer_data)
+        analysis = await self._generate_analysis_with_ai(
+            ticker, financial_model, peer_data
+        )
 
-        # 4. Generate executive summary
+        # 4 & 5. Generate the executive summary and, if peers are included,
+        # the competitive analysis. Both only read the analysis, so the two
+        # LLM calls run concurrently.
         logger.info(f"Creating executive summary for {ticker}")
-        executive_summary = self._generate_executive_summary(ticker, analysis)
-        analysis["executive_summary"] = executive_summary
-
-        # 5. Generate competitive analysis if peers included
+        tasks = [self._generate_executive_summary(ticker, analysis)]
         if include_peers and peer_data:
             logger.info(f"Creating competitive analysis for {ticker}")
-            competitive_analysis = self._generate_competitive_analysis(
-                ticker, analysis, peer_data
+            tasks.append(
+                self._generate_competitive_analysis(ticker, analysis, peer_data)
             )
-            analysis["competitive_analysis"] = competitive_analysis
+        executive_summary, *competitive_analysis = await asyncio.gather(*tasks)
+        analysis["executive_summary"] = executive_summary
+        if competitive_analysis:
+            analysis["competitive_analysis"] = competitive_analysis[0]
 
         # 6. Add metadata
         analysis["metadata"] = {
@@ -245,8 +281,7 @@ class AIAnalyst:
 
         # 7. Cache the results
         try:
-            with open(cache_file, "w") as f:
-                json.dump(analysis, f, indent=2, default=str)
+            await write_json(cache_file, analysis)
             logger.info(f"Cached investment analysis for {ticker}")
         except Exception as e:
             logger.warning(f"Error caching investment analysis: {e}")
@@ -376,7 +411,7 @@ class AIAnalyst:
             logger.warning(f"Error extracting peer metrics: {e}")
             return metrics
 
-    def _generate_analysis_with_ai(
+    async def _generate_analysis_with_ai(
         self, ticker: str, financial_model: Dict[str, Any], peer_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
@@ -400,7 +435,7 @@ class AIAnalyst:
             )
 
             # Call the OpenAI API
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model=settings.FINANCIAL_ANALYSIS_MODEL,
                 messages=[
                     {
@@ -1279,14 +1314,9 @@ class AIAnalyst:
                 recommendation["rating"] = rec
 
                 # Try to extract the context around the recommendation
-                try:
-                    sentences = summary_text.split(". ")
-                    for sentence in sentences:
-                        if rec in sentence:
-                            recommendation["context"] = sentence.strip()
-                            break
-                except:
-                    pass
+                context = _sentence_containing(summary_text, rec)
+                if context is not None:
+                    recommendation["context"] = context
 
                 break
 
@@ -1320,14 +1350,9 @@ class AIAnalyst:
                 price_target["value"] = float(matches[0])
 
                 # Try to extract the context around the price target
-                try:
-                    sentences = valuation_text.split(". ")
-                    for sentence in sentences:
-                        if f"${matches[0]}" in sentence:
-                            price_target["context"] = sentence.strip()
-                            break
-                except:
-                    pass
+                context = _sentence_containing(valuation_text, f"${matches[0]}")
+                if context is not None:
+                    price_target["context"] = context
 
                 break
 
@@ -1439,7 +1464,9 @@ class AIAnalyst:
 
         return key_risks
 
-    def _generate_executive_summary(self, ticker: str, analysis: Dict[str, Any]) -> str:
+    async def _generate_executive_summary(
+        self, ticker: str, analysis: Dict[str, Any]
+    ) -> str:
         """
         Generate a concise executive summary using AI.
 
@@ -1460,7 +1487,7 @@ class AIAnalyst:
             )
 
             # Call the OpenAI API
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model=settings.FINANCIAL_ANALYSIS_MODEL,
                 messages=[
                     {
@@ -1482,7 +1509,7 @@ class AIAnalyst:
             logger.error(f"Error generating executive summary: {e}")
             return f"Error generating executive summary: {e}"
 
-    def _generate_competitive_analysis(
+    async def _generate_competitive_analysis(
         self, ticker: str, analysis: Dict[str, Any], peer_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
@@ -1509,7 +1536,7 @@ class AIAnalyst:
             )
 
             # Call the OpenAI API
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model=settings.FINANCIAL_ANALYSIS_MODEL,
                 messages=[
                     {
@@ -28,21 +28,39 @@ Financial importance:
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from openai import OpenAI
 
 from app.core.config import settings
+from app.core.json_files import dump_json
+from app.core.openai_client import get_openai_client
 from app.services.financial_data_aggregator import financial_data_aggregator
 
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+MARGIN_TYPES = [
+    "gross margin",
+    "operating margin",
+    "profit margin",
+    "ebitda margin",
+]
+
+_DOLLAR_VALUE_RE = re.compile(r"\$[\d,]+(?:\.\d+)?")
+_LIST_ITEM_RE = re.compile(r"^[^\S\n]*[-*] (.*)$", re.MULTILINE)
+
+
+def _extract_percentages(line: str) -> List[float]:
+    """Extract the percentage values (e.g. "5.2%") from a line of text."""
+    return [float(p.strip(" %")) for p in line.split() if "%" in p]
+
+
 # Prompts for AI-driven modeling
 FINANCIAL_MODEL_PROMPT_TEMPLATE = """
 You are an expert financial analyst specializing in building financial models based on SEC filings data.
@@ -114,7 +132,7 @@ class AIFinancialModeler:
         """Initialize the AI financial modeler."""
         self.cache_dir = Path(settings.DATA_DIR) / "financial_models"
         os.makedirs(self.cache_dir, exist_ok=True)
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.openai_client = get_openai_client()
 
     def build_financial_model(
         self,
@@ -189,8 +207,7 @@ class AIFinancialModeler:
 
         # 6. Cache the results
         try:
-            with open(cache_file, "w") as f:
-                json.dump(model, f, indent=2, default=str)
+            dump_json(cache_file, model)
             logger.info(f"Cached financial model for {ticker}")
         except Exception as e:
             logger.warning(f"Error caching financial model: {e}")
@@ -496,51 +513,35 @@ class AIFinancialModeler:
             "text": assumptions_text,
         }
 
-        # Look for revenue growth projections
-        growth_lines = [
-            line
-            for line in assumptions_text.split("\n")
-            if "revenue growth" in line.lower() and "%" in line
-        ]
-
-        for line in growth_lines:
-            # Try to extract percentage values
-            percents = [float(p.strip(" %")) for p in line.split() if "%" in p]
-            if percents:
-                assumptions["revenue_growth"] = percents
-
-        # Look for margin assumptions
-        margin_types = [
-            "gross margin",
-            "operating margin",
-            "profit margin",
-            "ebitda margin",
-        ]
-        for margin_type in margin_types:
-            margin_lines = [
-                line
-                for line in assumptions_text.split("\n")
-                if margin_type in line.lower() and "%" in line
-            ]
-
-            for line in margin_lines:
-                # Try to extract percentage values
-                percents = [float(p.strip(" %")) for p in line.split() if "%" in p]
+        # Scan the text once, lowercasing each line once, and test every
+        # assumption type against it instead of re-splitting per type
+        tax_line = None
+        for line in assumptions_text.split("\n"):
+            if "%" not in line:
+                continue
+            lower = line.lower()
+
+            # Look for revenue growth projections
+            if "revenue growth" in lower:
+                percents = _extract_percentages(line)
                 if percents:
-                    assumptions["margins"][margin_type] = (
-                        percents[0] if len(percents) == 1 else percents
-                    )
-
-        # Look for tax rate
-        tax_lines = [
-            line
-            for line in assumptions_text.split("\n")
-            if "tax rate" in line.lower() and "%" in line
-        ]
-
-        if tax_lines:
-            # Try to extract percentage value
-            percents = [float(p.strip(" %")) for p in tax_lines[0].split() if "%" in p]
+                    assumptions["revenue_growth"] = percents
+
+            # Look for margin assumptions
+            for margin_type in MARGIN_TYPES:
+                if margin_type in lower:
+                    percents = _extract_percentages(line)
+                    if percents:
+                        assumptions["margins"][margin_type] = (
+                            percents[0] if len(percents) == 1 else percents
+                        )
+
+            # Look for tax rate (only the first mention is used)
+            if tax_line is None and "tax rate" in lower:
+                tax_line = line
+
+        if tax_line is not None:
+            percents = _extract_percentages(tax_line)
             if percents:
                 assumptions["tax_rate"] = percents[0]
 
@@ -577,47 +578,27 @@ class AIFinancialModeler:
             "text": valuation_text,
         }
 
-        # Look for DCF value
-        dcf_lines = [
-            line
-            for line in valuation_text.split("\n")
-            if "dcf value" in line.lower() or "dcf valuation" in line.lower()
-        ]
+        # One pass over the lines for both the DCF value and target price
+        for line in valuation_text.split("\n"):
+            lower = line.lower()
+            keys = []
+            if "dcf value" in lower or "dcf valuation" in lower:
+                keys.append("dcf_value")
+            if "target price" in lower or "price target" in lower:
+                keys.append("target_price")
+            if not keys:
+                continue
 
-        for line in dcf_lines:
             # Try to extract dollar values
-            import re
-
-            dollar_values = re.findall(r"\$[\d,]+(?:\.\d+)?", line)
+            dollar_values = _DOLLAR_VALUE_RE.findall(line)
             if dollar_values:
                 # Convert to float (remove $ and commas)
                 try:
-                    valuation["dcf_value"] = float(
-                        dollar_values[0].replace("$", "").replace(",", "")
-                    )
-                except ValueError:
-                    pass
-
-        # Look for target price
-        target_lines = [
-            line
-            for line in valuation_text.split("\n")
-            if "target price" in line.lower() or "price target" in line.lower()
-        ]
-
-        for line in target_lines:
-            # Try to extract dollar values
-            import re
-
-            dollar_values = re.findall(r"\$[\d,]+(?:\.\d+)?", line)
-            if dollar_values:
-                # Convert to float (remove $ and commas)
-                try:
-                    valuation["target_price"] = float(
-                        dollar_values[0].replace("$", "").replace(",", "")
-                    )
+                    value = float(dollar_values[0].replace("$", "").replace(",", ""))
                 except ValueError:
-                    pass
+                    continue
+                for key in keys:
+                    valuation[key] = value
 
         return valuation
 
@@ -631,18 +612,12 @@ class AIFinancialModeler:
         Returns:
             List of risk factors
         """
-        risk_factors = []
-
-        # Split by lines and look for list items
-        lines = risk_text.split("\n")
-        for line in lines:
-            line = line.strip()
-            if line and (line.startswith("- ") or line.startswith("* ")):
-                risk_factor = line[2:].strip()
-                if risk_factor:
-                    risk_factors.append({"description": risk_factor})
-
-        return risk_factors
+        # Find every "- " or "* " list item in one scan of the text
+        return [
+            {"description": risk_factor}
+            for risk_factor in map(str.strip, _LIST_ITEM_RE.findall(risk_text))
+            if risk_factor
+        ]
 
     def _validate_model(self, model: Dict[str, Any]) -> Dict[str, Any]:
         """
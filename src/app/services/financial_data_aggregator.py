@@ -34,6 +34,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import pandas as pd
 
 from app.core.config import settings
+from app.core.json_files import dump_json
 from app.models.financial_statements import (
     FilingType,
     FinancialStatement,
@@ -226,8 +227,7 @@ class FinancialDataAggregator:
 
         # 7. Cache the results
         try:
-            with open(cache_file, "w") as f:
-                json.dump(comprehensive_data, f, indent=2, default=str)
+            dump_json(cache_file, comprehensive_data)
             logger.info(f"Cached comprehensive data for {ticker}")
         except Exception as e:
             logger.warning(f"Error caching data: {e}")
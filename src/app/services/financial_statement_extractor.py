@@ -31,6 +31,7 @@ import pandas as pd
 from bs4 import BeautifulSoup
 
 from app.core.config import settings
+from app.core.json_files import dump_json
 from app.models.financial_statements import (
     FilingType,
     FinancialMetric,
@@ -45,6 +46,19 @@ from app.services.sec_fetcher import SECFiling, sec_fetcher
 logger = logging.getLogger(__name__)
 
 
+# Patterns run on every table row and header, compiled once at import
+_YEAR_RE = re.compile(r"\b(20\d\d)\b")
+_QUARTER_RE = re.compile(r"\bQ([1-4])\b", re.IGNORECASE)
+_MONTHS_RE = re.compile(r"(\w+)\s+months")
+_DATE_RE = re.compile(r"(\w+\s+\d+,\s+20\d\d)")
+_DIGIT_RE = re.compile(r"\d")
+_COLUMN_SPLIT_RE = re.compile(r"\s{2,}")
+_TOTAL_PREFIX_RE = re.compile(r"^total\s+")
+_TRAILING_PAREN_RE = re.compile(r"\s+\([^)]*\)$")
+_PARENS_RE = re.compile(r"[\(\)]")
+_NON_NUMERIC_RE = re.compile(r"[^0-9\.\-\(\)]")
+
+
 class FinancialStatementExtractor:
     """
     Extracts structured financial statements from SEC filings.
@@ -180,6 +194,28 @@ class FinancialStatementExtractor:
             ],
         }
 
+        # Everything that can end a statement's section (the other statements'
+        # headers plus generic section headers), combined into one alternation
+        # per statement type so locating the end is a single scan of the text
+        generic_end_markers = [
+            r"notes\s+to\s+(?:consolidated\s+)?financial\s+statements",
+            r"management's\s+discussion\s+and\s+analysis",
+            r"item\s+[0-9]+",
+        ]
+        self._end_marker_res = {
+            statement_type: re.compile(
+                "|".join(
+                    f"(?:{marker.removeprefix('(?i)')})"
+                    for st_type, st_patterns in self.statement_patterns.items()
+                    if st_type != statement_type
+                    for marker in st_patterns
+                )
+                + "".join(f"|(?:{marker})" for marker in generic_end_markers),
+                re.IGNORECASE,
+            )
+            for statement_type in self.statement_patterns
+        }
+
     def extract_financial_statements(
         self, filing: SECFiling
     ) -> Dict[str, FinancialStatement]:
@@ -299,44 +335,25 @@ class FinancialStatementExtractor:
             The extracted section as string, or None if not found
         """
         patterns = self.statement_patterns[statement_type]
+        end_marker_re = self._end_marker_res[statement_type]
 
         for pattern in patterns:
             # First, try to find the section header
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
+            match = re.search(pattern, content, re.IGNORECASE)
+            if match:
                 # Extract a reasonable chunk after the match (adjust size as needed)
                 start_idx = match.start()
+                max_chunk = 50000  # Adjust based on typical statement size
 
-                # Find a potential end marker (next statement or end of document)
-                end_markers = []
-                for st_type in FinancialStatementType:
-                    if st_type != statement_type:
-                        end_markers.extend(self.statement_patterns[st_type])
-
-                # Add some generic section end markers
-                end_markers.extend(
-                    [
-                        r"(?i)notes\s+to\s+(?:consolidated\s+)?financial\s+statements",
-                        r"(?i)management's\s+discussion\s+and\s+analysis",
-                        r"(?i)item\s+[0-9]+",
-                    ]
+                # Find the end of the section: the leftmost end marker (next
+                # statement or a generic section header), or the chunk limit
+                end_match = end_marker_re.search(
+                    content, start_idx, start_idx + max_chunk
                 )
-
-                # Try to find the end of the section
-                end_idx = len(content)
-                for end_pattern in end_markers:
-                    end_match = re.search(
-                        end_pattern, content[start_idx : start_idx + 50000]
-                    )
-                    if end_match:
-                        potential_end = start_idx + end_match.start()
-                        if potential_end < end_idx:
-                            end_idx = potential_end
-
-                # Limit to a reasonable chunk size if no end marker found
-                max_chunk = 50000  # Adjust based on typical statement size
-                if end_idx - start_idx > max_chunk:
-                    end_idx = start_idx + max_chunk
+                if end_match:
+                    end_idx = end_match.start()
+                else:
+                    end_idx = min(len(content), start_idx + max_chunk)
 
                 return content[start_idx:end_idx]
 
@@ -428,10 +445,13 @@ class FinancialStatementExtractor:
         # Identify table header line (contains years)
         header_line = None
         for i, line in enumerate(lines[:20]):  # Check first 20 lines for header
-            if re.search(r"\b20\d\d\b", line) and (
-                "year" in line.lower()
-                or "period" in line.lower()
-                or len(re.findall(r"\b20\d\d\b", line)) >= 2
+            if not _YEAR_RE.search(line):
+                continue
+            lowered = line.lower()
+            if (
+                "year" in lowered
+                or "period" in lowered
+                or len(_YEAR_RE.findall(line)) >= 2
             ):
                 header_line = i
                 break
@@ -452,12 +472,12 @@ class FinancialStatementExtractor:
 
         for line in lines[header_line + 1 :]:
             # Skip lines without numbers (likely headers or notes)
-            if not re.search(r"\d", line):
+            if not _DIGIT_RE.search(line):
                 current_section = line.lower()
                 continue
 
             # Try to identify the metric from this line
-            parts = re.split(r"\s{2,}", line)
+            parts = _COLUMN_SPLIT_RE.split(line)
             if len(parts) < 2:
                 continue
 
@@ -498,9 +518,9 @@ class FinancialStatementExtractor:
         """
         # Remove common prefixes/suffixes and clean the raw name
         clean_name = raw_name.lower().strip()
-        clean_name = re.sub(r"^total\s+", "", clean_name)
-        clean_name = re.sub(r"\s+\([^)]*\)$", "", clean_name)
-        clean_name = re.sub(r"[\(\)]", "", clean_name)
+        clean_name = _TOTAL_PREFIX_RE.sub("", clean_name)
+        clean_name = _TRAILING_PAREN_RE.sub("", clean_name)
+        clean_name = _PARENS_RE.sub("", clean_name)
 
         # Select the appropriate mapping dictionary based on statement type
         if statement_type == FinancialStatementType.INCOME_STATEMENT:
@@ -534,12 +554,12 @@ class FinancialStatementExtractor:
 
         for header in headers[1:]:  # Skip the first header (usually line item name)
             # Look for years in the format "YYYY" or "FY YYYY"
-            year_match = re.search(r"\b(20\d\d)\b", header)
+            year_match = _YEAR_RE.search(header)
             if year_match:
                 year = year_match.group(1)
 
                 # Check if it specifies a quarter
-                quarter_match = re.search(r"\bQ([1-4])\b", header, re.IGNORECASE)
+                quarter_match = _QUARTER_RE.search(header)
                 if quarter_match:
                     quarter = quarter_match.group(1)
                     time_periods.append(f"{year}Q{quarter}")
@@ -547,8 +567,8 @@ class FinancialStatementExtractor:
                     time_periods.append(year)
             elif "months" in header.lower():
                 # Handle periods like "Three Months Ended June 30, 2023"
-                months_match = re.search(r"(\w+)\s+months", header.lower())
-                date_match = re.search(r"(\w+\s+\d+,\s+20\d\d)", header)
+                months_match = _MONTHS_RE.search(header.lower())
+                date_match = _DATE_RE.search(header)
 
                 if months_match and date_match:
                     months_text = months_match.group(1).lower()
@@ -562,7 +582,7 @@ class FinancialStatementExtractor:
                     }
                     period = months_map.get(months_text, "")
 
-                    year_match = re.search(r"20\d\d", date_text)
+                    year_match = _YEAR_RE.search(date_text)
                     if year_match and period:
                         year = year_match.group(0)
                         time_periods.append(f"{year}{period}")
@@ -586,12 +606,12 @@ class FinancialStatementExtractor:
             List of standardized time period strings
         """
         # Look for years in format YYYY
-        years = re.findall(r"\b(20\d\d)\b", header_line)
+        years = _YEAR_RE.findall(header_line)
 
         # If we found years, use them as periods
         if years:
             # Check if there are quarter indicators
-            quarters = re.findall(r"\bQ([1-4])\b", header_line, re.IGNORECASE)
+            quarters = _QUARTER_RE.findall(header_line)
 
             if len(quarters) == len(years):
                 return [f"{year}Q{quarter}" for year, quarter in zip(years, quarters)]
@@ -599,13 +619,13 @@ class FinancialStatementExtractor:
                 return years
 
         # If no years found, try to extract date ranges
-        date_ranges = re.findall(r"(\w+\s+\d+,\s+20\d\d)", header_line)
+        date_ranges = _DATE_RE.findall(header_line)
         if date_ranges:
             return date_ranges
 
         # Last resort: split by multiple spaces and filter for items with numbers
-        parts = re.split(r"\s{2,}", header_line)
-        return [p for p in parts if re.search(r"\d", p)]
+        parts = _COLUMN_SPLIT_RE.split(header_line)
+        return [p for p in parts if _DIGIT_RE.search(p)]
 
     def _parse_numeric_value(self, value_text: str) -> Optional[float]:
         """
@@ -621,7 +641,7 @@ class FinancialStatementExtractor:
             return None
 
         # Remove currency symbols, commas, and other non-numeric characters
-        clean_text = re.sub(r"[^0-9\.\-\(\)]", "", value_text)
+        clean_text = _NON_NUMERIC_RE.sub("", value_text)
 
         # Handle parentheses notation for negative numbers: (123) -> -123
         if clean_text.startswith("(") and clean_text.endswith(")"):
@@ -700,11 +720,9 @@ class FinancialStatementExtractor:
         Returns:
             True if content appears to be HTML, False otherwise
         """
-        return (
-            "<html" in content.lower()
-            or "<table" in content.lower()
-            or "<tr" in content.lower()
-        )
+        # Filings run to megabytes, so lowercase the content once
+        lowered = content.lower()
+        return "<html" in lowered or "<table" in lowered or "<tr" in lowered
 
     def _get_filing_content(self, filing: SECFiling) -> Optional[str]:
         """
@@ -788,8 +806,7 @@ class FinancialStatementExtractor:
                 for statement_type, statement in statements.items()
             }
 
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            dump_json(cache_file, data)
 
             logger.info(f"Saved financial statements to cache: {cache_file}")
         except Exception as e:
@@ -33,6 +33,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import requests
 
 from app.core.config import settings
+from app.core.json_files import dump_json
 
 
 # Set up logging
@@ -176,8 +177,7 @@ class PolygonFinancialsClient:
 
             # Cache the results
             try:
-                with open(cache_file, "w") as f:
-                    json.dump(result_data, f, indent=2)
+                dump_json(cache_file, result_data)
                 logger.info(f"Cached financial data for {ticker}")
             except Exception as e:
                 logger.warning(f"Error caching data: {e}")
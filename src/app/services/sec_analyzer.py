@@ -25,7 +25,6 @@ Financial importance:
 
 import asyncio
 import base64
-import json
 import logging
 import os
 from datetime import datetime
@@ -39,6 +38,8 @@ from openai import AsyncOpenAI
 from tools.sec_preprocessor import extract_text_from_pdf
 
 from app.core.config import settings
+from app.core.json_files import read_json, write_json
+from app.core.openai_client import get_async_openai_client
 from app.models.financial_statements import FilingType
 from app.services.sec_fetcher import SECFiling, sec_fetcher
 
@@ -189,16 +190,18 @@ class SECFilingAnalyzer:
         """
         # Initialize AI model clients
         self.anthropic_client = None
-        self.openai_client = None
-
-        if settings.OPENAI_API_KEY:
-            self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-            logger.info("OpenAI client initialized for SEC filing analysis")
 
         # Create cache directory for storing analysis results
         self.cache_dir = Path("cache/sec_analysis")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def openai_client(self) -> Optional[AsyncOpenAI]:
+        """The OpenAI client of the running event loop, if a key is configured."""
+        if not settings.OPENAI_API_KEY:
+            return None
+        return get_async_openai_client()
+
     async def analyze_filing(
         self, filing: SECFiling
     ) -> Optional[SECFilingAnalysisResult]:
@@ -227,8 +230,7 @@ class SECFilingAnalyzer:
                 f"Using cached analysis for {filing.symbol} {filing.filing_type} from {filing.filing_date}"
             )
             try:
-                with open(cache_path) as f:
-                    analysis_data = json.load(f)
+                analysis_data = await read_json(cache_path)
                 return SECFilingAnalysisResult.from_dict(analysis_data, filing)
             except Exception as e:
                 logger.error(f"Error loading cached analysis: {e}")
@@ -269,8 +271,7 @@ class SECFilingAnalyzer:
 
             # Step 3: Cache the analysis result
             try:
-                with open(cache_path, "w") as f:
-                    json.dump(analysis_result.to_dict(), f, indent=2)
+                await write_json(cache_path, analysis_result.to_dict())
                 logger.info(
                     f"Successfully cached analysis for {filing.symbol} {filing.filing_type}"
                 )
@@ -452,6 +453,8 @@ class SECFilingAnalyzer:
 
         # Parse sections - handle both # headers and ALL CAPS: headers
         for line in analysis_text.split("\n"):
+            # Split off a candidate "HEADER:" prefix once per line
+            header, colon, rest = line.partition(":")
             # Check if this line is a section header with # prefix
             if line.startswith("# "):
                 # If we were already building a section, save it
@@ -464,11 +467,7 @@ class SECFilingAnalyzer:
                 current_section = line.strip()
                 current_content = []
             # Check if this line is a section header (all caps with colon)
-            elif (
-                ":" in line
-                and line.split(":")[0].isupper()
-                and len(line.split(":")[0]) > 3
-            ):
+            elif colon and len(header) > 3 and header.isupper():
                 # If we were already building a section, save it
                 if current_section:
                     sections[current_section.replace("#", "").strip()] = "\n".join(
@@ -476,11 +475,9 @@ class SECFilingAnalyzer:
                     ).strip()
 
                 # Start a new section
-                parts = line.split(":", 1)
-                current_section = parts[0].strip()
-                current_content = (
-                    [parts[1].strip()] if len(parts) > 1 and parts[1].strip() else []
-                )
+                current_section = header.strip()
+                rest = rest.strip()
+                current_content = [rest] if rest else []
             elif current_section:
                 # Continue building the current section
                 current_content.append(line)
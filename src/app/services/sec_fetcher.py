@@ -40,6 +40,7 @@ import aiohttp
 from pydantic import BaseModel, Field
 
 from app.core.config import settings
+from app.core.json_files import dump_json
 from app.models.financial_statements import FilingType
 
 
@@ -130,6 +131,9 @@ class SECFilingFetcher:
         self.metadata_dir = Path("cache/sec_filing_metadata")
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
 
+        # In-flight PDF downloads, keyed by document URL
+        self._pdf_downloads: Dict[str, asyncio.Future] = {}
+
         # Rate limiting semaphores for different API endpoints
         self.query_semaphore = asyncio.Semaphore(PREMIUM_RATE_LIMIT)
         self.search_semaphore = asyncio.Semaphore(PREMIUM_SEARCH_RATE_LIMIT)
@@ -183,6 +187,34 @@ class SECFilingFetcher:
             )
             return cache_path
 
+        # Concurrent requests for the same document share a single download
+        download = self._pdf_downloads.get(filing.document_url)
+        if download is None:
+            download = asyncio.ensure_future(
+                self._download_filing_pdf(filing, cache_path)
+            )
+            self._pdf_downloads[filing.document_url] = download
+            download.add_done_callback(
+                lambda _: self._pdf_downloads.pop(filing.document_url, None)
+            )
+        return await asyncio.shield(download)
+
+    async def _download_filing_pdf(
+        self, filing: SECFiling, cache_path: Path
+    ) -> Optional[Path]:
+        """
+        Download a filing as a PDF and store it in the cache.
+
+        Args:
+            filing: SECFiling object containing metadata about the filing
+            cache_path: Path the PDF is cached at
+
+        Returns:
+            Path to the downloaded PDF file, or None if retrieval failed
+
+        Raises:
+            ValueError: If the filing URL is invalid
+        """
         # Convert SEC.gov URL to a format suitable for the PDF Generator API
         sec_url = self._convert_to_sec_gov_url(filing.document_url)
         if not sec_url:
@@ -210,8 +242,7 @@ class SECFilingFetcher:
 
                 if pdf_data:
                     # Save to cache
-                    with open(cache_path, "wb") as f:
-                        f.write(pdf_data)
+                    await asyncio.to_thread(self._write_pdf, cache_path, pdf_data)
 
                     # Save metadata for future reference
                     self._save_filing_metadata(filing, cache_path)
@@ -351,8 +382,8 @@ class SECFilingFetcher:
         """
         Generate a cache file path for a filing.
 
-        Creates a unique filename based on the filing's metadata to
-        ensure proper caching and retrieval.
+        Creates a unique filename from a hash of the filing's document
+        URL to ensure proper caching and retrieval.
 
         Args:
             filing: SECFiling object containing metadata about the filing
@@ -360,9 +391,10 @@ class SECFilingFetcher:
         Returns:
             Path object for the cache file location
         """
-        # Create a unique filename based on filing metadata
-        filing_date_str = filing.filing_date.strftime("%Y-%m-%d")
-        filename = f"{filing.symbol}_{filing.filing_type}_{filing_date_str}.pdf"
+        # Key the file on the document URL so every lookup of the same
+        # document resolves to the same file
+        key = hashlib.sha256(filing.document_url.encode()).hexdigest()
+        filename = f"{key}.pdf"
 
         # Create a subdirectory for the symbol to organize cache
         symbol_dir = self.cache_dir / filing.symbol
@@ -370,6 +402,22 @@ class SECFilingFetcher:
 
         return symbol_dir / filename
 
+    @staticmethod
+    def _write_pdf(cache_path: Path, pdf_data: bytes) -> None:
+        """
+        Write a PDF to the cache atomically.
+
+        The data is written to a temporary file that then replaces the cache
+        file, so a reader never sees a partially written PDF.
+
+        Args:
+            cache_path: Path of the cache file
+            pdf_data: Binary PDF data
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(pdf_data)
+        os.replace(tmp_path, cache_path)
+
     def _save_filing_metadata(self, filing: SECFiling, pdf_path: Path) -> None:
         """
         Save filing metadata for future reference.
@@ -395,8 +443,7 @@ class SECFilingFetcher:
         metadata_filename = f"{filing.symbol}_{filing.filing_type}_{filing.filing_date.isoformat()}.json"
         metadata_path = self.metadata_dir / metadata_filename
 
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        dump_json(metadata_path, metadata)
 
     async def batch_download_filings(
         self, filings: List[SECFiling]
@@ -25,7 +25,6 @@ Financial importance:
 """
 
 import asyncio
-import json
 import logging
 import os
 from datetime import datetime
@@ -36,6 +35,8 @@ import aiohttp
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.json_files import read_json, write_json
+from app.core.openai_client import get_async_openai_client
 from app.models.financial_statements import FilingType
 from app.services.sec_analyzer import SECFilingAnalysisResult, sec_filing_analyzer
 from app.services.sec_fetcher import SECFiling, sec_fetcher
@@ -167,17 +168,17 @@ class SECTrendsAnalyzer:
         Sets up connections to AI models and creates cache directories
         for storing trends analysis results.
         """
-        # Initialize AI model client
-        self.openai_client = None
-
-        if settings.OPENAI_API_KEY:
-            self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-            logger.info("OpenAI client initialized for SEC trends analysis")
-
         # Create cache directory for storing trends analysis results
         self.cache_dir = Path("cache/sec_trends")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def openai_client(self) -> Optional[AsyncOpenAI]:
+        """The OpenAI client of the running event loop, if a key is configured."""
+        if not settings.OPENAI_API_KEY:
+            return None
+        return get_async_openai_client()
+
     async def analyze_historical_filings(
         self, symbol: str
     ) -> Optional[SECTrendsAnalysisResult]:
@@ -203,8 +204,7 @@ class SECTrendsAnalyzer:
         if cache_path.exists() and settings.ENABLE_CACHE:
             logger.info(f"Using cached trends analysis for {symbol}")
             try:
-                with open(cache_path) as f:
-                    analysis_data = json.load(f)
+                analysis_data = await read_json(cache_path)
 
                 # We need to fetch the filings again to reconstruct the result object
                 historical_filings = await sec_fetcher.get_historical_filings(symbol)
@@ -227,13 +227,22 @@ class SECTrendsAnalyzer:
                 logger.error(f"No historical filings found for {symbol}")
                 return None
 
-            # Step 2: Analyze each filing individually
+            # Step 2: Analyze each filing individually. The filings are
+            # independent, so their downloads and model calls run concurrently
             filing_analyses = {}
             for filing_type, filings in historical_filings.items():
+                results = await asyncio.gather(
+                    *(sec_filing_analyzer.analyze_filing(f) for f in filings),
+                    return_exceptions=True,
+                )
                 filing_analyses[filing_type] = []
-                for filing in filings:
-                    analysis = await sec_filing_analyzer.analyze_filing(filing)
-                    if analysis:
+                for filing, analysis in zip(filings, results):
+                    if isinstance(analysis, Exception):
+                        logger.error(
+                            f"Error analyzing {filing_type} filing "
+                            f"{filing.document_url} for {symbol}: {analysis}"
+                        )
+                    elif analysis:
                         filing_analyses[filing_type].append(analysis)
 
             # Step 3: Perform comparative analysis across all filings
@@ -243,8 +252,7 @@ class SECTrendsAnalyzer:
                 return None
 
             # Step 4: Cache the trends analysis result
-            with open(cache_path, "w") as f:
-                json.dump(trends_analysis.to_dict(), f, indent=2)
+            await write_json(cache_path, trends_analysis.to_dict())
 
             logger.info(f"Successfully analyzed and cached trends for {symbol}")
             return trends_analysis
@@ -74,7 +74,8 @@ Your Goal in Interaction: To be a reliable, precise, and transparent assistant f
     ):
         index_tools = [
             CollectionRouterTool(
-                llm_provider=llm_provider
+                llm_provider=llm_provider,
+                embeddings=embedding_provider,
             ), # Retrieves the relevant collections that would answer the query
             DatabaseSearchTool(
                 llm_provider=llm_provider,
@@ -1,7 +1,8 @@
-import json
 from enum import Enum
-from typing import Any, Dict, List, Type
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Type
 
+import orjson
 from langchain_text_splitters import MarkdownTextSplitter
 from pydantic import BaseModel, ConfigDict
 
@@ -27,23 +28,32 @@ class CollectionSchema(BaseModel):
     name: str
     description: str
     metadata_model: Type[BaseMetadata]
-    indexer: IndexingPipeline
+    indexer_factory: Callable[[], IndexingPipeline]
     indexer_schema: Type[BaseModel]
     traversal: TraversalType
     searcher: DataMiner
 
-    def json_schema(self) -> str:
+    @property
+    def indexer(self) -> IndexingPipeline:
+        # Built on first use so importing the registry does not construct
+        # fetchers, loaders and LLM-backed parsers that may never run.
+        return self.indexer_factory()
+
+    def schema_dict(self) -> Dict[str, Any]:
         base = self.model_dump(
             exclude={
                 "metadata_model",
-                "indexer",
+                "indexer_factory",
                 "indexer_schema",
                 "traversal",
                 "searcher",
             }
         )
         base["metadata_schema"] = self.metadata_model.model_json_schema()
-        return json.dumps(base, indent=2)
+        return base
+
+    def json_schema(self) -> str:
+        return orjson.dumps(self.schema_dict(), option=orjson.OPT_INDENT_2).decode()
 
 
 class MetadataSchemaRegistry(BaseModel):
@@ -60,10 +70,18 @@ class MetadataSchemaRegistry(BaseModel):
         return list(self.registry.values())
 
     def json_schema(self) -> str:
-        collections = []
-        for col in self.all_collections():
-            collections.append(json.loads(col.json_schema()))
-        return json.dumps(collections, indent=2)
+        collections = [col.schema_dict() for col in self.all_collections()]
+        return orjson.dumps(collections, option=orjson.OPT_INDENT_2).decode()
+
+
+@lru_cache(maxsize=1)
+def _get_sec_filings_indexer() -> IndexingPipeline:
+    return IndexingPipeline(
+        fetcher=EDGARFetcher(),
+        loader=WebLoader(crawl_strategy="all", max_crawl_depth=0),
+        parser=SECParser(llm_provider=OpenAIProvider()),
+        splitter=LangChainTextSplitter(splitter=MarkdownTextSplitter),
+    )
 
 
 _schema_registry: MetadataSchemaRegistry | None = None
@@ -78,12 +96,7 @@ def get_schema_registry() -> MetadataSchemaRegistry:
                     name="SECFilings",
                     description="Data chunks from SEC filings like 10-K, 10-Q, 8-K etc.",
                     metadata_model=SECFiling,
-                    indexer=IndexingPipeline(
-                        fetcher=EDGARFetcher(),
-                        loader=WebLoader(crawl_strategy="all", max_crawl_depth=0),
-                        parser=SECParser(llm_provider=OpenAIProvider()),
-                        splitter=LangChainTextSplitter(splitter=MarkdownTextSplitter),
-                    ),
+                    indexer_factory=_get_sec_filings_indexer,
                     indexer_schema=FilingRequest,
                     traversal=TraversalType.MEM_WALK,
                     searcher=SECSearch(),
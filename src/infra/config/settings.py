@@ -46,6 +46,14 @@ class Settings(BaseSettings):
     DB_ENGINE_URL: str = Field(..., alias="DB_ENGINE_URL")
     WEAVIATE_HTTP_URL: str = Field(..., alias="WEAVIATE_HTTP_URL")
     WEAVIATE_GRPC_URL: str = Field(..., alias="WEAVIATE_GRPC_URL")
+    # Weaviate ingestion - objects per gRPC insert_many request, requests in
+    # flight at once, and retries for objects that fail to insert
+    WEAVIATE_BATCH_SIZE: int = Field(200, alias="WEAVIATE_BATCH_SIZE")
+    WEAVIATE_NUM_WORKERS: int = Field(2, alias="WEAVIATE_NUM_WORKERS")
+    WEAVIATE_INSERT_RETRIES: int = Field(2, alias="WEAVIATE_INSERT_RETRIES")
+    # Vector store used by the agents - "weaviate", "chroma" or "faiss" (the
+    # latter needs the faiss extra)
+    VECTOR_STORE_BACKEND: str = Field("weaviate", alias="VECTOR_STORE_BACKEND")
 
     SEC_API_CACHE_EXPIRATION: int = Field(
         60 * 60 * 24, alias="SEC_API_CACHE_EXPIRATION"
@@ -0,0 +1,128 @@
+"""
+Batched Embeddings
+------------------
+
+This module provides an Embeddings wrapper that splits large document lists
+into fixed-size sub-batches and dispatches them concurrently, so indexing N
+chunks costs roughly ceil(N / batch_size) round trips instead of running every
+batch back to back. Repeated texts, such as boilerplate shared by filings in
+the same run, are embedded only once.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class BatchedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that embeds documents in concurrent sub-batches.
+
+    Results are reassembled in input order, so the wrapper is a drop-in
+    replacement for the wrapped embedding model.
+    """
+
+    @staticmethod
+    def _expand(
+        texts: List[str], unique: List[str], vectors: List[List[float]]
+    ) -> List[List[float]]:
+        """Map the embeddings of the unique texts back onto every input text."""
+        if len(unique) == len(texts):
+            return vectors
+        by_text = dict(zip(unique, vectors))
+        return [list(by_text[text]) for text in texts]
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        batch_size: int = 256,
+        max_concurrency: int = 8,
+    ):
+        """
+        Initialize the batched embeddings wrapper.
+
+        Args:
+            embeddings: The underlying LangChain Embeddings object
+            batch_size: Maximum number of texts sent in a single request
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        return [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a list of documents using concurrent sub-batches, embedding
+        repeated texts once.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            List of embeddings, one per input text, in input order
+        """
+        unique = list(dict.fromkeys(texts))
+        batches = self._batches(unique)
+        if len(batches) <= 1:
+            vectors = self.embeddings.embed_documents(unique)
+        else:
+            logger.debug(f"Embedding {len(unique)} texts in {len(batches)} batches")
+            workers = min(self.max_concurrency, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(self.embeddings.embed_documents, batches)
+                vectors = [vector for batch in results for vector in batch]
+        return self._expand(texts, unique, vectors)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously embed a list of documents using concurrent sub-batches,
+        embedding repeated texts once.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            List of embeddings, one per input text, in input order
+        """
+        unique = list(dict.fromkeys(texts))
+        batches = self._batches(unique)
+        if len(batches) <= 1:
+            vectors = await self.embeddings.aembed_documents(unique)
+            return self._expand(texts, unique, vectors)
+
+        logger.debug(f"Embedding {len(unique)} texts in {len(batches)} batches")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(batch)
+
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        vectors = [vector for batch in results for vector in batch]
+        return self._expand(texts, unique, vectors)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query text using the wrapped model."""
+        return self.embeddings.embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Asynchronously embed a single query text using the wrapped model."""
+        return await self.embeddings.aembed_query(text)
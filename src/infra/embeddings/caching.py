@@ -0,0 +1,93 @@
+"""
+Query-Cached Embeddings
+-----------------------
+
+This module provides an Embeddings wrapper that memoizes query embeddings, so
+agents retrying the same search skip the embedding round trip entirely.
+Document embeddings are passed straight through to the wrapped model.
+"""
+
+import logging
+import threading
+from typing import List, Tuple
+
+from cachetools import LRUCache
+from langchain_core.embeddings import Embeddings
+
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class QueryCachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper with an LRU cache of query embeddings.
+
+    Cached vectors are stored as tuples and returned as fresh lists, so a
+    caller mutating its result cannot corrupt the cache.
+    """
+
+    def __init__(self, embeddings: Embeddings, maxsize: int = 2048):
+        """
+        Initialize the query-cached embeddings wrapper.
+
+        Args:
+            embeddings: The underlying LangChain Embeddings object
+            maxsize: Maximum number of query embeddings kept in the cache
+        """
+        self.embeddings = embeddings
+        self._cache: LRUCache = LRUCache(maxsize=maxsize)
+        # LRUCache reorders entries on reads, so every access takes the lock
+        self._lock = threading.Lock()
+
+    def _get(self, text: str):
+        with self._lock:
+            return self._cache.get(text)
+
+    def _put(self, text: str, vector: List[float]) -> Tuple[float, ...]:
+        cached = tuple(vector)
+        with self._lock:
+            self._cache[text] = cached
+        return cached
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents using the wrapped model."""
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously embed documents using the wrapped model."""
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a query, reusing the cached vector for repeated text.
+
+        Args:
+            text: The query text
+
+        Returns:
+            The query embedding
+        """
+        cached = self._get(text)
+        if cached is None:
+            cached = self._put(text, self.embeddings.embed_query(text))
+        else:
+            logger.debug("Reusing cached query embedding")
+        return list(cached)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """
+        Asynchronously embed a query, reusing the cached vector for repeated text.
+
+        Args:
+            text: The query text
+
+        Returns:
+            The query embedding
+        """
+        cached = self._get(text)
+        if cached is None:
+            cached = self._put(text, await self.embeddings.aembed_query(text))
+        else:
+            logger.debug("Reusing cached query embedding")
+        return list(cached)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import ClassVar
 
 from langchain_core.embeddings import Embeddings
 
@@ -7,6 +8,12 @@ from langchain_core.embeddings import Embeddings
 class IEmbeddingProvider(ABC):
     """Interface for providing text embedding models."""
 
+    # Sub-batch size and number of sub-batches in flight when bulk-embedding
+    # documents for indexing. Remote APIs gain from concurrent requests; local
+    # models that parallelize internally should override these.
+    INDEXING_BATCH_SIZE: ClassVar[int] = 256
+    INDEXING_MAX_CONCURRENCY: ClassVar[int] = 8
+
     @abstractmethod
     def get_embedding_model(self) -> Embeddings:
         """
@@ -25,3 +32,8 @@ class IEmbeddingProvider(ABC):
 class OpenAIEmbeddingModels(str, Enum):
     SMALL3 = "text-embedding-3-small"
     LARGE3 = "text-embedding-3-large"
+
+
+class FastEmbedModels(str, Enum):
+    BGE_SMALL_EN = "BAAI/bge-small-en-v1.5"
+    BGE_BASE_EN = "BAAI/bge-base-en-v1.5"
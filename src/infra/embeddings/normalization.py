@@ -0,0 +1,61 @@
+"""
+Normalized Embeddings
+---------------------
+
+This module provides an Embeddings wrapper that L2 normalizes every document
+and query vector, so vector stores can rank by a plain inner product instead
+of computing cosine similarity (and its norms) for each comparison.
+"""
+
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+def normalize(vectors: List[List[float]]) -> List[List[float]]:
+    """
+    L2 normalize a list of vectors, leaving zero vectors unchanged.
+
+    Args:
+        vectors: The vectors to normalize
+
+    Returns:
+        The unit-length vectors, in input order
+    """
+    if not vectors:
+        return []
+    array = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(array, axis=-1, keepdims=True)
+    return (array / np.where(norms > 0, norms, 1.0)).tolist()
+
+
+class NormalizedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that returns unit-length vectors.
+    """
+
+    def __init__(self, embeddings: Embeddings):
+        """
+        Initialize the normalized embeddings wrapper.
+
+        Args:
+            embeddings: The underlying LangChain Embeddings object
+        """
+        self.embeddings = embeddings
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents using the wrapped model and normalize them."""
+        return normalize(self.embeddings.embed_documents(texts))
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously embed documents and normalize them."""
+        return normalize(await self.embeddings.aembed_documents(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query using the wrapped model and normalize it."""
+        return normalize([self.embeddings.embed_query(text)])[0]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Asynchronously embed a query and normalize it."""
+        return normalize([await self.embeddings.aembed_query(text)])[0]
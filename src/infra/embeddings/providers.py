@@ -1,8 +1,17 @@
+import os
+from typing import Optional
+
+from langchain_community.embeddings import FastEmbedEmbeddings
 from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 
 from infra.config.settings import get_settings
-from infra.embeddings.models import IEmbeddingProvider, OpenAIEmbeddingModels
+from infra.embeddings.models import (
+    FastEmbedModels,
+    IEmbeddingProvider,
+    OpenAIEmbeddingModels,
+)
+from infra.http_client import get_async_client
 
 
 class OpenAIEmbeddingProvider(IEmbeddingProvider):
@@ -13,7 +22,43 @@ class OpenAIEmbeddingProvider(IEmbeddingProvider):
             raise ValueError(
                 "OpenAI API Key not provided or found in environment variables."
             )
-        self._embedding_model = OpenAIEmbeddings(model=self.model, api_key=self.api_key)
+        self._embedding_model = OpenAIEmbeddings(
+            model=self.model,
+            api_key=self.api_key,
+            http_async_client=get_async_client(),
+        )
+
+    def get_embedding_model(self) -> Embeddings:
+        return self._embedding_model
+
+
+class FastEmbedProvider(IEmbeddingProvider):
+    """
+    Local CPU embeddings served by FastEmbed's quantized ONNX Runtime models.
+
+    Avoids a network round trip per batch and runs int8 kernels on CPU, so it
+    suits self-hosted indexing and query serving.
+    """
+
+    # FastEmbed already spreads each call across its worker pool in
+    # batch_size slices, so indexing hands it large chunks one at a time
+    # rather than running several calls (and worker pools) side by side
+    INDEXING_BATCH_SIZE = 4096
+    INDEXING_MAX_CONCURRENCY = 1
+
+    def __init__(
+        self,
+        model: str = FastEmbedModels.BGE_SMALL_EN,
+        batch_size: int = 64,
+        parallel: Optional[int] = None,
+    ):
+        self.model = model
+        self._embedding_model = FastEmbedEmbeddings(
+            model_name=self.model,
+            batch_size=batch_size,
+            parallel=parallel if parallel is not None else os.cpu_count(),
+            providers=["CPUExecutionProvider"],
+        )
 
     def get_embedding_model(self) -> Embeddings:
         return self._embedding_model
@@ -0,0 +1,81 @@
+"""
+Shared HTTP Client
+------------------
+
+This module provides a process-wide httpx.AsyncClient shared by the HTTP-based
+providers (OpenAI chat and embedding models), so every request reuses pooled
+keep-alive connections instead of paying a fresh TCP and TLS handshake.
+
+Connection pools are bound to the event loop that opened them, and tools run
+on more than one loop (the sync runner's background loop, repeated
+asyncio.run calls in scripts). The client therefore keeps one pool per running
+loop rather than one per process.
+"""
+
+import asyncio
+import functools
+import logging
+import weakref
+
+import httpx
+
+
+try:
+    # HTTP/2 multiplexes concurrent requests over one connection, but needs h2
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - h2 is an optional httpx extra
+    _HTTP2 = False
+
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """Transport that sends each request through its event loop's own pool."""
+
+    def __init__(self) -> None:
+        self._transports: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                http2=_HTTP2,
+            )
+            self._transports[loop] = transport
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide async HTTP client, creating it on first use.
+
+    The client can be used from any event loop; connections are pooled per
+    loop.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    logger.info(f"Creating shared async HTTP client (http2={_HTTP2})")
+    return httpx.AsyncClient(transport=_LoopLocalTransport())
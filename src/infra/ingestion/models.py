@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 
 from langchain_core.documents import Document
 
@@ -26,3 +26,18 @@ class IDocumentLoader(ABC):
             List[Document]: List of loaded documents.
         """
         pass
+
+    async def stream(self, sources: List[AcquisitionOutput]) -> AsyncIterator[Document]:
+        """
+        Stream documents from the given sources as they are loaded. Loaders
+        that can produce documents incrementally should override this so
+        consumers can start processing before the whole batch is loaded.
+
+        Args:
+            sources (List[AcquisitionOutput]): List of sources to load documents from.
+
+        Yields:
+            Document: Each loaded document.
+        """
+        for doc in await self.load(sources):
+            yield doc
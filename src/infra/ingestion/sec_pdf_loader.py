@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Union
 
@@ -23,6 +24,10 @@ class EDGARPDFLoader(IDocumentLoader):
     and returns the raw PDF data
     """
 
+    # Maximum number of concurrent connections to the sec-api.io PDF
+    # generator per load() batch. This bounds concurrency, not request rate.
+    _MAX_CONNECTIONS = 10
+
     def __init__(self, api_key: str):
         """
         Initializes the EDGARPDFLoader with the specified API key.
@@ -32,7 +37,6 @@ class EDGARPDFLoader(IDocumentLoader):
             raise ValueError("SEC API key is not set")
 
         self.pdf_generator_url = "https://api.sec-api.io/filing-reader"
-        self.session = None
         self._cache = Cache(
             engine=get_sqlalchemy_engine(),
             table_name=TableNames.PDFLoder.value,
@@ -40,59 +44,132 @@ class EDGARPDFLoader(IDocumentLoader):
         )
 
     async def load(self, sources: List[AcquisitionOutput]) -> List[Document]:
-        documents = []
-        for source in sources:
-            documents.extend(await self._process_pdf_filings(source))
-        return documents
+        # Share one connection-limited session across the whole batch so the
+        # downloads reuse TCP/TLS connections and respect a global cap. The
+        # session and in-flight downloads stay local to this call so that
+        # concurrent load() calls on the same loader don't share them.
+        connector = aiohttp.TCPConnector(limit=self._MAX_CONNECTIONS)
+        downloads: Dict[str, asyncio.Task] = {}
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *(
+                    self._process_pdf_filings(source, session, downloads)
+                    for source in sources
+                )
+            )
+        return [doc for docs in results for doc in docs]
 
-    async def _process_pdf_filings(self, src: AcquisitionOutput) -> List[Document]:
+    async def _process_pdf_filings(
+        self,
+        src: AcquisitionOutput,
+        session: aiohttp.ClientSession,
+        downloads: Dict[str, asyncio.Task],
+    ) -> List[Document]:
         """
         Process filings to download PDF versions.
 
+        The filing's URIs (e.g. the main document and its exhibits) are
+        downloaded concurrently; the shared session still caps connections.
+
         Args:
             filings: List of SECFiling objects
+            session: The batch's shared HTTP session
+            downloads: In-flight downloads of the batch, keyed by SEC URL
 
         Returns:
             List of SECFiling objects with PDF content and local file paths
         """
-        logger.info(f"Processing {len(src.get_uris())} filings for PDF download")
-        docs = []
+        logger.info("Processing %d filings for PDF download", len(src.get_uris()))
         metadata = src.get_metadata()
-        for uri in src.get_uris():
-            metadata.source = uri
-            request_hash = self._cache.generate_id(uri)
-            cache_entry = self._cache.get(request_hash)
-            pdf_data: bytes = cache_entry.get("pdf_content") if cache_entry else None
-            if pdf_data:
-                docs.append(
-                    Document(page_content=pdf_data, metadata=metadata.model_dump())
-                )
-                continue
-
-            if not isinstance(metadata, SECFiling):
-                raise ValueError(
-                    f"Invalid metadata type: {type(metadata)}. Expected SECFiling."
-                )
-            metadata._convert_to_sec_gov_url(uri)
-            sec_url = metadata._convert_to_sec_gov_url(uri)
-            if not sec_url:
-                logger.warning(f"Invalid document URL format: {uri}")
-                continue
-
-            logger.info(
-                f"Downloading {metadata.formType} filing for {metadata.ticker} from {metadata.filing_date} as PDF"
+        docs = await asyncio.gather(
+            *(
+                self._process_pdf_uri(metadata, uri, session, downloads)
+                for uri in src.get_uris()
             )
-            # Download the filing as PDF
-            pdf_data = await self._download_filing_as_pdf(sec_url)
-            docs.append(Document(page_content=pdf_data, metadata=metadata.model_dump()))
-            logger.info(
-                f"Successfully downloaded and cached PDF for {metadata.ticker} {metadata.formType}"
+        )
+        return [doc for doc in docs if doc is not None]
+
+    async def _process_pdf_uri(
+        self,
+        metadata,
+        uri: str,
+        session: aiohttp.ClientSession,
+        downloads: Dict[str, asyncio.Task],
+    ) -> Optional[Document]:
+        """
+        Load one filing URI as a PDF document, from the cache if possible.
+
+        Args:
+            metadata: The filing's metadata, copied per URI since URIs are
+                processed concurrently
+            uri: The URI of the document to load
+            session: The batch's shared HTTP session
+            downloads: In-flight downloads of the batch, keyed by SEC URL
+
+        Returns:
+            The PDF document, or None if the URI cannot be converted
+        """
+        metadata = metadata.model_copy()
+        metadata.source = uri
+        request_hash = self._cache.generate_id(uri)
+        cache_entry = self._cache.get(request_hash)
+        pdf_data: bytes = cache_entry.get("pdf_content") if cache_entry else None
+        if pdf_data:
+            return Document(page_content=pdf_data, metadata=metadata.model_dump())
+
+        if not isinstance(metadata, SECFiling):
+            raise ValueError(
+                f"Invalid metadata type: {type(metadata)}. Expected SECFiling."
             )
-            self._cache.write(
-                request_hash,
-                pdf_content=pdf_data,
+        sec_url = metadata._convert_to_sec_gov_url(uri)
+        if not sec_url:
+            logger.warning(f"Invalid document URL format: {uri}")
+            return None
+
+        logger.info(
+            "Downloading %s filing for %s from %s as PDF",
+            metadata.formType,
+            metadata.ticker,
+            metadata.filing_date,
+        )
+        # Download the filing as PDF
+        pdf_data = await self._download_once(sec_url, session, downloads)
+        logger.info(
+            "Successfully downloaded and cached PDF for %s %s",
+            metadata.ticker,
+            metadata.formType,
+        )
+        self._cache.write(
+            request_hash,
+            pdf_content=pdf_data,
+        )
+        return Document(page_content=pdf_data, metadata=metadata.model_dump())
+
+    async def _download_once(
+        self,
+        sec_url: str,
+        session: aiohttp.ClientSession,
+        downloads: Dict[str, asyncio.Task],
+    ) -> Optional[bytes]:
+        """
+        Download a filing, sharing the result with concurrent requests for
+        the same URL in the current batch instead of fetching it again.
+
+        Args:
+            sec_url: The SEC.gov URL of the filing to download
+            session: The batch's shared HTTP session
+            downloads: In-flight downloads of the batch, keyed by SEC URL
+
+        Returns:
+            Binary PDF data if successful, None otherwise
+        """
+        task = downloads.get(sec_url)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._download_filing_as_pdf(sec_url, session=session)
             )
-        return docs
+            downloads[sec_url] = task
+        return await asyncio.shield(task)
 
     async def _make_http_request(
         self,
@@ -101,6 +178,7 @@ class EDGARPDFLoader(IDocumentLoader):
         timeout: int = 30,
         binary: bool = False,
         max_retries: int = 3,
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> Optional[Union[str, bytes]]:
         """
         Make an HTTP request with retry logic.
@@ -111,6 +189,7 @@ class EDGARPDFLoader(IDocumentLoader):
             timeout: Request timeout in seconds
             binary: Whether to return binary data or text
             max_retries: Maximum number of retry attempts
+            session: Session to reuse; a one-off session is opened if None
 
         Returns:
             Response content as string or bytes, or None if failed
@@ -119,22 +198,10 @@ class EDGARPDFLoader(IDocumentLoader):
 
         # for attempt in range(max_retries):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=timeout) as response:
-                    if response.status == 200:
-                        return await response.read()
-                    elif response.status == 429:  # Too Many Requests
-                        logger.warning(
-                            f"Rate limit hit, retrying in {retry_delay} seconds"
-                        )
-                        # await asyncio.sleep(retry_delay)
-                        # retry_delay *= 2  # Exponential backoff
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            f"API error: {url}, {response.status}, {error_text}"
-                        )
-                        return None
+            if session is not None:
+                return await self._get(session, url, params, timeout, retry_delay)
+            async with aiohttp.ClientSession() as one_off:
+                return await self._get(one_off, url, params, timeout, retry_delay)
         except Exception as e:
             logger.error(f"Error during HTTP request: {e}")
             # await asyncio.sleep(retry_delay)
@@ -143,12 +210,36 @@ class EDGARPDFLoader(IDocumentLoader):
         logger.error(f"Failed to complete HTTP request after {max_retries} attempts")
         return None
 
-    async def _download_filing_as_pdf(self, sec_url: str) -> Optional[bytes]:
+    async def _get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: int,
+        retry_delay: int,
+    ) -> Optional[bytes]:
+        """Issue a GET request on the given session and read the response."""
+        async with session.get(url, params=params, timeout=timeout) as response:
+            if response.status == 200:
+                return await response.read()
+            elif response.status == 429:  # Too Many Requests
+                logger.warning(f"Rate limit hit, retrying in {retry_delay} seconds")
+                # await asyncio.sleep(retry_delay)
+                # retry_delay *= 2  # Exponential backoff
+            else:
+                error_text = await response.text()
+                logger.error(f"API error: {url}, {response.status}, {error_text}")
+            return None
+
+    async def _download_filing_as_pdf(
+        self, sec_url: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> Optional[bytes]:
         """
         Download a SEC filing as a PDF using the PDF Generator API.
 
         Args:
             sec_url: The SEC.gov URL of the filing to download
+            session: Session to reuse; a one-off session is opened if None
 
         Returns:
             Binary PDF data if successful, None otherwise
@@ -164,4 +255,5 @@ class EDGARPDFLoader(IDocumentLoader):
             params=params,
             timeout=60,  # Longer timeout for PDF generation
             binary=True,
+            session=session,
         )
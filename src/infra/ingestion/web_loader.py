@@ -1,7 +1,8 @@
+import asyncio
 import logging
 import pickle
 from enum import Enum
-from typing import Callable, List
+from typing import AsyncIterator, Awaitable, Callable, List
 
 from crawlee import ConcurrencySettings
 from crawlee.crawlers import (
@@ -65,30 +66,48 @@ class WebLoader(IDocumentLoader):
             column_mapping=TABLE_SCHEMAS[TableNames.WebLoader],
         )
 
+    # Maximum number of crawled pages buffered before the crawler waits for
+    # the consumer of stream() to catch up
+    _STREAM_QUEUE_SIZE = 16
+
     async def load(self, sources: List[AcquisitionOutput]) -> List[Document]:
         """
         Loads the HTML document from the specified sources and returns a list of
         Document objects.
         """
-        documents = []
+        return [doc async for doc in self.stream(sources)]
 
-        def process_urls(src: AcquisitionOutput) -> Callable[[str, str], None]:
-            """
-            Processes the URLs and returns a function to handle the page content.
-            """
+    async def stream(self, sources: List[AcquisitionOutput]) -> AsyncIterator[Document]:
+        """
+        Crawls the specified sources and yields a Document for each page as soon
+        as it has been scraped, instead of waiting for the whole crawl to finish.
+        """
+        for source in sources:
+            pages: asyncio.Queue = asyncio.Queue(maxsize=self._STREAM_QUEUE_SIZE)
 
-            def handle_page(url: str, content: str) -> None:
+            async def handle_page(
+                url: str, content: str, src: AcquisitionOutput = source
+            ) -> None:
                 # Process the page content here
                 metadata = src.get_metadata()
                 # metadata.source = url
-                documents.append(Document(page_content=content, metadata=metadata))
-
-            return handle_page
-
-        for source in sources:
-            await self._crawl_url(source.get_uris(), self._config, process_urls(source))
-
-        return documents
+                await pages.put(Document(page_content=content, metadata=metadata))
+
+            async def crawl(src: AcquisitionOutput = source) -> None:
+                try:
+                    await self._crawl_url(src.get_uris(), self._config, handle_page)
+                finally:
+                    # Sentinel so the consumer stops, even if crawling failed
+                    await pages.put(None)
+
+            crawler = asyncio.create_task(crawl())
+            try:
+                while (doc := await pages.get()) is not None:
+                    yield doc
+                # Surface any error raised while crawling
+                await crawler
+            finally:
+                crawler.cancel()
 
     def _cache_hook(self):
         async def _prenav_cache_hook(context: PlaywrightPreNavCrawlingContext) -> None:
@@ -99,7 +118,7 @@ class WebLoader(IDocumentLoader):
 
                 # Create a route handler function that will intercept the request
                 async def route_handler(route, request):
-                    logger.debug(f"Intercepting {url} and returning cached response")
+                    logger.debug("Intercepting %s and returning cached response", url)
                     await route.fulfill(
                         status=cache_entry["status_code"],
                         headers=pickle.loads(cache_entry["headers"]),
@@ -116,7 +135,7 @@ class WebLoader(IDocumentLoader):
         self,
         urls: List[str],
         config: CrawlConfig,
-        handlePage: Callable[[str, str], None],
+        handlePage: Callable[[str, str], Awaitable[None]],
     ) -> None:
         """
         Crawls the URL and calls the handlePage function with the URL and content.
@@ -134,7 +153,7 @@ class WebLoader(IDocumentLoader):
 
         @crawler.router.default_handler
         async def request_handler(context: PlaywrightCrawlingContext) -> None:
-            logging.debug(f"Processing {context.request.url}...")
+            logger.debug("Processing %s...", context.request.url)
             await context.page.wait_for_load_state("networkidle")
             await context.enqueue_links(
                 base_url=context.request.loaded_url,
@@ -144,7 +163,7 @@ class WebLoader(IDocumentLoader):
             content = await context.page.content()
 
             # Call the handler
-            handlePage(url, content)
+            await handlePage(url, content)
 
             if not context.request.user_data.get("cached", False):
                 self._cache.write(
@@ -156,4 +175,4 @@ class WebLoader(IDocumentLoader):
                 )
 
         await crawler.run(urls)
-        logging.debug(f"Finished crawling {urls}.")
+        logger.debug("Finished crawling %s.", urls)
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import weakref
 from typing import Any
 
 import tiktoken
@@ -6,12 +8,36 @@ from langchain_core.language_models import BaseLanguageModel
 from langchain_openai import ChatOpenAI
 
 from infra.config.settings import get_settings
+from infra.http_client import get_async_client
 from infra.llm.models import ILLMProvider, OpenAIModels, RateLimitType
 
 
 logger = logging.getLogger(__name__)
 
 
+# Cap on requests in flight per event loop. Fan-outs such as MemWalker's
+# child exploration queue here instead of bursting past the provider's limits
+# and stalling every call in 429 retries
+MAX_CONCURRENT_REQUESTS = 32
+
+_request_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _request_semaphore() -> asyncio.Semaphore:
+    """
+    Return the request semaphore of the running event loop.
+
+    Semaphores are bound to the loop they first wait on, so each loop gets
+    its own rather than sharing one module-level instance.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _request_semaphores[loop] = semaphore
+    return semaphore
+
+
 class OpenAIProvider(ChatOpenAI, ILLMProvider):
     def __init__(
         self,
@@ -30,6 +56,8 @@ class OpenAIProvider(ChatOpenAI, ILLMProvider):
             "model": model.value,
             "temperature": temperature,
             "max_completion_tokens": max_tokens,
+            # Pool connections across every provider in the process
+            "http_async_client": get_async_client(),
             **kwargs,
         }
         super().__init__(api_key=self._api_key, **model_kwargs)
@@ -59,4 +87,15 @@ class OpenAIProvider(ChatOpenAI, ILLMProvider):
                     (RateLimitType.TOKEN_LIMIT.value, estimated_tokens),
                 ]
             )
-        return await super().ainvoke(*args, **kwargs)
+        async with _request_semaphore():
+            response = await super().ainvoke(*args, **kwargs)
+
+        # OpenAI caches prompt prefixes of 1024+ tokens automatically; the
+        # static system prompts are kept first so repeated calls hit it
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            cached_tokens = usage.get("input_token_details", {}).get("cache_read", 0)
+            logger.debug(
+                f"Prompt tokens: {usage['input_tokens']} ({cached_tokens} cached)"
+            )
+        return response
@@ -1,8 +1,9 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
+from cachetools import TTLCache
 from sqlalchemy.sql import ColumnExpressionArgument
 
 from infra.acquisition.sec_fetcher import SECFiling
@@ -29,14 +30,33 @@ class DataMiner(ABC):
 
 
 class SECSearch(DataMiner):
+    _EXISTS_CACHE_SIZE: ClassVar[int] = 512
+    _EXISTS_CACHE_TTL: ClassVar[int] = 60  # seconds
+
     def __init__(self):
-        pass
+        self._hierarchy: Optional[Cache] = None  # Lazy loading
+        # Every search checks for indexed data first; remember filters that
+        # were fully indexed so closely spaced searches skip the database
+        self._exists_cache: TTLCache = TTLCache(
+            maxsize=self._EXISTS_CACHE_SIZE, ttl=self._EXISTS_CACHE_TTL
+        )
+
+    def _hierarchy_table(self) -> Cache:
+        if self._hierarchy is None:
+            self._hierarchy = Cache(
+                get_sqlalchemy_engine(),
+                TableNames.SECFilingHierarchy.value,
+            )
+        return self._hierarchy
 
     def data_exists(self, filters) -> Tuple[bool, str, str]:
-        hierarchy_table = Cache(
-            get_sqlalchemy_engine(),
-            TableNames.SECFilingHierarchy.value,
-        )
+        cache_key = Cache.generate_id(filters)
+        result = self._exists_cache.get(cache_key)
+        if result is not None:
+            logger.debug("Reusing cached data availability for filters")
+            return result
+
+        hierarchy_table = self._hierarchy_table()
         db_filters = self._db_filters_from_metadata(hierarchy_table, filters)
         with hierarchy_table.query_builder() as q:
             nodes = q.filter(*db_filters).all()
@@ -50,14 +70,15 @@ class SECSearch(DataMiner):
                     exists = False
             if not exists:
                 return exists, "INDEXING_IN_PROGRESS", "The data relevant to the query is currently being indexed and is not yet available. Please try again later."
-            return exists, "SUCCESS", "The data relevant to the query is found"
+            result = (exists, "SUCCESS", "The data relevant to the query is found")
+            # Only found data is cached, so data that is missing or still
+            # being indexed is picked up as soon as indexing completes
+            self._exists_cache[cache_key] = result
+            return result
 
     def nodes_for_mem_walk(self, filters) -> List[MemoryTreeNode]:
         # Convert filters to query the database
-        hierarchy_table = Cache(
-            get_sqlalchemy_engine(),
-            TableNames.SECFilingHierarchy.value,
-        )
+        hierarchy_table = self._hierarchy_table()
         db_filters = self._db_filters_from_metadata(hierarchy_table, filters)
         db_filters.append(getattr(hierarchy_table.get_model(), "status") == "complete")
         with hierarchy_table.query_builder() as q:
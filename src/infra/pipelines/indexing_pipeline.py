@@ -7,10 +7,15 @@ handles the process of fetching, loading, parsing, chunking and storing
 documents in a vector database.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 
 from infra.acquisition.models import IDataFetcher
+from infra.embeddings.batching import BatchedEmbeddings
 from infra.embeddings.models import IEmbeddingProvider
 from infra.ingestion.models import IDocumentLoader
 from infra.preprocessing.models import IParser, ISplitter
@@ -27,6 +32,14 @@ class IndexingPipeline:
     Handles the complete workflow from data acquisition to vector store embedding.
     """
 
+    # Maximum number of loaded documents buffered between the loader and the
+    # parser. Bounds peak memory to the queue depth instead of the full corpus.
+    _LOAD_QUEUE_SIZE = 16
+    # Maximum number of documents parsed concurrently. Parsing SEC filings is
+    # dominated by network-bound LLM summary calls, so documents are parsed
+    # side by side instead of one after another.
+    _PARSE_CONCURRENCY = 10
+
     def __init__(
         self,
         fetcher: IDataFetcher,
@@ -54,6 +67,7 @@ class IndexingPipeline:
         self.splitter = splitter
         self.embedding_provider = embedding_provider
         self.vector_store = vector_store
+        self._batched_embeddings: Optional[BatchedEmbeddings] = None
 
     async def run(self, **kwargs):
         """
@@ -75,21 +89,21 @@ class IndexingPipeline:
             filings = await self.fetcher.fetch(**kwargs)
             logger.info(f"Found {len(filings)} filings")
 
-            # Step 2: Load documents
-            docs = await self.loader.load(filings)
-            logger.info(f"Loaded {len(docs)} documents")
-
-            # Step 3: Parse documents
-            parsed_docs = await self.parser.parse(docs)
+            # Step 2 & 3: Load and parse documents
+            parsed_docs = await self._load_and_parse(filings)
             logger.info(f"Parsed into {len(parsed_docs)} documents")
 
             # Step 4: Split documents
             split_docs = await self.splitter.split_documents(parsed_docs)
             logger.info(f"Split into {len(split_docs)} chunks")
 
-            # Step 5: Embed and index documents
-            embedding_model = self.embedding_provider.get_embedding_model()
-            self.vector_store.add_documents(split_docs, embedding_model)
+            # Step 5: Embed and index documents. The vector stores embed and
+            # write synchronously, so run them off the event loop to keep
+            # concurrent tool calls (e.g. searches) responsive meanwhile
+            embedding_model = self._get_embedding_model()
+            await asyncio.to_thread(
+                self.vector_store.add_documents, split_docs, embedding_model
+            )
             logger.info(f"Indexed {len(split_docs)} document chunks")
 
             return f"Successfully indexed {len(split_docs)} document chunks into the '{self.vector_store.collection_name}' collection. You may now search the collection for relevant documents."
@@ -97,3 +111,76 @@ class IndexingPipeline:
         except Exception as e:
             logger.error(f"Error in indexing pipeline: {e}")
             raise
+
+    def _get_embedding_model(self) -> Embeddings:
+        """
+        Return the provider's embedding model wrapped for batched indexing,
+        sized by the provider's indexing batch settings.
+
+        The wrapper is reused across runs so vector stores that compare
+        embedding functions do not reinitialize on every run.
+        """
+        embedding_model = self.embedding_provider.get_embedding_model()
+        if (
+            self._batched_embeddings is None
+            or self._batched_embeddings.embeddings is not embedding_model
+        ):
+            self._batched_embeddings = BatchedEmbeddings(
+                embedding_model,
+                batch_size=self.embedding_provider.INDEXING_BATCH_SIZE,
+                max_concurrency=self.embedding_provider.INDEXING_MAX_CONCURRENCY,
+            )
+        return self._batched_embeddings
+
+    async def _load_and_parse(self, filings: List) -> List[Document]:
+        """
+        Load and parse the fetched filings as a streaming pipeline.
+
+        Documents are streamed from the loader as they arrive and pushed onto a
+        bounded queue that the parser drains concurrently, so network-bound
+        loading of the next document overlaps with parsing of the previous one.
+        Up to _PARSE_CONCURRENCY documents are parsed at a time; the parsed
+        documents keep the order in which they were loaded.
+
+        Args:
+            filings: Acquisition outputs returned by the fetcher
+
+        Returns:
+            List of parsed documents
+        """
+        load_q: asyncio.Queue = asyncio.Queue(maxsize=self._LOAD_QUEUE_SIZE)
+
+        async def produce() -> None:
+            try:
+                async for doc in self.loader.stream(filings):
+                    await load_q.put(doc)
+            finally:
+                # Sentinel so the consumer stops, even if loading failed
+                await load_q.put(None)
+
+        parse_slots = asyncio.Semaphore(self._PARSE_CONCURRENCY)
+
+        async def parse(doc: Document) -> List[Document]:
+            try:
+                return await self.parser.parse([doc])
+            finally:
+                parse_slots.release()
+
+        producer = asyncio.create_task(produce())
+        parse_tasks: List[asyncio.Task] = []
+        try:
+            while (doc := await load_q.get()) is not None:
+                # Wait for a free slot before dequeuing more, so the bounded
+                # queue still applies backpressure to the loader
+                await parse_slots.acquire()
+                parse_tasks.append(asyncio.create_task(parse(doc)))
+            # Surface any error raised while loading
+            await producer
+            results = await asyncio.gather(*parse_tasks)
+        finally:
+            producer.cancel()
+            for task in parse_tasks:
+                task.cancel()
+
+        logger.info(f"Loaded {len(parse_tasks)} documents")
+        return [parsed for docs in results for parsed in docs]
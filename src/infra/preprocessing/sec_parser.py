@@ -25,6 +25,9 @@ from infra.utils import ProgressTracker
 
 logger = logging.getLogger(__name__)
 
+# Matches a markdown table header separator row, e.g. "| --- | --- |"
+_TABLE_SEPARATOR_RE = re.compile(r"^\|[-| ]+\|$")
+
 
 def write_content_to_file(content: str, filename: str) -> None:
     """
@@ -97,8 +100,12 @@ Do not fabricate hierarchy — only reflect the actual parent-child relationship
             column_mapping=TABLE_SCHEMAS[TableNames.SECFilingHierarchy],
         )
 
+        # Reuse a single sec-parser instance across parse() calls so the
+        # HTML tag parser and options are only constructed once per SECParser.
+        self._edgar_parser = sp.Edgar10QParser(self.get_classifer_steps)
+
     def get_classifer_steps(self) -> list:
-        steps = sp.Edgar10QParser().get_default_steps()
+        steps = self._edgar_parser.get_default_steps()
         return [
             step for step in steps if not isinstance(step, SupplementaryTextClassifier)
         ]
@@ -127,6 +134,8 @@ Do not fabricate hierarchy — only reflect the actual parent-child relationship
     async def _index_hierarchy(
         self, tree: sp.SemanticTree, metadata: SECFiling
     ) -> MemoryTreeNode:
+        await self._prefetch_leaf_summaries(tree, metadata)
+
         children_memories: List[MemoryTreeNode] = []
         total_content: List[str] = []
         async with ProgressTracker(len(list(tree.nodes))) as tracker:
@@ -198,8 +207,12 @@ Do not fabricate hierarchy — only reflect the actual parent-child relationship
             root_tree_node = MemoryTreeNode.model_validate(
                 hierarchy_entry["document_structure"]
             )
-        write_content_to_file(
-            json.dumps(root_tree_node.model_dump()), f"cache/{metadata.ticker}.json"
+        # Write the tree dump off the event loop so concurrent parses and
+        # in-flight summarization requests are not blocked on disk I/O
+        await asyncio.to_thread(
+            write_content_to_file,
+            json.dumps(root_tree_node.model_dump()),
+            f"cache/{metadata.ticker}.json",
         )
         docs = self._create_docs_from_memory_tree(root_tree_node)
         return docs
@@ -225,6 +238,59 @@ Do not fabricate hierarchy — only reflect the actual parent-child relationship
             docs.extend(child_docs)
         return docs
 
+    def _node_content(self, node: sp.TreeNode) -> Tuple[str, ChunkType]:
+        """
+        Return the text content of a tree node and the chunk type it maps to.
+        """
+        if isinstance(node.semantic_element, sp.TableElement):
+            node_content = self._cleanup_table_format(
+                node.semantic_element.table_to_markdown()
+            ).strip()
+            return node_content, ChunkType.TABLE
+        if isinstance(
+            node.semantic_element, sp.ImageElement
+        ):  # TODO(neelp): Handle images when parsing SEC filings
+            return "[IMAGE]", ChunkType.IMAGE
+        return node.semantic_element.text.strip(), ChunkType.TEXT
+
+    async def _prefetch_leaf_summaries(
+        self, tree: sp.SemanticTree, metadata: SECFiling
+    ) -> None:
+        """
+        Summarize every uncached leaf of the tree in one batched LLM call.
+
+        Leaves (tables and text blocks) make up most of a filing's summaries
+        and do not depend on each other, so they are summarized up front and
+        cached; the hierarchy walk then reads them back from the cache.
+        """
+        pending = {}
+        for node in tree.nodes:
+            if node.children or not node.semantic_element.contains_words():
+                continue
+            content, _ = self._node_content(node)
+            content_hash = self.summary_cache.generate_id(content)
+            if content_hash in pending:
+                continue
+            cache_entry = self.summary_cache.get(content_hash)
+            if not cache_entry or not cache_entry["summary"]:
+                pending[content_hash] = content
+
+        if not pending:
+            return
+        logger.info(f"Summarizing {len(pending)} leaf sections of {metadata.ticker}")
+        summaries = await self.summarizer.run_batch(
+            [SummarizerInput(input=content) for content in pending.values()]
+        )
+        for (content_hash, content), summary in zip(pending.items(), summaries):
+            self.summary_cache.write(
+                content_hash,
+                ticker=metadata.ticker,
+                filing_type=metadata.formType,
+                filing_date=metadata.filing_date,
+                original_text=content,
+                summary=summary,
+            )
+
     async def _create_document_structure(
         self, node: sp.TreeNode, metadata: SECFiling, tracker: ProgressTracker
     ) -> Tuple[MemoryTreeNode, str]:
@@ -257,19 +323,7 @@ Do not fabricate hierarchy — only reflect the actual parent-child relationship
             await tracker.step()
             return child_memory, child_memory.content
 
-        if isinstance(node.semantic_element, sp.TableElement):
-            node_content = self._cleanup_table_format(
-                node.semantic_element.table_to_markdown()
-            ).strip()
-            node_type = ChunkType.TABLE
-        elif isinstance(
-            node.semantic_element, sp.ImageElement
-        ):  # TODO(neelp): Handle images when parsing SEC filings
-            node_content = "[IMAGE]"
-            node_type = ChunkType.IMAGE
-        else:
-            node_content = node.semantic_element.text.strip()
-            node_type = ChunkType.TEXT
+        node_content, node_type = self._node_content(node)
 
         node_metadata = metadata.model_copy(deep=True)
         node_id = str(uuid.uuid4())
@@ -335,14 +389,16 @@ Do not fabricate hierarchy — only reflect the actual parent-child relationship
         """
         # Add header separators for tables if doesn't exist
         markdown_lines = markdown_lines.split("\n")
-        if len(markdown_lines) > 1 and not re.match(r"^\|[-| ]+\|$", markdown_lines[1]):
+        if len(markdown_lines) > 1 and not _TABLE_SEPARATOR_RE.match(
+            markdown_lines[1]
+        ):
             num_cols = markdown_lines[0].count("|") - 1  # exclude outer bars
             separator_line = "|" + "|".join([" --- "] * num_cols) + "|"
             markdown_lines.insert(1, separator_line)
         return "\n".join(markdown_lines).strip()
 
     async def parse(self, docs: List[Document]) -> List[Document]:
-        parser = sp.Edgar10QParser(self.get_classifer_steps)
+        parser = self._edgar_parser
         parsed_docs = []
         for doc in docs:
             with warnings.catch_warnings():
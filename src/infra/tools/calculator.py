@@ -1,8 +1,14 @@
+import ast
+import asyncio
+import functools
 import logging
 import math
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 import numexpr
+import numexpr.expressions
+import numpy as np
+from numexpr.necompiler import getExprNames
 from pydantic import BaseModel, Field
 
 from infra.tools.models import BaseTool
@@ -10,6 +16,260 @@ from infra.tools.models import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Named constants available to calculator expressions
+_CONSTANTS = {"pi": math.pi, "e": math.e}
+
+# Calculator inputs are scalars, where numexpr's thread pool only adds
+# synchronisation overhead and oversubscribes cores under concurrent calls
+_NUMEXPR_THREADS = 1
+numexpr.set_num_threads(_NUMEXPR_THREADS)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(expr: str) -> numexpr.NumExpr:
+    """
+    Compile an expression into a reusable NumExpr program.
+
+    Agents frequently repeat the same formula, so the parse/compile step is
+    cached and only the VM evaluation is paid on subsequent calls.
+
+    Args:
+        expr: The stripped numexpr expression
+
+    Returns:
+        The compiled NumExpr program, taking its inputs as doubles
+    """
+    names, _ = getExprNames(expr, {})
+    return numexpr.NumExpr(expr, signature=[(name, np.float64) for name in names])
+
+
+# Warm the cache with the bare constants
+for _name in _CONSTANTS:
+    _compile(_name)
+
+
+# Names usable by the pure-Python fast path for scalar expressions
+_SAFE_NAMES = {
+    **_CONSTANTS,
+    **{
+        name: getattr(math, name)
+        for name in ("sin", "cos", "tan", "log", "exp", "sqrt", "pow")
+    },
+}
+
+# Largest literal exponent the fast path will raise a number to; anything
+# else (e.g. fractional roots) is left to numexpr's floating point powers
+_MAX_FAST_EXPONENT = 1000
+
+# Largest integer, in bits, that an expression may build. Python evaluates
+# integer powers, products and shifts exactly, and numexpr folds integer
+# constants the same way while compiling, so without this bound a nested
+# power like "(10 ** 1000) ** 1000" builds a million-digit int
+_MAX_INT_BITS = 1 << 15
+
+
+def _int_bits(node: ast.AST) -> Optional[int]:
+    """
+    Bound the size of the integer an expression node evaluates to.
+
+    Args:
+        node: A node of an already whitelisted expression
+
+    Returns:
+        An upper bound on the bit length of the node's integer value, or None
+        if the node evaluates to a float
+
+    Raises:
+        ValueError: If the node or one of its children may exceed
+            _MAX_INT_BITS
+    """
+    if isinstance(node, ast.Constant):
+        if type(node.value) in (bool, int):
+            return max(abs(node.value).bit_length(), 1)
+        return None
+    if isinstance(node, ast.UnaryOp):
+        return _int_bits(node.operand)
+    if isinstance(node, ast.Compare):
+        for child in (node.left, *node.comparators):
+            _int_bits(child)
+        return 1
+    if isinstance(node, ast.Call):
+        # Calculator and numexpr functions return floats
+        for arg in node.args:
+            _int_bits(arg)
+        return None
+    if not isinstance(node, ast.BinOp):
+        return None
+
+    left, right = _int_bits(node.left), _int_bits(node.right)
+    if left is None or right is None:
+        return None
+    if isinstance(node.op, (ast.Pow, ast.LShift)):
+        # Bound the right operand's value, not just its size
+        if isinstance(node.right, ast.Constant):
+            amount = abs(node.right.value)
+        else:
+            amount = 1 << right
+        bits = left * amount if isinstance(node.op, ast.Pow) else left + amount
+    elif isinstance(node.op, ast.Mult):
+        bits = left + right
+    elif isinstance(node.op, (ast.Add, ast.Sub, ast.BitOr, ast.BitAnd)):
+        bits = max(left, right) + 1
+    else:
+        # Division, modulo and right shifts never grow the left operand
+        bits = left
+    if bits > _MAX_INT_BITS:
+        raise ValueError("integer result too large")
+    return bits
+
+
+class _ScalarExprValidator(ast.NodeVisitor):
+    """
+    Whitelists the AST of a scalar arithmetic expression.
+
+    Only numeric literals, the names in _SAFE_NAMES, calls to those names and
+    basic arithmetic/comparison operators are allowed, and integer results
+    are bounded by _MAX_INT_BITS; anything else raises ValueError.
+    """
+
+    _ALLOWED_NODES = (
+        ast.Expression,
+        ast.BinOp,
+        ast.UnaryOp,
+        ast.Compare,
+        ast.Call,
+        ast.Name,
+        ast.Load,
+        ast.Constant,
+        ast.Add,
+        ast.Sub,
+        ast.Mult,
+        ast.Div,
+        ast.Mod,
+        ast.Pow,
+        ast.UAdd,
+        ast.USub,
+        ast.Lt,
+        ast.LtE,
+        ast.Gt,
+        ast.GtE,
+        ast.Eq,
+        ast.NotEq,
+    )
+
+    def visit_Expression(self, node: ast.Expression) -> None:
+        self.generic_visit(node)
+        _int_bits(node.body)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if not isinstance(node, self._ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        super().generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if type(node.value) not in (int, float):
+            raise ValueError(f"unsupported literal: {node.value!r}")
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id not in _SAFE_NAMES:
+            raise ValueError(f"unknown name: {node.id}")
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise ValueError("unsupported call")
+        self.generic_visit(node)
+
+    def visit_BinOp(self, node: ast.BinOp) -> None:
+        if isinstance(node.op, ast.Pow) and not (
+            isinstance(node.right, ast.Constant)
+            and abs(node.right.value) <= _MAX_FAST_EXPONENT
+        ):
+            raise ValueError("unsupported exponent")
+        self.generic_visit(node)
+
+
+class _NumExprValidator(_ScalarExprValidator):
+    """
+    Whitelists the AST of an expression before it is handed to numexpr.
+
+    Extends the scalar whitelist with numexpr's bitwise/logical operators and
+    its function set; names other than the calculator constants are rejected.
+    """
+
+    _ALLOWED_NODES = _ScalarExprValidator._ALLOWED_NODES + (
+        ast.BitAnd,
+        ast.BitOr,
+        ast.Invert,
+        ast.LShift,
+        ast.RShift,
+    )
+
+    _FUNCTIONS = frozenset(numexpr.expressions.functions)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if type(node.value) not in (bool, int, float, complex):
+            raise ValueError(f"unsupported literal: {node.value!r}")
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id not in _CONSTANTS:
+            raise ValueError(f"unknown name: {node.id}")
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if (
+            not isinstance(node.func, ast.Name)
+            or node.func.id not in self._FUNCTIONS
+            or node.keywords
+        ):
+            raise ValueError("unsupported call")
+        for arg in node.args:
+            self.visit(arg)
+
+    def visit_BinOp(self, node: ast.BinOp) -> None:
+        # numexpr evaluates powers in floating point, so any exponent is fine
+        # as long as the integer bound holds while it folds constants
+        self.generic_visit(node)
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate(expr: str) -> bool:
+    """
+    Check an expression against the numexpr whitelist, caching the decision.
+
+    Args:
+        expr: The stripped expression
+
+    Returns:
+        True if the expression only uses whitelisted syntax, False otherwise
+    """
+    try:
+        _NumExprValidator().visit(ast.parse(expr, mode="eval"))
+    except (SyntaxError, ValueError):
+        return False
+    return True
+
+
+def _fast_eval(expr: str):
+    """
+    Evaluate a whitelisted scalar expression in pure Python.
+
+    numexpr's VM and thread start-up dominate for scalar inputs, which is all
+    the calculator ever receives, so simple expressions skip it entirely.
+
+    Args:
+        expr: The stripped expression
+
+    Returns:
+        The evaluated result
+
+    Raises:
+        Exception: If the expression is not whitelisted or fails to evaluate
+    """
+    tree = ast.parse(expr, mode="eval")
+    _ScalarExprValidator().visit(tree)
+    return eval(  # noqa: S307 - AST is whitelisted above, builtins removed
+        compile(tree, "<calculator>", "eval"), {"__builtins__": {}}, _SAFE_NAMES
+    )
+
 
 class CalculatorNumExprInput(BaseModel):
     expr: str = Field(description="Python numexpr compatbile expression to be solved")
@@ -52,15 +312,39 @@ Examples:
             str: The resulting expression.
         """
         logger.info(f"📌 TOOL EXECUTION: {self.name}")
-        local_dict = {"pi": math.pi, "e": math.e}
         try:
-            calculator_input = CalculatorNumExprInput(**kwargs)
-            return str(
-                numexpr.evaluate(
-                    calculator_input.expr.strip(),
-                    local_dict=local_dict,
-                )
-            )
+            calculator_input = self._parse_args(CalculatorNumExprInput, kwargs)
+            expr = calculator_input.expr.strip()
+            if not _validate(expr):
+                # Reject before any evaluation work is done
+                raise ValueError(f"Unsupported calculator expression: {expr!r}")
+            try:
+                return str(_fast_eval(expr))
+            except Exception:
+                # Not a plain scalar expression (or Python rejected it); let
+                # numexpr evaluate it as before
+                pass
+            # numexpr blocks while it runs, so keep it off the event loop
+            return str(await asyncio.to_thread(self._evaluate_numexpr, expr))
         except Exception as e:
             logger.error(f"Error during Calculator: {e}", exc_info=True)
             raise
+
+    def _evaluate_numexpr(self, expr: str):
+        """
+        Evaluate an expression with numexpr, reusing a cached compiled program
+        if possible.
+
+        Args:
+            expr: The stripped numexpr expression
+
+        Returns:
+            The numexpr result for the expression
+        """
+        try:
+            program = _compile(expr)
+        except Exception:
+            # Let numexpr.evaluate handle (and report) anything the direct
+            # compiler rejects
+            return numexpr.evaluate(expr, local_dict=dict(_CONSTANTS))
+        return program(*[_CONSTANTS[name] for name in program.input_names])
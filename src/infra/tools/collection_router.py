@@ -1,12 +1,18 @@
-import json
 import logging
-from typing import ClassVar, List, Optional
+from collections import deque
+from typing import Any, ClassVar, Deque, Dict, List, Literal, Optional, Tuple, Type
 
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from langchain_core.exceptions import OutputParserException
 from langchain_core.language_models import BaseLanguageModel
-from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
-from pydantic import BaseModel, Field
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel, Field, ValidationError, create_model
 
 from infra.collections.registry import get_schema_registry
+from infra.embeddings.models import IEmbeddingProvider
+from infra.embeddings.normalization import normalize
 from infra.llm.models import ILLMProvider
 from infra.tools.models import BaseTool
 
@@ -27,6 +33,69 @@ class CollectionRouterOutput(BaseModel):
     )
 
 
+def _routing_output_model(names: Tuple[str, ...]) -> Type[CollectionRouterOutput]:
+    """
+    Build a routing output model whose collection names are an enum of names.
+
+    With structured outputs the enum is part of the JSON schema sent to the
+    model, so it cannot route to a collection that does not exist.
+
+    Args:
+        names: The registered collection names
+
+    Returns:
+        The output model, or the unconstrained base model if there are no names
+    """
+    if not names:
+        return CollectionRouterOutput
+    return create_model(
+        "CollectionRouterOutput",
+        __base__=CollectionRouterOutput,
+        collections=(
+            List[Literal[names]],
+            Field(description="A list of collections pertaining to the query"),
+        ),
+    )
+
+
+def _extract_collection_names(text: Optional[str]) -> Optional[List[str]]:
+    """
+    Pull the JSON array of collection names out of a raw LLM response.
+
+    The prompt asks for a bare array, which the model often wraps in markdown
+    fences or prose. Slicing from the first "[" to the last "]" skips all of
+    that in one scan, without any regex passes.
+
+    Args:
+        text: The raw LLM output, if any
+
+    Returns:
+        The collection names, or None if no array of strings was found
+    """
+    if not text:
+        return None
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end <= start:
+        return None
+    try:
+        names = orjson.loads(text[start : end + 1])
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+        return None
+    return names
+
+
+def _route_cache_key(query: str) -> str:
+    """
+    Normalize a query for the exact-match route cache.
+
+    Case and runs of whitespace do not change a query's routing, so they are
+    folded away before lookup.
+    """
+    return " ".join(query.lower().split())
+
+
 class CollectionRouterTool(BaseTool):
     _TOOL_NAME: ClassVar[str] = "route_query_to_collections"
     _TOOL_DESCRIPTION: ClassVar[
@@ -47,32 +116,45 @@ Output includes:
     metadata_model: a JSON schema describing the required metadata fields and their meanings
 """
 
+    _ROUTE_CACHE_SIZE: ClassVar[int] = 1024
+    _ROUTE_CACHE_TTL: ClassVar[int] = 300  # seconds
+    _SEMANTIC_CACHE_SIZE: ClassVar[int] = 256
+    _SEMANTIC_CACHE_THRESHOLD: ClassVar[float] = 0.92  # cosine similarity
+
+    # Static instructions first and the query last, so every call shares the
+    # same prompt prefix and hits the provider's prompt cache
     _COLLECTION_ROUTER_PROMPT = """
 You are an expert financial data analyst assistant. You are given:
 
-1. A natural language query from the user
-2. A list of available document collections (in JSON), where each collection contains:
+1. A list of available document collections (in JSON), where each collection contains:
     - `name`: the unique identifier for the collection
     - `description`: what kind of data this collection contains
+2. A natural language query from the user
 
 Your job is to determine **which collections are relevant to answer the user's query**.
 
 Only include collections that are likely to contain the required information based on their descriptions and metadata fields.
 
-### Input Query:
-{query}
-
-### Available Collections:
-{collections_json}
-
 ### Output Format:
 Only return a JSON array of strings, each string being the `name` of a relevant collection.
 
 Example:
 ["SECChunk", "EarningsCallChunk"]
+
+### Available Collections:
+{collections_json}
 """
 
-    def __init__(self, llm_provider: ILLMProvider):
+    _COLLECTION_ROUTER_QUERY_PROMPT = """
+### Input Query:
+{query}
+"""
+
+    def __init__(
+        self,
+        llm_provider: ILLMProvider,
+        embeddings: Optional[IEmbeddingProvider] = None,
+    ):
         super().__init__(
             name=self._TOOL_NAME,
             description=self._TOOL_DESCRIPTION,
@@ -82,14 +164,47 @@ Example:
         self._llm_provider = llm_provider
         self._llm_instance: Optional[BaseLanguageModel] = None  # Lazy load the model
 
-        self._prompt_template = ChatPromptTemplate.from_messages(
-            [
-                HumanMessagePromptTemplate.from_template(
-                    self._COLLECTION_ROUTER_PROMPT
-                ),
-            ]
-        )
         self._schema_registry = get_schema_registry()
+        # The registry is static for the lifetime of the process, so its
+        # serialized forms are computed once instead of on every call
+        self._collections_json = self._schema_registry.json_schema()
+        self._collection_schemas: Dict[str, Optional[Dict[str, Any]]] = {}
+        # Serialized schemas of every collection, used when the LLM response
+        # cannot be parsed; built on first use and then returned as-is
+        self._all_collections_json: Optional[str] = None
+        self._collection_names = tuple(
+            collection.name for collection in self._schema_registry.all_collections()
+        )
+        self._output_model = _routing_output_model(self._collection_names)
+        # Agents often reissue the same query within a session; remember the
+        # routing decision for a while so repeats skip the LLM round-trip
+        self._route_cache: TTLCache = TTLCache(
+            maxsize=self._ROUTE_CACHE_SIZE, ttl=self._ROUTE_CACHE_TTL
+        )
+        # With an embedding model, paraphrases of a recent query ("market cap
+        # of JPM" vs "JPMorgan's market cap") reuse its routing as well
+        self._embeddings = (
+            embeddings.get_embedding_model() if embeddings is not None else None
+        )
+        self._semantic_vectors: Deque[List[float]] = deque(
+            maxlen=self._SEMANTIC_CACHE_SIZE
+        )
+        self._semantic_routes: Deque[List[str]] = deque(
+            maxlen=self._SEMANTIC_CACHE_SIZE
+        )
+        self._semantic_matrix: Optional[np.ndarray] = None
+
+        # The whole prompt is rendered up front (the system message holds
+        # literal JSON, so it must not be parsed as a template); per call only
+        # the query is spliced between the pre-rendered human message segments
+        self._system_message = SystemMessage(
+            content=self._COLLECTION_ROUTER_PROMPT.format(
+                collections_json=self._collections_json
+            )
+        )
+        self._query_prefix, self._query_suffix = (
+            self._COLLECTION_ROUTER_QUERY_PROMPT.format(query="\x00").split("\x00", 1)
+        )
 
     def _llm(self) -> BaseLanguageModel:
         """
@@ -101,22 +216,145 @@ Example:
             self._llm_instance = self._llm_provider.get_model()
         return self._llm_instance
 
+    def _collection_schema(self, collection: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the parsed JSON schema for a collection, memoized per name.
+
+        Names the registry does not know (e.g. hallucinated by the LLM) are
+        memoized as None, so repeats of the same bad name cost a dict probe.
+        """
+        if collection in self._collection_schemas:
+            return self._collection_schemas[collection]
+        try:
+            collection_schema = self._schema_registry.get_collection(collection)
+        except ValueError:
+            logger.warning(f"Ignoring unknown collection from router: {collection}")
+            schema = None
+        else:
+            schema = orjson.loads(collection_schema.json_schema())
+        self._collection_schemas[collection] = schema
+        return schema
+
+    def _all_collections_schema(self) -> str:
+        """
+        Return the serialized schemas of every registered collection.
+        """
+        if self._all_collections_json is None:
+            self._all_collections_json = orjson.dumps(
+                [
+                    self._collection_schema(name)
+                    for name in self._collection_names
+                ]
+            ).decode()
+        return self._all_collections_json
+
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embed a query for the semantic route cache, if one is configured.
+
+        Returns:
+            The unit-length query vector, or None if no embedding model is set
+            or embedding failed
+        """
+        if self._embeddings is None:
+            return None
+        try:
+            return normalize([await self._embeddings.aembed_query(query)])[0]
+        except Exception as e:
+            logger.warning(f"Could not embed query for the route cache: {e}")
+            return None
+
+    def _similar_route(self, vector: List[float]) -> Optional[List[str]]:
+        """
+        Return the routing of the most similar cached query, if close enough.
+
+        Args:
+            vector: The unit-length query vector
+
+        Returns:
+            The cached collection names, or None if no cached query is similar
+        """
+        if not self._semantic_vectors:
+            return None
+        if self._semantic_matrix is None:
+            self._semantic_matrix = np.vstack(self._semantic_vectors)
+        scores = self._semantic_matrix @ np.asarray(vector, dtype=np.float32)
+        best = int(np.argmax(scores))
+        if scores[best] < self._SEMANTIC_CACHE_THRESHOLD:
+            return None
+        return self._semantic_routes[best]
+
+    def _remember_route(self, vector: List[float], collections: List[str]) -> None:
+        """
+        Add a routing decision to the semantic route cache.
+        """
+        self._semantic_vectors.append(vector)
+        self._semantic_routes.append(collections)
+        self._semantic_matrix = None
+
+    async def _route(self, query: str) -> Optional[List[str]]:
+        """
+        Route a single query to collection names, reusing cached decisions.
+
+        Args:
+            query: The search query to route
+
+        Returns:
+            The routed collection names, or None if the response was unparseable
+        """
+        cache_key = _route_cache_key(query)
+        collections = self._route_cache.get(cache_key)
+        if collections is not None:
+            logger.debug("Reusing cached collection routing for query")
+            return collections
+
+        vector = await self._embed_query(query)
+        if vector is not None:
+            collections = self._similar_route(vector)
+            if collections is not None:
+                logger.debug("Reusing collection routing of a similar query")
+                self._route_cache[cache_key] = collections
+                return collections
+
+        prompt = [
+            self._system_message,
+            HumanMessage(content=self._query_prefix + query + self._query_suffix),
+        ]
+        llm = self._llm()
+        try:
+            response: CollectionRouterOutput = await llm.with_structured_output(
+                self._output_model
+            ).ainvoke(prompt)
+        except (OutputParserException, ValidationError) as e:
+            collections = _extract_collection_names(getattr(e, "llm_output", None))
+            if collections is None:
+                logger.warning(
+                    f"Could not parse collection routing response, "
+                    f"falling back to all collections: {e}"
+                )
+                return None
+            logger.debug("Recovered collection names from raw routing response")
+        else:
+            collections = response.collections
+        self._route_cache[cache_key] = collections
+        if vector is not None:
+            self._remember_route(vector, collections)
+        return collections
+
     async def execute(self, **kwargs) -> str:
         logger.info(f"📌 TOOL EXECUTION: {self.name}")
-        llm = self._llm()
+        router_input = self._parse_args(CollectionRouterInput, kwargs)
 
-        router_input = CollectionRouterInput(**kwargs)
-        prompt = self._prompt_template.format_prompt(
-            query=router_input.query,
-            collections_json=self._schema_registry.json_schema(),
-        )
+        collections = await self._route(router_input.query)
+        if collections is None:
+            return self._all_collections_schema()
 
-        response: CollectionRouterOutput = await llm.with_structured_output(
-            CollectionRouterOutput
-        ).ainvoke(prompt)
-        relevant_schemas = [
-            json.loads(self._schema_registry.get_collection(col).json_schema())
-            for col in response.collections
-        ]
+        schemas = (self._collection_schema(col) for col in collections)
+        relevant_schemas = [schema for schema in schemas if schema is not None]
+        if collections and not relevant_schemas:
+            logger.warning(
+                "None of the routed collections exist, falling back to all collections"
+            )
+            return self._all_collections_schema()
         logger.info(f"✅ TOOL COMPLETED: {self.name} successfully")
-        return json.dumps(relevant_schemas)
+        return orjson.dumps(relevant_schemas).decode()
@@ -1,16 +1,12 @@
 import asyncio
-import json
 import logging
-from datetime import date, datetime
-from typing import Any, ClassVar, Dict, List
+from typing import Any, ClassVar, Dict, List, Optional
 
-from langchain_core.documents import Document
-from pydantic import BaseModel, Field
-from sqlalchemy import func
+from langchain_core.embeddings import Embeddings
+from pydantic import BaseModel, Field, SerializeAsAny
 
-from infra.collections.models import HierarchyMetadata
 from infra.collections.registry import TraversalType, get_schema_registry
-from infra.databases.cache import Cache
+from infra.embeddings.caching import QueryCachedEmbeddings
 from infra.embeddings.models import IEmbeddingProvider
 from infra.llm.models import ILLMProvider
 from infra.pipelines.mem_walker import MemoryTreeNode, MemWalker
@@ -45,11 +41,18 @@ class TargetQueryInfo(BaseModel):
     filters_applied: Dict[str, Any]
 
 
+class SearchResult(BaseModel):
+    content: str
+    metadata: Dict[str, Any]
+
+
 class SearchOutput(BaseModel):
     status: str = Field("")
     message: str = Field("")
     query_executed: TargetQueryInfo = Field(...)
-    results: List[BaseModel] = Field(default_factory=list)
+    # Serialize results by their runtime type (e.g. Document); the declared
+    # BaseModel type has no fields, so it would serialize each one as {}
+    results: List[SerializeAsAny[BaseModel]] = Field(default_factory=list)
 
 
 class DatabaseSearchTool(BaseTool):
@@ -91,7 +94,18 @@ If relevant data is currently being indexed: A JSON object with status: "INDEXIN
         llm_provider: ILLMProvider,
         vector_store: IVectorStore = None,
         embeddings: IEmbeddingProvider = None,
+        structured_output: bool = False,
     ):
+        """
+        Initialize the database search tool.
+
+        Args:
+            llm_provider: The LLM provider used for memory-tree traversal
+            vector_store: The vector store to search
+            embeddings: The embedding provider for search queries
+            structured_output: Reduce each result in the JSON output to its
+                content and metadata instead of the full serialized document
+        """
         super().__init__(
             name=self._TOOL_NAME,
             description=self._TOOL_DESCRIPTION,
@@ -100,12 +114,28 @@ If relevant data is currently being indexed: A JSON object with status: "INDEXIN
         self._schema_registry = get_schema_registry()
         self._vector_store = vector_store
         self._embeddings = embeddings
+        self._embedding_model_instance: Optional[Embeddings] = None  # Lazy load
         self._llm_provider = llm_provider
+        self._structured_output = structured_output
+
+    def _embedding_model(self) -> Embeddings:
+        """
+        Lazy load the embedding model, wrapped with a query embedding cache.
+
+        Agents often retry the same search, so repeated queries reuse their
+        embedding instead of calling the model again. Reusing one wrapper also
+        keeps the vector store from reinitializing for a "new" model per call.
+        """
+        if self._embedding_model_instance is None:
+            self._embedding_model_instance = QueryCachedEmbeddings(
+                self._embeddings.get_embedding_model()
+            )
+        return self._embedding_model_instance
 
     async def execute(self, **kwargs) -> str:
         logger.info(f"📌 TOOL EXECUTION: {self.name}")
         try:
-            search_query = VectorSearchQuery(**kwargs)
+            search_query = self._parse_args(VectorSearchQuery, kwargs)
             collection = self._schema_registry.get_collection(search_query.collection)
             search_output = SearchOutput(
                 query_executed=TargetQueryInfo(
@@ -120,7 +150,7 @@ If relevant data is currently being indexed: A JSON object with status: "INDEXIN
             search_output.status = status
             search_output.message = reason
             if not exists:
-                return search_output.model_dump()
+                return search_output.model_dump_json()
 
             search_kwargs = SearchKwargs(k=search_query.k, filters=search_query.filters)
             if collection.traversal == TraversalType.MEM_WALK:
@@ -142,7 +172,7 @@ If relevant data is currently being indexed: A JSON object with status: "INDEXIN
                 search_kwargs.k = 100
                 search_kwargs.filters = {"node_ids": node_ids}
 
-            embeddings = self._embeddings.get_embedding_model()
+            embeddings = self._embedding_model()
             self._vector_store.set_collection(
                 search_query.collection, search_query.filters
             )
@@ -150,10 +180,18 @@ If relevant data is currently being indexed: A JSON object with status: "INDEXIN
                 embeddings=embeddings, search_kwargs=search_kwargs
             )
             documents = await retriever.ainvoke(search_query.query)
-            search_output.results = documents
-
             logger.info(f"✅ TOOL COMPLETED: {self.name} successfully")
-            return json.dumps(search_output.model_dump())
+
+            if self._structured_output:
+                search_output.results = [
+                    SearchResult(content=doc.page_content, metadata=doc.metadata)
+                    for doc in documents
+                ]
+            else:
+                search_output.results = documents
+            # Serialize straight to JSON in pydantic-core rather than building
+            # an intermediate dict for json.dumps
+            return search_output.model_dump_json()
         except Exception as e:
             # Catch potential errors from format_prompt or invoke
             logger.error(f"Error during TableSummarizer run: {e}", exc_info=True)
@@ -1,10 +1,48 @@
+import asyncio
+import contextvars
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Type
+from typing import Any, Dict, Optional, Type, TypeVar
 
 from langchain.tools import BaseTool
 from pydantic import BaseModel
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# The tool whose arguments LangChain's dispatch path has already validated
+# against its args_schema; cleared once the tool parses them
+_args_prevalidated: contextvars.ContextVar[Optional["ITool"]] = contextvars.ContextVar(
+    "args_prevalidated", default=None
+)
+
+# Re-validate tool arguments even when LangChain already did (debugging aid)
+_ALWAYS_VALIDATE_ARGS = bool(os.environ.get("TALLY_DEBUG"))
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop used to run tools from synchronous code.
+
+    The loop is created lazily and runs forever in a daemon thread, so sync
+    tool calls reuse it instead of creating and tearing down a loop per call,
+    and they also work when the caller is already inside a running loop.
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="tool-sync-runner", daemon=True
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
+
 class ITool(BaseTool, ABC):
     """
     Interface for tools that can be used by agents.
@@ -33,15 +71,48 @@ class ITool(BaseTool, ABC):
         """
         pass
 
+    def _parse_args(self, model: Type[ModelT], kwargs: Dict[str, Any]) -> ModelT:
+        """
+        Build the input model for a tool call.
+
+        Arguments arriving through LangChain's run/arun have already been
+        validated against args_schema, so the model is built without running
+        validation again. Direct execute() calls, including ones a tool makes
+        while it runs, (or TALLY_DEBUG) validate.
+
+        Args:
+            model: The pydantic input model of the tool
+            kwargs: The arguments passed to execute()
+
+        Returns:
+            The populated input model
+
+        Raises:
+            ValidationError: If the arguments are validated and invalid
+        """
+        if _args_prevalidated.get() is self:
+            # Consume the flag so execute() calls nested in this one validate
+            _args_prevalidated.set(None)
+            if not _ALWAYS_VALIDATE_ARGS:
+                return model.model_construct(**kwargs)
+        return model(**kwargs)
+
+    async def _execute_prevalidated(self, kwargs: Dict[str, Any]) -> Any:
+        token = _args_prevalidated.set(self)
+        try:
+            return await self.execute(**kwargs)
+        finally:
+            _args_prevalidated.reset(token)
+
     def _run(self, **kwargs) -> Any:
         """
         Run the tool synchronously.
 
         This is required by LangChain's BaseTool, but we'll just call the async version.
         """
-        import asyncio
-
-        return asyncio.run(self.execute(**kwargs))
+        return asyncio.run_coroutine_threadsafe(
+            self._execute_prevalidated(kwargs), _get_background_loop()
+        ).result()
 
     async def _arun(self, **kwargs) -> Any:
         """
@@ -49,7 +120,7 @@ class ITool(BaseTool, ABC):
 
         This is the preferred method for running the tool.
         """
-        return await self.execute(**kwargs)
+        return await self._execute_prevalidated(kwargs)
 
 
 class BaseTool(ITool):
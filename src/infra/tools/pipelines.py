@@ -1,7 +1,7 @@
-import json
 import logging
 from typing import Any, ClassVar, Dict, Type
 
+import orjson
 from pydantic import BaseModel, Field
 
 from infra.collections.registry import get_schema_registry
@@ -38,6 +38,8 @@ class PipelineTool(BaseTool):
         """
         super().__init__(name, description, args_schema)
         self._arg_mapping = arg_mapping or {}
+        # Snapshot the mapping once so execute() does not rebuild it per call
+        self._arg_items = tuple(self._arg_mapping.items())
         self._pipeline = None  # Lazy loading
 
     @property
@@ -61,12 +63,12 @@ class PipelineTool(BaseTool):
         logger.info(f"📌 TOOL EXECUTION: {self.name}")
 
         # Map tool arguments to pipeline arguments if needed
-        if self._arg_mapping:
-            pipeline_kwargs = {}
-            for tool_arg, pipeline_arg in self._arg_mapping.items():
-                if tool_arg in kwargs:
-                    pipeline_kwargs[pipeline_arg] = kwargs[tool_arg]
-            kwargs = pipeline_kwargs
+        if self._arg_items:
+            kwargs = {
+                pipeline_arg: kwargs[tool_arg]
+                for tool_arg, pipeline_arg in self._arg_items
+                if tool_arg in kwargs
+            }
 
         # Run the pipeline
         try:
@@ -118,6 +120,10 @@ Arguments:
     input_values (dictionary): Dictionary of metadata entries to ingest. Only required when is_query_mode=False.
 """
 
+    # Serialized indexer schemas keyed by collection name. Schemas are static,
+    # so query mode skips pydantic's schema generation after the first call.
+    _SCHEMA_CACHE: ClassVar[Dict[str, str]] = {}
+
     def __init__(self, vector_store: IVectorStore, embeddings: IEmbeddingProvider):
         """
         Initialize the indexing pipeline tool.
@@ -135,11 +141,16 @@ Arguments:
         self._embedding_provider = embeddings
 
     async def execute(self, **kwargs):
-        tool_input = IndexingToolInput(**kwargs)
+        tool_input = self._parse_args(IndexingToolInput, kwargs)
         collection = self._schema_registry.get_collection(tool_input.collection)
         if tool_input.is_query_mode:
-            schema = collection.indexer_schema.model_json_schema()
-            return json.dumps(schema)
+            schema = self._SCHEMA_CACHE.get(collection.name)
+            if schema is None:
+                schema = orjson.dumps(
+                    collection.indexer_schema.model_json_schema()
+                ).decode()
+                self._SCHEMA_CACHE[collection.name] = schema
+            return schema
         self.pipeline = collection.indexer
         self.pipeline.embedding_provider = self._embedding_provider
         self._vector_store.set_collection(
@@ -1,6 +1,8 @@
+import hashlib
 import logging
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
+from cachetools import LRUCache
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
 from pydantic import BaseModel, Field
@@ -36,6 +38,10 @@ class SummarizerTool(BaseTool):
 
     _TOOL_NAME: ClassVar[str] = "text_summarizer"
     _TOOL_DESCRIPTION: ClassVar[str] = "Summarizes text"
+    # Upper bound on concurrent LLM requests issued by run_batch()
+    _BATCH_MAX_CONCURRENCY: ClassVar[int] = 8
+    # Number of summaries memoized per tool instance, keyed by input hash
+    _CACHE_SIZE: ClassVar[int] = 1024
 
     _TABLE_SUMMARIZER_PROMPT = """
 You are an expert financial analyst summarizing SEC filing segments.
@@ -142,6 +148,19 @@ Do not compress or analyze. Your job is to faithfully summarize the content and
                 ),
             ]
         )
+        # Identical inputs (e.g. boilerplate tables repeated across filings)
+        # reuse the earlier summary instead of another LLM call
+        self._summary_cache: LRUCache = LRUCache(maxsize=self._CACHE_SIZE)
+
+    @staticmethod
+    def _cache_key(item: SummarizerInput) -> str:
+        """
+        Hash the summarizer input into a summary cache key.
+        """
+        digest = hashlib.blake2b(item.input.encode(), digest_size=16)
+        digest.update(b"\x00")
+        digest.update(item.custom_instructions.encode())
+        return digest.hexdigest()
 
     def _llm(self) -> BaseLanguageModel:
         """
@@ -153,36 +172,90 @@ Do not compress or analyze. Your job is to faithfully summarize the content and
             self._llm_instance = self._llm_provider.get_model()
         return self._llm_instance
 
+    def _response_text(self, response: Any) -> str:
+        """
+        Extract the summary text from an LLM response.
+        """
+        # Chat models (like ChatOpenAI) return a message object (e.g., AIMessage)
+        # Older LLM models might return just a string
+        if hasattr(response, "content"):
+            summary = response.content
+        elif isinstance(response, str):
+            summary = response
+        else:
+            logger.warning(
+                f"LLM response was of unexpected type: {type(response)}. Attempting to cast to string."
+            )
+            summary = str(response)
+
+        if not isinstance(summary, str):  # Final check
+            summary = ""
+        return summary.strip()
+
+    async def run_batch(self, inputs: List[SummarizerInput]) -> List[str]:
+        """
+        Summarize several inputs through a single batched LLM call.
+
+        Requests are fanned out with bounded concurrency, so N inputs cost
+        roughly ceil(N / _BATCH_MAX_CONCURRENCY) round trips instead of N.
+
+        Args:
+            inputs: The inputs to summarize
+
+        Returns:
+            The summaries, in input order
+        """
+        if not inputs:
+            return []
+        logger.debug(f"📌 TOOL BATCH EXECUTION: {self.name} ({len(inputs)} inputs)")
+        keys = [self._cache_key(item) for item in inputs]
+        summaries: Dict[str, str] = {}
+        pending: Dict[str, SummarizerInput] = {}
+        for key, item in zip(keys, inputs):
+            cached = self._summary_cache.get(key)
+            if cached is not None:
+                summaries[key] = cached
+            elif key not in pending:
+                pending[key] = item
+
+        if pending:
+            prompts = [
+                self._prompt_template.format_prompt(
+                    input=item.input, custom_instructions=item.custom_instructions
+                )
+                for item in pending.values()
+            ]
+            responses = await self._llm().abatch(
+                prompts, config={"max_concurrency": self._BATCH_MAX_CONCURRENCY}
+            )
+            for key, response in zip(pending, responses):
+                summary = self._response_text(response)
+                summaries[key] = self._summary_cache[key] = summary
+        return [summaries[key] for key in keys]
+
     async def execute(self, **kwargs) -> str:
         logger.debug(f"📌 TOOL EXECUTION: {self.name}")
         try:
             llm = self._llm()
 
-            # Create a new instance of TableSummarizerInput and validate the kwargs
-            input_model = SummarizerInput(**kwargs)
+            # Build the SummarizerInput from the kwargs
+            input_model = self._parse_args(SummarizerInput, kwargs)
+            key = self._cache_key(input_model)
+            cached = self._summary_cache.get(key)
+            if cached is not None:
+                logger.debug(f"✅ TOOL COMPLETED: {self.name} from cache")
+                return cached
+
             prompt = self._prompt_template.format_prompt(
                 input=input_model.input,
                 custom_instructions=input_model.custom_instructions,
             )
             response = await llm.ainvoke(prompt)
-
-            # Chat models (like ChatOpenAI) return a message object (e.g., AIMessage)
-            # Older LLM models might return just a string
-            if hasattr(response, "content"):
-                summary = response.content
-            elif isinstance(response, str):
-                summary = response
-            else:
-                logger.warning(
-                    f"LLM response was of unexpected type: {type(response)}. Attempting to cast to string."
-                )
-                summary = str(response)
-
-            if not isinstance(summary, str):  # Final check
-                summary = ""
+            summary = self._response_text(response)
+            self._summary_cache[key] = summary
 
             logger.debug(f"✅ TOOL COMPLETED: {self.name} successfully")
-            return summary.strip()
+            return summary
 
         except Exception as e:
             # Catch potential errors from format_prompt or invoke
@@ -1,9 +1,13 @@
 import asyncio
 from pathlib import Path
+from typing import Any, Coroutine, TypeVar
 
 from tqdm import tqdm
 
 
+T = TypeVar("T")
+
+
 def find_project_root(start: Path = None, markers=("pyproject.toml", ".git")):
     start = start or Path(__file__).resolve()
     for p in [start] + list(start.parents):
@@ -29,3 +33,24 @@ class ProgressTracker:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         self.tqdm_bar.close()
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop, like asyncio.run().
+
+    Uses uvloop's faster event loop for the network-bound entry points when
+    the optional uvloop extra is installed, and asyncio's default loop
+    otherwise (uvloop is not available on Windows).
+
+    Args:
+        main: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -0,0 +1,55 @@
+import logging
+from enum import Enum
+from typing import Optional
+
+from infra.config.settings import get_settings
+from infra.vector_stores.models import IVectorStore
+
+
+logger = logging.getLogger(__name__)
+
+
+class VectorStoreBackend(str, Enum):
+    WEAVIATE = "weaviate"
+    CHROMA = "chroma"
+    FAISS = "faiss"
+
+
+def create_vector_store(backend: Optional[str] = None) -> IVectorStore:
+    """
+    Create the vector store for a backend.
+
+    Backends are imported on demand, so optional ones such as FAISS (the
+    ``faiss`` extra) are only needed when selected.
+
+    Args:
+        backend: Name of the backend; defaults to the VECTOR_STORE_BACKEND
+            setting
+
+    Returns:
+        A vector store with the backend's default configuration
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    name = backend or get_settings().VECTOR_STORE_BACKEND
+    try:
+        backend = VectorStoreBackend(name)
+    except ValueError:
+        raise ValueError(
+            f"Unknown vector store backend '{name}', expected one of "
+            f"{[b.value for b in VectorStoreBackend]}"
+        ) from None
+
+    logger.info(f"Using the {backend.value} vector store")
+    if backend is VectorStoreBackend.CHROMA:
+        from infra.vector_stores.chromadb import ChromaVectorStore
+
+        return ChromaVectorStore()
+    if backend is VectorStoreBackend.FAISS:
+        from infra.vector_stores.faiss import FaissVectorStore
+
+        return FaissVectorStore()
+    from infra.vector_stores.weaviate import WeaviateVectorStore
+
+    return WeaviateVectorStore()
@@ -1,19 +1,67 @@
 import logging
+import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Union
 
+from cachetools import LRUCache
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.vectorstores import VectorStore
 
-from infra.vector_stores.models import IVectorStore
+from infra.embeddings.normalization import NormalizedEmbeddings
+from infra.vector_stores.models import FilterValueType, IVectorStore, SearchKwargs
+from infra.vector_stores.quantization import (
+    QuantizationPrecision,
+    QuantizedIndex,
+    QuantizedRetriever,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_filter(filters: Dict[str, FilterValueType]) -> Dict[str, Any]:
+    """
+    Compile metadata filters into a Chroma ``where`` clause.
+
+    Scalar values become ``$eq`` conditions and list values ``$in``
+    conditions, combined with ``$and`` so Chroma prunes candidates with its
+    metadata index before vector scoring. Filters that already use Chroma
+    operators are returned unchanged.
+
+    Args:
+        filters: Mapping of metadata field names to expected values
+
+    Returns:
+        The Chroma where clause
+    """
+    if any(name.startswith("$") for name in filters):
+        return filters
+    conditions = []
+    for name, value in filters.items():
+        if isinstance(value, dict):
+            condition = value
+        elif isinstance(value, (list, tuple)):
+            condition = {"$in": list(value)}
+        else:
+            condition = {"$eq": value}
+        conditions.append({name: condition})
+    # Chroma requires at least two operands for $and
+    return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert nested search kwargs into a hashable cache key."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(v)) for key, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class ChromaVectorStore(IVectorStore):
     """
     Vector store implementation using Chroma as the backend.
@@ -23,11 +71,26 @@ class ChromaVectorStore(IVectorStore):
     """
 
     DEFAULT_COLLECTION_NAME = "langchain"
+    # Default number of documents embedded and upserted per Chroma write.
+    # Keeps each write to a single transaction well under Chroma's max batch
+    # size; Chroma recommends staying at or below 250.
+    ADD_BATCH_SIZE = 100
+    # Read-only default so retrievers built without search kwargs share it
+    DEFAULT_SEARCH_KWARGS = MappingProxyType({"k": 10})
+    # Candidates fetched per result before MMR re-ranking
+    MMR_FETCH_MULTIPLIER = 4
+    # Vectors are normalized before they reach Chroma, so new collections
+    # rank by inner product, which equals cosine similarity on unit vectors
+    COLLECTION_METADATA = MappingProxyType({"hnsw:space": "ip"})
+    # Number of retrievers kept per store, keyed by search type and kwargs
+    RETRIEVER_CACHE_SIZE = 128
 
     def __init__(
         self,
         persist_directory: str = "cache/db/chroma",
         collection_name: str = DEFAULT_COLLECTION_NAME,
+        batch_size: int = ADD_BATCH_SIZE,
+        quantization: QuantizationPrecision = "none",
     ):
         """
         Initialize Chroma vector store.
@@ -35,12 +98,46 @@ class ChromaVectorStore(IVectorStore):
         Args:
             persist_directory: Directory to persist the Chroma database
             collection_name: Name of the collection in Chroma
+            batch_size: Number of documents written to Chroma per call
+            quantization: Precision of the in-memory index used by similarity
+                retrievers ("int8" or "binary"), or "none" to search Chroma's
+                full-precision index directly
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if quantization not in ("none", "int8", "binary"):
+            raise ValueError(f"Unsupported quantization: {quantization}")
+
         self.persist_directory = Path(persist_directory)
         self.persist_directory.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.quantization = quantization
 
-        self.collection_name = collection_name
+        self._collection_name = collection_name
         self._vectorstore = None  # Lazy initialization
+        # Wraps the embeddings passed in by callers; set with _vectorstore
+        self._embedding_function: Optional[NormalizedEmbeddings] = None
+        self._quantized_index: Optional[QuantizedIndex] = None  # Built on first query
+        self._retrievers: LRUCache = LRUCache(maxsize=self.RETRIEVER_CACHE_SIZE)
+
+    def set_collection(self, name: str, metadata: Dict):
+        """
+        Switch the Chroma collection used by this store.
+
+        Chroma collections are schemaless, so the metadata schema is unused.
+
+        Args:
+            name: Name of the collection in Chroma
+            metadata: Metadata field annotations for the collection
+        """
+        if name != self._collection_name:
+            self._collection_name = name
+            self._vectorstore = None
+            self._reset_search_state()
+
+    @property
+    def collection_name(self) -> str:
+        return self._collection_name
 
     def _initialize(self, embeddings: Embeddings) -> VectorStore:
         """
@@ -55,7 +152,7 @@ class ChromaVectorStore(IVectorStore):
         # Initialize Chroma only when needed, requires embedding function
         if (
             self._vectorstore is None
-            or self._vectorstore._embedding_function != embeddings
+            or self._embedding_function.embeddings != embeddings
         ):
             if self._vectorstore is not None:
                 logger.warn("Reinitializing Chroma DB with new embedding function.")
@@ -64,11 +161,15 @@ class ChromaVectorStore(IVectorStore):
                 f"Initializing Chroma DB for collection: {self.collection_name}..."
             )
             try:
+                self._reset_search_state()
+                embedding_function = NormalizedEmbeddings(embeddings)
                 self._vectorstore = Chroma(
                     collection_name=self.collection_name,
-                    embedding_function=embeddings,
+                    embedding_function=embedding_function,
                     persist_directory=str(self.persist_directory.resolve()),
+                    collection_metadata=dict(self.COLLECTION_METADATA),
                 )
+                self._embedding_function = embedding_function
                 logger.info(f"Chroma DB initialized at: {self.persist_directory}")
             except Exception as e:
                 logger.error(f"Failed to initialize Chroma DB: {str(e)}")
@@ -108,25 +209,59 @@ class ChromaVectorStore(IVectorStore):
         )
         try:
             instance = self.get_vectorstore(embeddings)
-            uuids = instance.add_documents(documents)
+            # Upserted records keep their IDs, so the memmapped vectors must
+            # be dropped before writing rather than detected as stale later
+            QuantizedIndex.invalidate_cache(self._quantized_cache_dir())
+            uuids = []
+            for start in range(0, len(documents), self.batch_size):
+                batch = documents[start : start + self.batch_size]
+                uuids.extend(self._add_batch(instance, batch))
+            # The quantized copy no longer covers every vector
+            self._reset_search_state()
             logger.info(f"Documents added: {len(uuids)}")
         except Exception as e:
             logger.error(f"Failed to add documents: {str(e)}")
             raise RuntimeError(f"Failed to add documents: {str(e)}") from e
 
+    def _add_batch(self, instance: VectorStore, batch: List[Document]) -> List[str]:
+        """
+        Write a single batch to Chroma, retrying once on failure.
+
+        IDs are fixed before the first attempt, so a retry upserts the same
+        records instead of duplicating any that were already written.
+
+        Args:
+            instance: The initialized Chroma vector store
+            batch: The documents to write
+
+        Returns:
+            The IDs of the written documents
+        """
+        ids = [doc.id or str(uuid.uuid4()) for doc in batch]
+        try:
+            return instance.add_documents(batch, ids=ids)
+        except Exception as e:
+            logger.warning(f"Retrying Chroma batch of {len(batch)} documents: {e}")
+            return instance.add_documents(batch, ids=ids)
+
     def as_retriever(
         self,
         embeddings: Embeddings,
         search_type: str = "similarity",
-        search_kwargs: Optional[Dict[str, Any]] = None,
+        search_kwargs: Optional[Union[Mapping[str, Any], SearchKwargs]] = None,
     ) -> BaseRetriever:
         """
         Returns a LangChain retriever configured for this vector store.
 
+        Retrievers are cached per search type and search kwargs until the
+        collection, embedding model or stored documents change.
+
         Args:
             embeddings: The LangChain Embeddings object to use.
             search_type: The type of search to perform (e.g., "similarity", "mmr").
-            search_kwargs: Dictionary of keyword arguments for the search (e.g., {"k": 4}).
+            search_kwargs: Keyword arguments for the search (e.g., {"k": 4}) or
+                SearchKwargs. Metadata filters are compiled into a Chroma where
+                clause.
 
         Returns:
             A configured LangChain BaseRetriever instance.
@@ -134,12 +269,67 @@ class ChromaVectorStore(IVectorStore):
         Raises:
             Exception: If the retriever cannot be created.
         """
-        logger.info(
-            f"Creating retriever for Chroma collection '{self.collection_name}' with search_type '{search_type}'..."
-        )
         try:
             vs = self.get_vectorstore(embeddings)
-            search_kwargs = search_kwargs or {"k": 10}  # Default to retrieve top 4
-            return vs.as_retriever(search_type=search_type, search_kwargs=search_kwargs)
+            search_kwargs = self._chroma_search_kwargs(
+                search_kwargs or self.DEFAULT_SEARCH_KWARGS, search_type
+            )
+            key = (search_type, _freeze(search_kwargs))
+            retriever = self._retrievers.get(key)
+            if retriever is None:
+                retriever = self._build_retriever(vs, search_type, search_kwargs)
+                self._retrievers[key] = retriever
+            return retriever
         except Exception as e:
             raise RuntimeError(f"Failed to create retriever: {str(e)}") from e
+
+    def _build_retriever(
+        self, vs: Chroma, search_type: str, search_kwargs: Dict[str, Any]
+    ) -> BaseRetriever:
+        """Create a retriever over the initialized Chroma vector store."""
+        logger.info(
+            f"Creating retriever for Chroma collection '{self.collection_name}' with search_type '{search_type}'..."
+        )
+        if (
+            self.quantization != "none"
+            and search_type == "similarity"
+            and search_kwargs.keys() <= {"k"}
+        ):
+            if self._quantized_index is None:
+                self._quantized_index = QuantizedIndex.from_vectorstore(
+                    vs, self.quantization, cache_dir=self._quantized_cache_dir()
+                )
+            return QuantizedRetriever(
+                vectorstore=vs,
+                embeddings=self._embedding_function,
+                index=self._quantized_index,
+                k=search_kwargs.get("k", self.DEFAULT_SEARCH_KWARGS["k"]),
+            )
+        return vs.as_retriever(search_type=search_type, search_kwargs=search_kwargs)
+
+    def _quantized_cache_dir(self) -> Path:
+        """Directory of the quantized index's memmapped vectors."""
+        return self.persist_directory / "quantized" / self.collection_name
+
+    def _reset_search_state(self):
+        """
+        Drop the quantized index and cached retrievers, which are bound to the
+        current collection and its contents.
+        """
+        self._quantized_index = None
+        self._retrievers.clear()
+
+    def _chroma_search_kwargs(
+        self, search_kwargs: Union[Mapping[str, Any], SearchKwargs], search_type: str
+    ) -> Dict[str, Any]:
+        """Translate search kwargs into the form LangChain's Chroma expects."""
+        if isinstance(search_kwargs, SearchKwargs):
+            search_kwargs = {"k": search_kwargs.k, "filter": search_kwargs.filters}
+        compiled = {key: v for key, v in search_kwargs.items() if key != "filter"}
+        filters = search_kwargs.get("filter")
+        if filters:
+            compiled["filter"] = _compile_filter(filters)
+        if search_type == "mmr":
+            k = compiled.get("k", self.DEFAULT_SEARCH_KWARGS["k"])
+            compiled.setdefault("fetch_k", k * self.MMR_FETCH_MULTIPLIER)
+        return compiled
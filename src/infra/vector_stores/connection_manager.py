@@ -0,0 +1,66 @@
+"""
+Weaviate Connection Manager
+---------------------------
+
+This module hands out process-wide Weaviate clients keyed by host, so every
+vector store (and the search and indexing tools built on them) shares one
+HTTP connection pool and gRPC channel instead of connecting per instance.
+The v4 client is thread-safe, and gRPC multiplexes concurrent calls as HTTP/2
+streams over its one channel, so a single client serves concurrent queries.
+"""
+
+import atexit
+import logging
+import threading
+from typing import Dict, Tuple
+
+import weaviate
+from weaviate import WeaviateClient
+
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+_clients: Dict[Tuple[str, str], WeaviateClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_weaviate_client(http_host: str, grpc_host: str) -> WeaviateClient:
+    """
+    Return the shared client for a Weaviate deployment, connecting on first
+    use or if the previous connection was closed.
+
+    Args:
+        http_host: Host of the Weaviate HTTP API
+        grpc_host: Host of the Weaviate gRPC API
+
+    Returns:
+        The connected Weaviate client
+    """
+    key = (http_host, grpc_host)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None or not client.is_connected():
+            logger.info(f"Connecting to Weaviate at {http_host}...")
+            client = weaviate.connect_to_custom(
+                http_host=http_host,
+                grpc_host=grpc_host,
+                grpc_port=50051,
+                http_port=80,
+                grpc_secure=False,
+                http_secure=False,
+            )
+            _clients[key] = client
+    return client
+
+
+@atexit.register
+def close_weaviate_clients() -> None:
+    """
+    Close every shared Weaviate client.
+    """
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
@@ -0,0 +1,471 @@
+"""
+FAISS Vector Store
+------------------
+
+This module provides a local vector store backed by a FAISS IVF+PQ index.
+
+Queries only probe a few inverted-list cells and compare product-quantized
+codes through lookup tables, then the shortlist is rescored against the
+full-precision vectors. Until a collection holds enough vectors to train the
+quantizers it is served from an exact flat index.
+
+Each collection is persisted as ``index.faiss`` (the FAISS index) next to
+``index.pkl`` (the documents, in FAISS id order) and ``vectors.wal``. Adds
+are saved incrementally: documents are appended to ``index.pkl`` as one
+pickled batch per call, and vectors are appended to the write-ahead log. The
+index itself is only rewritten when it is retrained or the log has grown past
+a fraction of it; loading replays the log on top of the saved index.
+
+FAISS is an optional dependency, installed with the ``faiss`` extra.
+"""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import faiss
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS as LCFaiss
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.vectorstores import VectorStore
+from pydantic import ConfigDict
+
+from infra.embeddings.normalization import NormalizedEmbeddings
+from infra.vector_stores.models import FilterValueType, IVectorStore, SearchKwargs
+
+
+logger = logging.getLogger(__name__)
+
+# Shared default used when callers pass no search kwargs; only read, never
+# mutated, so one instance serves every retriever
+_DEFAULT_SEARCH_KWARGS = SearchKwargs()
+
+# Extra candidates fetched per requested result when metadata filters are
+# applied after the ANN search
+_FILTER_OVERSAMPLE = 10
+
+
+def _matches(metadata: Dict[str, Any], filters: Dict[str, FilterValueType]) -> bool:
+    """
+    Check a document's metadata against search filters.
+
+    Scalar filter values must be equal; list values match if any element is
+    equal to (or contained in) the metadata value.
+    """
+    for name, expected in filters.items():
+        value = metadata.get(name)
+        if isinstance(expected, (list, tuple)):
+            values = value if isinstance(value, (list, tuple)) else [value]
+            if not any(v in expected for v in values):
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+# Size of the write-ahead log header, which holds the id of its first vector
+_WAL_HEADER_BYTES = 8
+
+
+class _FaissCollection:
+    """A FAISS index plus the documents it indexes, in id order."""
+
+    def __init__(
+        self, index: faiss.Index, documents: List[Document], saved_ntotal: int = 0
+    ):
+        self.index = index
+        self.documents = documents
+        # Vectors held by the saved index file; later ones are in the log.
+        # None forces the next save to rewrite the index
+        self.saved_ntotal: Optional[int] = saved_ntotal
+
+
+def _load_documents(path: Path) -> List[Document]:
+    """
+    Read the document batches appended to a collection's pickle file.
+
+    A batch torn by an interrupted write is truncated away, so later batches
+    can be appended after the last complete one.
+    """
+    documents: List[Document] = []
+    with open(path, "rb+") as f:
+        end = 0
+        while True:
+            try:
+                documents.extend(pickle.load(f))
+            except EOFError:
+                break
+            except pickle.UnpicklingError:
+                logger.warning(f"Dropping a partially written batch from {path}")
+                f.truncate(end)
+                break
+            end = f.tell()
+    return documents
+
+
+def _truncate_index(index: faiss.Index, ntotal: int):
+    """
+    Remove the vectors with ids from ntotal on, which are the newest ones.
+
+    IndexRefine does not implement remove_ids, so its IVF+PQ base and flat
+    refine indexes are truncated separately.
+    """
+    selector = faiss.IDSelectorRange(ntotal, index.ntotal)
+    if isinstance(index, faiss.IndexRefine):
+        faiss.downcast_index(index.base_index).remove_ids(selector)
+        faiss.downcast_index(index.refine_index).remove_ids(selector)
+        index.ntotal = ntotal
+    else:
+        index.remove_ids(selector)
+
+
+class FaissRetriever(BaseRetriever):
+    """
+    Retriever over a FAISS collection with optional metadata post-filtering.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    collection: Optional[Any] = None
+    embeddings: Embeddings
+    k: int = 10
+    filters: Optional[Dict[str, FilterValueType]] = None
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        if self.collection is None:
+            return []
+        index, documents = self.collection.index, self.collection.documents
+
+        query_vector = np.asarray([self.embeddings.embed_query(query)], dtype="float32")
+        faiss.normalize_L2(query_vector)
+        n = self.k * _FILTER_OVERSAMPLE if self.filters else self.k
+        _, ids = index.search(query_vector, min(n, index.ntotal))
+
+        results = []
+        for i in ids[0]:
+            if i < 0:
+                continue
+            doc = documents[i]
+            if self.filters and not _matches(doc.metadata, self.filters):
+                continue
+            results.append(doc)
+            if len(results) == self.k:
+                break
+        return results
+
+
+class FaissVectorStore(IVectorStore):
+    """
+    Vector store implementation using a local FAISS IVF+PQ index.
+
+    This class implements the IVectorStore interface. Vectors are L2
+    normalized and compared by inner product, i.e. cosine similarity.
+    """
+
+    DEFAULT_COLLECTION_NAME = "langchain"
+    # The index file is rewritten once the write-ahead log holds more than
+    # this fraction of the vectors in it
+    CHECKPOINT_RATIO = 0.25
+
+    def __init__(
+        self,
+        persist_directory: str = "cache/db/faiss",
+        collection_name: str = DEFAULT_COLLECTION_NAME,
+        nlist: int = 1024,
+        pq_m: int = 64,
+        nprobe: int = 16,
+        rescore_factor: int = 4,
+        train_size: int = 100_000,
+    ):
+        """
+        Initialize the FAISS vector store.
+
+        Args:
+            persist_directory: Directory to persist the FAISS indexes
+            collection_name: Name of the collection
+            nlist: Number of IVF cells
+            pq_m: Number of product-quantizer sub-vectors; must divide the
+                embedding dimension
+            nprobe: Number of IVF cells probed per query
+            rescore_factor: Candidates rescored in full precision per result
+            train_size: Maximum number of vectors used to train the index
+        """
+        self.persist_directory = Path(persist_directory)
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+
+        self.nlist = nlist
+        self.pq_m = pq_m
+        self.nprobe = nprobe
+        self.rescore_factor = rescore_factor
+        self.train_size = train_size
+
+        self._collection_name = collection_name
+        self._collection: Optional[_FaissCollection] = None  # Lazy loading
+
+    @property
+    def collection_name(self) -> str:
+        return self._collection_name
+
+    def set_collection(self, name: str, metadata: Dict):
+        """
+        Switch the FAISS collection used by this store.
+
+        FAISS stores no metadata schema, so the metadata is unused.
+
+        Args:
+            name: Name of the collection
+            metadata: Metadata field annotations for the collection
+        """
+        if name != self._collection_name:
+            self._collection_name = name
+            self._collection = None
+
+    @property
+    def _collection_dir(self) -> Path:
+        return self.persist_directory / self._collection_name
+
+    @property
+    def _min_train_size(self) -> int:
+        # FAISS warns below 39 training points per IVF cell, and each 8-bit
+        # PQ codebook needs at least one point per centroid
+        return max(self.nlist * 39, 256)
+
+    def _load(self) -> Optional[_FaissCollection]:
+        if self._collection is None:
+            index_path = self._collection_dir / "index.faiss"
+            if index_path.exists():
+                logger.info(f"Loading FAISS collection: {self._collection_name}...")
+                index = self._configure(faiss.read_index(str(index_path)))
+                documents = _load_documents(self._collection_dir / "index.pkl")
+                collection = _FaissCollection(index, documents, index.ntotal)
+                if index.ntotal > len(documents):
+                    # The index was rewritten but its last batch of documents
+                    # never appended; drop the orphaned vectors and save again
+                    logger.warning(
+                        f"Dropping {index.ntotal - len(documents)} vectors "
+                        f"without documents from {index_path}"
+                    )
+                    _truncate_index(index, len(documents))
+                    collection.saved_ntotal = None
+                self._replay_log(collection)
+                self._collection = collection
+        return self._collection
+
+    def _replay_log(self, collection: _FaissCollection):
+        """Add the vectors logged since the index was saved to the index."""
+        wal_path = self._collection_dir / "vectors.wal"
+        if not wal_path.exists():
+            return
+        data = wal_path.read_bytes()
+        index = collection.index
+        start = int.from_bytes(data[:_WAL_HEADER_BYTES], "little")
+        rows = (len(data) - _WAL_HEADER_BYTES) // (4 * index.d)
+        vectors = np.frombuffer(
+            data, dtype="float32", count=rows * index.d, offset=_WAL_HEADER_BYTES
+        ).reshape(rows, index.d)
+        # Skip vectors the saved index already holds, and any whose documents
+        # were never written
+        vectors = vectors[index.ntotal - start :][
+            : len(collection.documents) - index.ntotal
+        ]
+        if len(vectors):
+            index.add(vectors)
+        if start + rows != index.ntotal:
+            # The log does not end at the last document; start a fresh one
+            collection.saved_ntotal = None
+
+    def _persist(
+        self, documents: List[Document], vectors: np.ndarray, rewrite_index: bool
+    ):
+        """
+        Save a batch of added documents and their vectors.
+
+        Args:
+            documents: The documents just added
+            vectors: Their normalized vectors
+            rewrite_index: Whether the index must be rewritten, e.g. because
+                it was retrained
+        """
+        collection = self._collection
+        self._collection_dir.mkdir(parents=True, exist_ok=True)
+
+        saved = collection.saved_ntotal
+        logged = collection.index.ntotal - (saved or 0)
+        if rewrite_index or saved is None or logged > self.CHECKPOINT_RATIO * saved:
+            # If the documents below are never appended, loading truncates
+            # the rewritten index back to the saved documents
+            self._write_index()
+        else:
+            # Vectors are logged before their documents, so replay never
+            # finds a document without its vector
+            with open(self._collection_dir / "vectors.wal", "ab") as f:
+                f.write(vectors.tobytes())
+        with open(self._collection_dir / "index.pkl", "ab") as f:
+            pickle.dump(documents, f)
+
+    def _write_index(self):
+        """Rewrite the index file and start an empty write-ahead log."""
+        collection = self._collection
+        index_path = self._collection_dir / "index.faiss"
+        tmp_path = index_path.with_name("index.faiss.tmp")
+        faiss.write_index(collection.index, str(tmp_path))
+        os.replace(tmp_path, index_path)
+        ntotal = collection.index.ntotal
+        (self._collection_dir / "vectors.wal").write_bytes(
+            ntotal.to_bytes(_WAL_HEADER_BYTES, "little")
+        )
+        collection.saved_ntotal = ntotal
+
+    def _configure(self, index: faiss.Index) -> faiss.Index:
+        """Apply the query-time parameters to an IVF+PQ index."""
+        if isinstance(index, faiss.IndexRefine):
+            index.k_factor = self.rescore_factor
+            faiss.downcast_index(index.base_index).nprobe = self.nprobe
+        return index
+
+    def _build_ivfpq(self, vectors: np.ndarray) -> faiss.Index:
+        """
+        Train an IVF+PQ index, with full-precision rescoring, on the vectors.
+        """
+        dim = vectors.shape[1]
+        if dim % self.pq_m:
+            raise ValueError(
+                f"pq_m ({self.pq_m}) must divide the embedding dimension ({dim})"
+            )
+        logger.info(
+            f"Training IVF{self.nlist},PQ{self.pq_m} index on "
+            f"{min(len(vectors), self.train_size)} vectors..."
+        )
+        quantizer = faiss.IndexFlatIP(dim)
+        base = faiss.IndexIVFPQ(
+            quantizer, dim, self.nlist, self.pq_m, 8, faiss.METRIC_INNER_PRODUCT
+        )
+        index = faiss.IndexRefineFlat(base)
+        index.train(vectors[: self.train_size])
+        index.add(vectors)
+        return self._configure(index)
+
+    def get_vectorstore(self, embeddings: Embeddings) -> VectorStore:
+        """
+        Wrap the collection in a LangChain FAISS vector store.
+
+        The wrapper searches this store's index and documents. Documents must
+        still be added through add_documents() to be persisted.
+
+        Args:
+            embeddings: The LangChain Embeddings object to use.
+
+        Returns:
+            A LangChain FAISS VectorStore over the collection.
+        """
+        collection = self._load()
+        if collection is None:
+            # Nothing indexed yet; the embedding size fixes the dimension
+            dim = len(embeddings.embed_query(self.collection_name))
+            collection = _FaissCollection(faiss.IndexFlatIP(dim), [], None)
+            self._collection = collection
+        return LCFaiss(
+            # The index holds unit vectors, so queries are normalized too
+            embedding_function=NormalizedEmbeddings(embeddings),
+            index=collection.index,
+            docstore=InMemoryDocstore(
+                {str(i): doc for i, doc in enumerate(collection.documents)}
+            ),
+            index_to_docstore_id={i: str(i) for i in range(len(collection.documents))},
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+        )
+
+    def add_documents(self, documents: List[Document], embeddings: Embeddings) -> None:
+        """
+        Embeds and adds documents to the FAISS collection.
+
+        Args:
+            documents: A list of LangChain Document objects to add.
+            embeddings: The LangChain Embeddings object to use for embedding.
+
+        Raises:
+            RuntimeError: If adding documents fails.
+        """
+        if not documents:
+            logger.warning("No documents to add.")
+            return
+
+        logger.info(
+            f"Adding {len(documents)} documents to FAISS collection "
+            f"'{self.collection_name}'..."
+        )
+        try:
+            vectors = np.asarray(
+                embeddings.embed_documents([d.page_content for d in documents]),
+                dtype="float32",
+            )
+            faiss.normalize_L2(vectors)
+
+            collection = self._load()
+            if collection is None:
+                collection = _FaissCollection(
+                    faiss.IndexFlatIP(vectors.shape[1]), [], None
+                )
+                self._collection = collection
+
+            # FAISS assigns sequential ids, so a document's id is its position
+            collection.index.add(vectors)
+            collection.documents.extend(documents)
+
+            index = collection.index
+            retrained = isinstance(index, faiss.IndexFlat) and (
+                index.ntotal >= self._min_train_size
+            )
+            if retrained:
+                # Enough vectors to train the quantizers; rebuild in id order
+                collection.index = self._build_ivfpq(
+                    index.reconstruct_n(0, index.ntotal)
+                )
+
+            self._persist(documents, vectors, rewrite_index=retrained)
+            logger.info(f"Documents added: {len(documents)}")
+        except Exception as e:
+            logger.error(f"Failed to add documents: {str(e)}")
+            raise RuntimeError(f"Failed to add documents: {str(e)}") from e
+
+    def as_retriever(
+        self,
+        embeddings: Embeddings,
+        search_type: str = "similarity",
+        search_kwargs: Optional[SearchKwargs] = None,
+    ) -> BaseRetriever:
+        """
+        Returns a LangChain retriever configured for this vector store.
+
+        Args:
+            embeddings: The LangChain Embeddings object to use.
+            search_type: The type of search to perform; only "similarity".
+            search_kwargs: The number of results and metadata filters.
+
+        Returns:
+            A configured LangChain BaseRetriever instance.
+
+        Raises:
+            RuntimeError: If the retriever cannot be created.
+        """
+        logger.info(
+            f"Creating retriever for FAISS collection '{self.collection_name}'..."
+        )
+        if search_type != "similarity":
+            raise RuntimeError(f"Unsupported search type for FAISS: {search_type}")
+        search_kwargs = search_kwargs or _DEFAULT_SEARCH_KWARGS
+        return FaissRetriever(
+            collection=self._load(),
+            embeddings=embeddings,
+            k=search_kwargs.k,
+            filters=search_kwargs.filters,
+        )
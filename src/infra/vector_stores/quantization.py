@@ -0,0 +1,315 @@
+"""
+Quantized Retrieval
+-------------------
+
+This module provides int8 and binary quantization of stored embeddings, and a
+retriever that searches the compact quantized vectors first and then rescores
+a small shortlist against the full-precision vectors.
+
+Scanning int8 codes moves a quarter of the bytes of fp32 vectors, and packed
+binary codes a thirty-second, while rescoring the oversampled shortlist in
+full precision recovers almost all of the ranking quality.
+
+When given a cache directory, the index also keeps the fp32 vectors in a
+``vectors.f32.memmap`` file next to ``ids.npy`` (the Chroma IDs, in row
+order). Rescoring then reads just the shortlisted rows through the OS page
+cache instead of fetching their embeddings from Chroma, and later processes
+reuse the file while the collection's IDs are unchanged. Chroma upserts by
+ID, so matching IDs do not prove the vectors are current: writers must call
+``QuantizedIndex.invalidate_cache()`` before changing the collection.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import List, Literal, Optional, Sequence
+
+import numpy as np
+from langchain_chroma import Chroma
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict
+
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+QuantizationPrecision = Literal["none", "int8", "binary"]
+
+# Number of set bits in every possible byte, used for Hamming distances
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def calibration_ranges(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Compute the per-dimension value ranges used for int8 quantization.
+
+    Args:
+        embeddings: Full-precision embeddings of shape (n, dim)
+
+    Returns:
+        Array of shape (2, dim) holding the minimum and maximum per dimension
+    """
+    return np.vstack([embeddings.min(axis=0), embeddings.max(axis=0)])
+
+
+def quantize_embeddings(
+    embeddings: np.ndarray,
+    precision: Literal["int8", "binary"],
+    ranges: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Quantize full-precision embeddings to int8 codes or packed bits.
+
+    Args:
+        embeddings: Full-precision embeddings of shape (n, dim) or (dim,)
+        precision: "int8" for scalar quantization, "binary" for sign bits
+        ranges: Calibration ranges from calibration_ranges(), required for int8
+
+    Returns:
+        int8 codes of the same shape, or uint8 packed bits for binary
+    """
+    if precision == "binary":
+        return np.packbits(embeddings > 0, axis=-1)
+    if precision == "int8":
+        if ranges is None:
+            raise ValueError("int8 quantization requires calibration ranges")
+        low = ranges[0]
+        steps = np.where(ranges[1] > low, (ranges[1] - low) / 255, 1.0)
+        codes = np.clip(np.round((embeddings - low) / steps) - 128, -128, 127)
+        return codes.astype(np.int8)
+    raise ValueError(f"Unsupported quantization precision: {precision}")
+
+
+class QuantizedIndex:
+    """
+    In-memory quantized copy of the vectors stored in a vector store.
+    """
+
+    VECTORS_FILE = "vectors.f32.memmap"
+    IDS_FILE = "ids.npy"
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        codes: np.ndarray,
+        precision: Literal["int8", "binary"],
+        ranges: Optional[np.ndarray] = None,
+        vectors: Optional[np.ndarray] = None,
+    ):
+        self.ids = list(ids)
+        self.codes = codes
+        self.precision = precision
+        self.ranges = ranges
+        # Full-precision vectors in the same row order as ids, usually a
+        # read-only memmap; None if rescoring must fetch them from Chroma
+        self.vectors = vectors
+
+    @classmethod
+    def from_vectorstore(
+        cls,
+        vectorstore: Chroma,
+        precision: Literal["int8", "binary"],
+        cache_dir: Optional[Path] = None,
+    ) -> "QuantizedIndex":
+        """
+        Build an index from every vector stored in a Chroma vector store.
+
+        Args:
+            vectorstore: The LangChain Chroma vector store
+            precision: The quantization precision
+            cache_dir: Directory for the memmapped fp32 vectors, or None to
+                keep no full-precision copy
+
+        Returns:
+            The quantized index
+        """
+        vectors = None
+        if cache_dir is not None and (cache_dir / cls.IDS_FILE).exists():
+            ids = vectorstore.get(include=[])["ids"]
+            vectors = cls._load_vectors(cache_dir, ids)
+        if vectors is None:
+            data = vectorstore.get(include=["embeddings"])
+            ids = data["ids"]
+            vectors = np.asarray(data["embeddings"], dtype=np.float32)
+            if not len(vectors):
+                return cls([], vectors, precision)
+            if cache_dir is not None:
+                vectors = cls._save_vectors(cache_dir, ids, vectors)
+        else:
+            logger.info(f"Reusing memmapped vectors in {cache_dir}")
+
+        ranges = calibration_ranges(vectors) if precision == "int8" else None
+        codes = quantize_embeddings(vectors, precision, ranges)
+        logger.info(f"Built {precision} index over {len(vectors)} vectors")
+        return cls(
+            ids,
+            codes,
+            precision,
+            ranges,
+            vectors=vectors if cache_dir is not None else None,
+        )
+
+    @classmethod
+    def invalidate_cache(cls, cache_dir: Path) -> None:
+        """
+        Mark the memmapped vectors in cache_dir as stale.
+
+        Removing the IDs file makes the next from_vectorstore() fetch every
+        vector from Chroma and rewrite the cache.
+
+        Args:
+            cache_dir: The directory passed to from_vectorstore()
+        """
+        (cache_dir / cls.IDS_FILE).unlink(missing_ok=True)
+
+    @classmethod
+    def _load_vectors(cls, cache_dir: Path, ids: List[str]) -> Optional[np.memmap]:
+        """
+        Open the memmapped vectors if they were written for exactly these IDs.
+        """
+        if not ids or not np.array_equal(np.load(cache_dir / cls.IDS_FILE), ids):
+            return None
+        path = cache_dir / cls.VECTORS_FILE
+        dim, remainder = divmod(path.stat().st_size, 4 * len(ids))
+        if remainder or not dim:
+            return None
+        return np.memmap(path, dtype=np.float32, mode="r", shape=(len(ids), dim))
+
+    @classmethod
+    def _save_vectors(
+        cls, cache_dir: Path, ids: List[str], vectors: np.ndarray
+    ) -> np.memmap:
+        """
+        Write the vectors and their IDs, then reopen the vectors read-only.
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / cls.VECTORS_FILE
+        tmp = path.with_suffix(".tmp")
+        out = np.memmap(tmp, dtype=np.float32, mode="w+", shape=vectors.shape)
+        out[:] = vectors
+        out.flush()
+        del out
+        os.replace(tmp, path)
+        # Written last, so IDs on disk always describe the vectors file
+        ids_tmp = cache_dir / "ids.tmp.npy"
+        np.save(ids_tmp, np.asarray(ids))
+        os.replace(ids_tmp, cache_dir / cls.IDS_FILE)
+        return np.memmap(path, dtype=np.float32, mode="r", shape=vectors.shape)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query: np.ndarray, top_n: int) -> List[str]:
+        """
+        Return the IDs of the top_n closest vectors by quantized score.
+
+        Args:
+            query: The full-precision query embedding
+            top_n: Number of candidates to return
+
+        Returns:
+            Candidate IDs, unordered
+        """
+        return [self.ids[i] for i in self.search_rows(query, top_n)]
+
+    def search_rows(self, query: np.ndarray, top_n: int) -> np.ndarray:
+        """
+        Return the row offsets of the top_n closest vectors by quantized score.
+
+        Args:
+            query: The full-precision query embedding
+            top_n: Number of candidates to return
+
+        Returns:
+            Candidate row offsets, unordered
+        """
+        if self.precision == "binary":
+            query_bits = quantize_embeddings(query, "binary")
+            distances = _POPCOUNT[np.bitwise_xor(self.codes, query_bits)]
+            scores = -distances.sum(axis=1, dtype=np.int32)
+        else:
+            # Asymmetric scoring: the query stays in full precision and is
+            # scaled by the per-dimension step, so ranking by q . x only
+            # needs the raw codes
+            low, high = self.ranges
+            steps = np.where(high > low, (high - low) / 255, 1.0)
+            scores = self.codes @ (query * steps).astype(np.float32)
+
+        top_n = min(top_n, len(self.ids))
+        return np.argpartition(-scores, top_n - 1)[:top_n]
+
+
+class QuantizedRetriever(BaseRetriever):
+    """
+    Retriever that shortlists with a quantized index and rescores in fp32.
+
+    Rescoring uses the inner product, which ranks identically to cosine and
+    L2 distance for normalized embeddings such as OpenAI's.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    vectorstore: Chroma
+    embeddings: Embeddings
+    index: QuantizedIndex
+    k: int = 10
+    rescore_multiplier: int = 4
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        if not len(self.index):
+            return []
+
+        query_embedding = np.asarray(
+            self.embeddings.embed_query(query), dtype=np.float32
+        )
+        if self.index.vectors is not None:
+            return self._rescore_memmapped(query_embedding)
+
+        candidates = self.index.search(
+            query_embedding, self.k * self.rescore_multiplier
+        )
+        data = self.vectorstore.get(
+            ids=candidates, include=["embeddings", "documents", "metadatas"]
+        )
+        vectors = np.asarray(data["embeddings"], dtype=np.float32)
+        scores = np.einsum("d,nd->n", query_embedding, vectors)
+
+        return [
+            Document(
+                id=data["ids"][i],
+                page_content=data["documents"][i],
+                metadata=data["metadatas"][i] or {},
+            )
+            for i in np.argsort(-scores)[: self.k]
+        ]
+
+    def _rescore_memmapped(self, query_embedding: np.ndarray) -> List[Document]:
+        """
+        Rescore the shortlist against the index's memmapped fp32 vectors, then
+        fetch only the top k documents from Chroma.
+        """
+        # Sorted offsets read the file front to back
+        rows = np.sort(
+            self.index.search_rows(query_embedding, self.k * self.rescore_multiplier)
+        )
+        scores = self.index.vectors[rows] @ query_embedding
+        top_ids = [self.index.ids[i] for i in rows[np.argsort(-scores)[: self.k]]]
+
+        data = self.vectorstore.get(ids=top_ids, include=["documents", "metadatas"])
+        # Chroma does not return records in the requested order
+        rank = {id_: i for i, id_ in enumerate(top_ids)}
+        order = sorted(range(len(data["ids"])), key=lambda i: rank[data["ids"][i]])
+        return [
+            Document(
+                id=data["ids"][i],
+                page_content=data["documents"][i],
+                metadata=data["metadatas"][i] or {},
+            )
+            for i in order
+        ]
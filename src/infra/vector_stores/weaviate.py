@@ -1,21 +1,48 @@
+import asyncio
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from functools import reduce
-from typing import Any, Dict, List, Optional, Union, get_args, get_origin
+from functools import lru_cache, partial, reduce
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 from uuid import UUID
 
-import weaviate
+import orjson
 import weaviate.classes.query as wvq
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.vectorstores import VectorStore
 from langchain_weaviate.vectorstores import WeaviateVectorStore as LCWeaviate
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from weaviate import WeaviateClient
-from weaviate.classes.config import DataType, Property
+from weaviate.classes.config import (
+    Configure,
+    DataType,
+    Property,
+    VectorDistances,
+)
+from weaviate.classes.data import DataObject
+from weaviate.util import get_valid_uuid
 
 from infra.config.settings import get_settings
+from infra.vector_stores.connection_manager import get_weaviate_client
 from infra.vector_stores.models import (
     FilterValuesTypeList,
     FilterValueType,
@@ -26,6 +53,99 @@ from infra.vector_stores.models import (
 
 logger = logging.getLogger(__name__)
 
+# Shared default used when callers pass no search kwargs; only read, never
+# mutated, so one instance serves every retriever
+_DEFAULT_SEARCH_KWARGS = SearchKwargs()
+
+# Schemas already ensured in this process, keyed by (client id, collection,
+# properties); stores share clients, so each schema is checked exactly once
+_ensured_schemas: Set[Tuple[int, str, FrozenSet[Tuple[str, str]]]] = set()
+_ensured_schemas_lock = threading.Lock()
+
+
+def _content_uuid(properties: Dict[str, Any]) -> str:
+    """
+    Derive a deterministic UUID from an object's properties.
+
+    The properties are serialized canonically with orjson and hashed with
+    BLAKE2b, which is cheaper than repr() plus SHA-1 (uuid5) on long chunks.
+    The hash is stamped as an RFC 9562 version 8 (custom) UUID.
+    """
+    payload = orjson.dumps(properties, default=str, option=orjson.OPT_SORT_KEYS)
+    digest = bytearray(hashlib.blake2b(payload, digest_size=16).digest())
+    digest[6] = (digest[6] & 0x0F) | 0x80
+    digest[8] = (digest[8] & 0x3F) | 0x80
+    return str(UUID(bytes=bytes(digest)))
+
+
+@lru_cache(maxsize=256)
+def _compile_filters(conditions: Tuple[Tuple[str, Any, bool], ...]):
+    """
+    Build the Weaviate filter for frozen (name, value, is_list) conditions.
+
+    Agents repeat the same metadata filters across searches, so compiled
+    filter trees are memoized instead of rebuilt on every retriever.
+    """
+    weaviate_filter_conditions = []
+    for prop_name, prop_value, is_list in conditions:
+        prop_filter_builder = wvq.Filter.by_property(prop_name)
+        if is_list:
+            weaviate_filter_conditions.append(
+                prop_filter_builder.contains_any(list(prop_value))
+            )
+        else:
+            weaviate_filter_conditions.append(prop_filter_builder.equal(prop_value[1]))
+
+    return reduce(lambda a, b: a & b, weaviate_filter_conditions)
+
+
+class WeaviateRetriever(BaseRetriever):
+    """
+    Retriever that runs hybrid searches inside Weaviate.
+
+    Hybrid search fuses BM25 and vector scores server-side, with the query
+    embedded once on the client. Only the final k objects' properties cross
+    the wire.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    collection: Any
+    embeddings: Embeddings
+    text_key: str
+    k: int = 10
+    filters: Optional[Any] = None
+    alpha: float = 0.5
+
+    def _search(self, query: str, vector: List[float]) -> List[Document]:
+        response = self.collection.query.hybrid(
+            query=query,
+            vector=vector,
+            alpha=self.alpha,
+            limit=self.k,
+            filters=self.filters,
+        )
+
+        documents = []
+        for obj in response.objects:
+            metadata = dict(obj.properties)
+            page_content = metadata.pop(self.text_key, "") or ""
+            documents.append(
+                Document(id=str(obj.uuid), page_content=page_content, metadata=metadata)
+            )
+        return documents
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self._search(query, self.embeddings.embed_query(query))
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        vector = await self.embeddings.aembed_query(query)
+        return await asyncio.to_thread(self._search, query, vector)
+
 
 class WeaviateVectorStore(IVectorStore):
     """Weaviate vector store implementation.
@@ -34,37 +154,75 @@ class WeaviateVectorStore(IVectorStore):
     interacting with a Weaviate vector database.
     """
 
+    # IDs per delete_many filter, keeping each request well under the 4 MB
+    # gRPC message limit
+    DELETE_BATCH_SIZE = 1000
+    # Approximate payload cap per insert_many request; the client already
+    # negotiates the server's gRPC message limit (10 MB by default)
+    MAX_BATCH_BYTES = 8 << 20
+    # Weight of the vector score in hybrid search; 0 is pure BM25
+    HYBRID_ALPHA = 0.5
+    # New collections keep int8 scalar-quantized vectors in their HNSW index,
+    # a quarter of the memory of fp32, and rescore this many candidates
+    # against the original vectors
+    SCALAR_QUANTIZATION = True
+    SQ_RESCORE_LIMIT = 100
+
     def __init__(
         self,
         index_name: str = "langchain",
         client: Any = None,
         text_key: str = "page_content",
+        batch_size: Optional[int] = None,
+        num_workers: Optional[int] = None,
+        insert_retries: Optional[int] = None,
     ):
+        """
+        Initialize the Weaviate vector store.
+
+        Batch settings left as None default to the WEAVIATE_BATCH_SIZE,
+        WEAVIATE_NUM_WORKERS and WEAVIATE_INSERT_RETRIES settings.
+
+        Args:
+            index_name: Name of the Weaviate collection
+            client: Optional connected Weaviate client
+            text_key: Property holding the document text
+            batch_size: Objects sent per gRPC insert_many request
+            num_workers: Number of insert_many requests in flight at once
+            insert_retries: Times objects that fail to insert are retried
+        """
+        if batch_size is None:
+            batch_size = get_settings().WEAVIATE_BATCH_SIZE
+        if num_workers is None:
+            num_workers = get_settings().WEAVIATE_NUM_WORKERS
+        if insert_retries is None:
+            insert_retries = get_settings().WEAVIATE_INSERT_RETRIES
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if num_workers < 1:
+            raise ValueError("num_workers must be a positive integer")
+
+        self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.insert_retries = insert_retries
         self._client = client
         self._collection_name = index_name
         self._text_key = text_key
         self._vectorstore = None  # Lazy loading
-
-    def _close(self):
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        self._embeddings: Optional[Embeddings] = None
+        # (collection, metadata field types) this store has already ensured
+        self._ready_schemas: Set[Tuple[str, FrozenSet[Tuple[str, type]]]] = set()
 
     def _get_client(self) -> WeaviateClient:
         if self._client is None:
-            logger.info("Initializing Weaviate client...")
-            self._client = weaviate.connect_to_custom(
-                http_host=get_settings().WEAVIATE_HTTP_URL,
-                grpc_host=get_settings().WEAVIATE_GRPC_URL,
-                grpc_port=50051,
-                http_port=80,
-                grpc_secure=False,
-                http_secure=False,
+            # Shared across stores; closed by the connection manager at exit
+            self._client = get_weaviate_client(
+                get_settings().WEAVIATE_HTTP_URL, get_settings().WEAVIATE_GRPC_URL
             )
         return self._client
 
     def _initialize(self, embeddings: Embeddings, metadata: Dict = None) -> VectorStore:
-        if self._vectorstore is None:
+        if self._vectorstore is None or self._embeddings is not embeddings:
             logger.info(
                 f"Initializing Weaviate for collection: {self._collection_name}..."
             )
@@ -74,6 +232,7 @@ class WeaviateVectorStore(IVectorStore):
                 text_key=self._text_key,
                 embedding=embeddings,
             )
+            self._embeddings = embeddings
 
         if not metadata:
             return self._vectorstore
@@ -92,14 +251,122 @@ class WeaviateVectorStore(IVectorStore):
             f"Adding {len(documents)} documents to Weaviate collection '{self._collection_name}'..."
         )
         try:
-            instance = self.get_vectorstore(embeddings)
-            uuids = instance.add_documents(documents)
-            logger.info(f"Documents added: {len(uuids)}")
-            self._close()
+            collection = self._get_client().collections.get(self._collection_name)
+            vectors = embeddings.embed_documents([d.page_content for d in documents])
+            objects = [
+                self._data_object(doc, vector)
+                for doc, vector in zip(documents, vectors)
+            ]
+            batches = self._batches(objects)
+            workers = min(self.num_workers, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Consume the results so any failed batch raises here
+                list(executor.map(partial(self._insert_batch, collection), batches))
+            logger.info(f"Documents added: {len(objects)}")
         except Exception as e:
             logger.error(f"Failed to add documents: {str(e)}")
             raise RuntimeError(f"Failed to add documents: {str(e)}") from e
 
+    def _batches(self, objects: List[DataObject]) -> List[List[DataObject]]:
+        """
+        Split objects into insert_many batches of at most batch_size objects
+        and roughly MAX_BATCH_BYTES of payload, so batches of long chunks or
+        high-dimensional vectors stay well under the gRPC message limit.
+        """
+        batches: List[List[DataObject]] = []
+        batch: List[DataObject] = []
+        batch_bytes = 0
+        for obj in objects:
+            # Vectors are sent as packed float32; properties roughly as text
+            size = 4 * len(obj.vector) + sum(
+                len(str(value)) for value in obj.properties.values()
+            )
+            if batch and (
+                len(batch) == self.batch_size
+                or batch_bytes + size > self.MAX_BATCH_BYTES
+            ):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(obj)
+            batch_bytes += size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _insert_batch(self, collection: Any, objects: List[DataObject]) -> None:
+        """
+        Write one batch with a single gRPC insert_many request, retrying only
+        the objects that failed.
+
+        Raises:
+            RuntimeError: If objects still fail after the configured retries
+        """
+        for attempt in range(self.insert_retries + 1):
+            result = collection.data.insert_many(objects)
+            if not result.has_errors:
+                return
+            # Errors are keyed by the object's position in the request
+            objects = [objects[i] for i in result.errors]
+            if attempt < self.insert_retries:
+                logger.warning(f"Retrying {len(objects)} failed Weaviate objects")
+        first = next(iter(result.errors.values()))
+        raise RuntimeError(f"{len(objects)} objects failed to insert: {first.message}")
+
+    def _data_object(self, doc: Document, vector: List[float]) -> DataObject:
+        """
+        Build the Weaviate object for a document and its embedding.
+
+        Documents without an ID get a UUID derived from their properties, so
+        re-indexing the same chunk overwrites it instead of duplicating it.
+        """
+        properties = {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in doc.metadata.items()
+        }
+        properties[self._text_key] = doc.page_content
+        uuid = get_valid_uuid(doc.id) if doc.id else _content_uuid(properties)
+        return DataObject(properties=properties, uuid=uuid, vector=vector)
+
+    def delete(self, ids: List[str]) -> int:
+        """
+        Delete documents by ID with server-side delete_many filters.
+
+        IDs are mapped to UUIDs the same way add_documents maps document IDs,
+        and are sent DELETE_BATCH_SIZE at a time.
+
+        Args:
+            ids: IDs of the documents to delete
+
+        Returns:
+            The number of objects deleted
+
+        Raises:
+            RuntimeError: If deleting documents fails
+        """
+        if not ids:
+            return 0
+
+        logger.info(
+            f"Deleting {len(ids)} documents from Weaviate collection "
+            f"'{self._collection_name}'..."
+        )
+        try:
+            collection = self._get_client().collections.get(self._collection_name)
+            uuids = [get_valid_uuid(i) for i in ids]
+            deleted = 0
+            for i in range(0, len(uuids), self.DELETE_BATCH_SIZE):
+                result = collection.data.delete_many(
+                    where=wvq.Filter.by_id().contains_any(
+                        uuids[i : i + self.DELETE_BATCH_SIZE]
+                    )
+                )
+                deleted += result.successful
+            logger.info(f"Documents deleted: {deleted}")
+            return deleted
+        except Exception as e:
+            logger.error(f"Failed to delete documents: {str(e)}")
+            raise RuntimeError(f"Failed to delete documents: {str(e)}") from e
+
     def as_retriever(
         self,
         embeddings: Embeddings,
@@ -110,13 +377,24 @@ class WeaviateVectorStore(IVectorStore):
             f"Creating retriever for Weaviate collection '{self._collection_name}' with search_type '{search_type}'..."
         )
         try:
+            search_kwargs = search_kwargs or _DEFAULT_SEARCH_KWARGS
+            filters = self._convert_filters_to_where_clause(search_kwargs.filters)
+            if search_type == "hybrid":
+                return WeaviateRetriever(
+                    collection=self._get_client().collections.get(
+                        self._collection_name
+                    ),
+                    embeddings=embeddings,
+                    text_key=self._text_key,
+                    k=search_kwargs.k,
+                    filters=filters,
+                    alpha=self.HYBRID_ALPHA,
+                )
+
             vs = self.get_vectorstore(embeddings)
-            search_kwargs = search_kwargs or SearchKwargs()
             weaviate_kwargs = {"k": search_kwargs.k}
-            if search_kwargs.filters:
-                weaviate_kwargs["filters"] = self._convert_filters_to_where_clause(
-                    search_kwargs.filters
-                )
+            if filters is not None:
+                weaviate_kwargs["filters"] = filters
             return vs.as_retriever(
                 search_type=search_type, search_kwargs=weaviate_kwargs
             )
@@ -127,34 +405,37 @@ class WeaviateVectorStore(IVectorStore):
         """Convert metadata filter to Weaviate v4.x where filter format."""
         if not filters:
             return None
-
-        weaviate_filter_conditions = []
-        for prop_name, prop_value in filters.items():
-            prop_filter_builder = wvq.Filter.by_property(prop_name)
-            if isinstance(prop_value, list):
-                weaviate_filter_conditions.append(
-                    prop_filter_builder.contains_any(prop_value)
-                )
-            else:
-                weaviate_filter_conditions.append(prop_filter_builder.equal(prop_value))
-
-        return reduce(lambda a, b: a & b, weaviate_filter_conditions)
+        # Values are keyed with their types so that e.g. True and 1, which
+        # hash alike, do not share a compiled filter
+        return _compile_filters(
+            tuple(
+                (name, tuple(value), True)
+                if isinstance(value, list)
+                else (name, (type(value), value), False)
+                for name, value in filters.items()
+            )
+        )
 
     def set_collection(self, name: str, metadata: Dict):
-        self._collection_name = name
         self._ensure_class_exists(name, metadata)
-        self._vectorstore = None
+        if name != self._collection_name:
+            self._collection_name = name
+            self._vectorstore = None
 
     @property
     def collection_name(self) -> str:
         return self._collection_name
 
     def _ensure_class_exists(self, collection_name: str, metadata: Dict):
-        # Updated for Weaviate v4.x API
-        existing_classes = list(
-            self._get_client().collections.list_all(simple=True).keys()
+        # Property types only depend on the value types, so repeat calls from
+        # this store return before building any Property models or locking
+        ready_key = (
+            collection_name,
+            frozenset((name, type(value)) for name, value in metadata.items()),
         )
-        class_exists = collection_name in existing_classes
+        if ready_key in self._ready_schemas:
+            return
+
         properties = {
             k: Property(
                 name=k,
@@ -167,23 +448,61 @@ class WeaviateVectorStore(IVectorStore):
             name=self._text_key, data_type=DataType.TEXT
         )
 
-        if not class_exists:
+        client = self._get_client()
+        key = (
+            id(client),
+            collection_name,
+            frozenset((name, prop.dataType) for name, prop in properties.items()),
+        )
+        # Held across the round trips so concurrent callers wait for the
+        # first one instead of racing to create the same collection
+        with _ensured_schemas_lock:
+            if key not in _ensured_schemas:
+                self._create_or_update_class(collection_name, properties)
+                _ensured_schemas.add(key)
+        self._ready_schemas.add(ready_key)
+
+    def _create_or_update_class(
+        self, collection_name: str, properties: Dict[str, Property]
+    ):
+        # Targeted existence check instead of listing every collection
+        if not self._get_client().collections.exists(collection_name):
             self._get_client().collections.create(
                 name=collection_name,
                 vectorizer_config=None,  # Using external embeddings with "none" vectorizer
+                vector_index_config=self._vector_index_config(),
                 properties=list(properties.values()),
             )
             return
 
         # Add missing properties to existing class
-        if class_exists:
-            collection = self._get_client().collections.get(collection_name)
-            existing_props = {
-                prop.name for prop in collection.config.get(simple=True).properties
-            }
-            for prop_name, prop in properties.items():
-                if prop_name not in existing_props:
-                    collection.config.add_property(prop)
+        collection = self._get_client().collections.get(collection_name)
+        existing_props = {
+            prop.name for prop in collection.config.get(simple=True).properties
+        }
+        for prop_name, prop in properties.items():
+            if prop_name not in existing_props:
+                collection.config.add_property(prop)
+
+    def _vector_index_config(self):
+        """
+        HNSW index configuration for new collections.
+
+        Unless SCALAR_QUANTIZATION is disabled, Weaviate trains the scalar
+        quantizer once enough vectors are indexed; embeddings are still sent
+        and stored in full precision.
+        """
+        quantizer = None
+        if self.SCALAR_QUANTIZATION:
+            quantizer = Configure.VectorIndex.Quantizer.sq(
+                rescore_limit=self.SQ_RESCORE_LIMIT
+            )
+        return Configure.VectorIndex.hnsw(
+            # Weaviate normalizes vectors once on import and ranks cosine with
+            # its dot-product kernel, so no client-side normalization is needed
+            distance_metric=VectorDistances.COSINE,
+            quantizer=quantizer,
+        )
 
     def _get_weaviate_type(self, annotation: type) -> str:
         origin = get_origin(annotation)
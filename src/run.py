@@ -16,8 +16,8 @@ from infra.embeddings.providers import OpenAIEmbeddingProvider
 from infra.llm.providers import OpenAIProvider
 from infra.pipelines.mem_walker import MemoryTreeNode, MemWalker
 from infra.tools.database_search import DatabaseSearchTool, VectorSearchQuery
-from infra.utils import ProgressTracker
-from infra.vector_stores.weaviate import WeaviateVectorStore
+from infra.utils import ProgressTracker, run_async
+from infra.vector_stores.backends import create_vector_store
 
 
 class CaptureFullPromptHandler(BaseCallbackHandler):
@@ -77,7 +77,7 @@ if __name__ == "__main__":
             # ],
         }
 
-        vector_store = WeaviateVectorStore()
+        vector_store = create_vector_store()
         embeddings = OpenAIEmbeddingProvider()
         agent = RetrievalAgent(
             llm_provider=OpenAIProvider(),
@@ -128,4 +128,4 @@ if __name__ == "__main__":
                 f.write(f"Case: {case}\n")
                 f.write(f"Duration: {duration}")
 
-    sys.exit(asyncio.run(run()))
+    sys.exit(run_async(run()))
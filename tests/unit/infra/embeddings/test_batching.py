@@ -0,0 +1,91 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from infra.embeddings.batching import BatchedEmbeddings
+
+
+def _fake_embed(texts):
+    return [[float(t)] for t in texts]
+
+
+class TestBatchedEmbeddings:
+    """Test suite for BatchedEmbeddings class."""
+
+    @pytest.fixture
+    def inner(self):
+        """Fixture for a mocked underlying embedding model."""
+        mock = MagicMock(spec=Embeddings)
+        mock.embed_documents.side_effect = _fake_embed
+        mock.aembed_documents = AsyncMock(side_effect=_fake_embed)
+        return mock
+
+    def test_embed_documents_splits_into_batches(self, inner):
+        """Test that documents are embedded in sub-batches and reassembled in order."""
+        texts = [str(i) for i in range(10)]
+        embeddings = BatchedEmbeddings(inner, batch_size=3)
+
+        result = embeddings.embed_documents(texts)
+
+        assert result == [[float(i)] for i in range(10)]
+        assert inner.embed_documents.call_count == 4
+        assert all(
+            len(call.args[0]) <= 3 for call in inner.embed_documents.call_args_list
+        )
+
+    def test_embed_documents_single_batch(self, inner):
+        """Test that a single batch is forwarded directly."""
+        embeddings = BatchedEmbeddings(inner, batch_size=3)
+
+        result = embeddings.embed_documents(["1", "2"])
+
+        assert result == [[1.0], [2.0]]
+        inner.embed_documents.assert_called_once_with(["1", "2"])
+
+    @pytest.mark.asyncio
+    async def test_aembed_documents_splits_into_batches(self, inner):
+        """Test that async embedding dispatches sub-batches and preserves order."""
+        texts = [str(i) for i in range(7)]
+        embeddings = BatchedEmbeddings(inner, batch_size=2, max_concurrency=2)
+
+        result = await embeddings.aembed_documents(texts)
+
+        assert result == [[float(i)] for i in range(7)]
+        assert inner.aembed_documents.await_count == 4
+
+    def test_embed_documents_embeds_repeated_texts_once(self, inner):
+        """Test that duplicate texts are embedded once and fanned back out."""
+        embeddings = BatchedEmbeddings(inner, batch_size=2)
+
+        result = embeddings.embed_documents(["1", "2", "1", "3", "2"])
+
+        assert result == [[1.0], [2.0], [1.0], [3.0], [2.0]]
+        calls = inner.embed_documents.call_args_list
+        embedded = [text for call in calls for text in call.args[0]]
+        assert embedded == ["1", "2", "3"]
+        assert result[0] is not result[2]
+
+    @pytest.mark.asyncio
+    async def test_aembed_documents_embeds_repeated_texts_once(self, inner):
+        """Test that async embedding also skips duplicate texts."""
+        embeddings = BatchedEmbeddings(inner, batch_size=4)
+
+        result = await embeddings.aembed_documents(["1", "1", "2"])
+
+        assert result == [[1.0], [1.0], [2.0]]
+        inner.aembed_documents.assert_awaited_once_with(["1", "2"])
+
+    def test_embed_query_delegates(self, inner):
+        """Test that query embedding is delegated to the wrapped model."""
+        inner.embed_query.return_value = [0.5]
+        embeddings = BatchedEmbeddings(inner)
+
+        assert embeddings.embed_query("q") == [0.5]
+        inner.embed_query.assert_called_once_with("q")
+
+    @pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"max_concurrency": 0}])
+    def test_invalid_arguments_raise(self, inner, kwargs):
+        """Test that non-positive batch sizes or concurrency limits are rejected."""
+        with pytest.raises(ValueError):
+            BatchedEmbeddings(inner, **kwargs)
@@ -0,0 +1,65 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from infra.embeddings.caching import QueryCachedEmbeddings
+
+
+class TestQueryCachedEmbeddings:
+    """Test suite for QueryCachedEmbeddings class."""
+
+    @pytest.fixture
+    def inner(self):
+        """Fixture for a mocked underlying embedding model."""
+        mock = MagicMock(spec=Embeddings)
+        mock.embed_query.side_effect = lambda text: [float(len(text))]
+        mock.aembed_query = AsyncMock(side_effect=lambda text: [float(len(text))])
+        return mock
+
+    def test_embed_query_is_cached(self, inner):
+        """Test that repeated queries are only embedded once."""
+        embeddings = QueryCachedEmbeddings(inner)
+
+        assert embeddings.embed_query("abc") == [3.0]
+        assert embeddings.embed_query("abc") == [3.0]
+
+        inner.embed_query.assert_called_once_with("abc")
+
+    @pytest.mark.asyncio
+    async def test_aembed_query_shares_cache(self, inner):
+        """Test that the async path shares the cache with the sync path."""
+        embeddings = QueryCachedEmbeddings(inner)
+
+        assert await embeddings.aembed_query("ab") == [2.0]
+        assert embeddings.embed_query("ab") == [2.0]
+
+        inner.aembed_query.assert_awaited_once_with("ab")
+        inner.embed_query.assert_not_called()
+
+    def test_cached_vector_cannot_be_mutated(self, inner):
+        """Test that mutating a returned vector does not affect the cache."""
+        embeddings = QueryCachedEmbeddings(inner)
+
+        embeddings.embed_query("abc").append(1.0)
+
+        assert embeddings.embed_query("abc") == [3.0]
+
+    def test_cache_evicts_least_recently_used(self, inner):
+        """Test that the cache is bounded."""
+        embeddings = QueryCachedEmbeddings(inner, maxsize=1)
+
+        embeddings.embed_query("a")
+        embeddings.embed_query("bb")
+        embeddings.embed_query("a")
+
+        assert inner.embed_query.call_count == 3
+
+    def test_embed_documents_delegates(self, inner):
+        """Test that document embedding is not cached."""
+        inner.embed_documents.return_value = [[1.0]]
+        embeddings = QueryCachedEmbeddings(inner)
+
+        assert embeddings.embed_documents(["a"]) == [[1.0]]
+        assert embeddings.embed_documents(["a"]) == [[1.0]]
+        assert inner.embed_documents.call_count == 2
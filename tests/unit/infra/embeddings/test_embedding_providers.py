@@ -3,8 +3,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 from langchain_core.embeddings import Embeddings
 
-from infra.embeddings.models import OpenAIEmbeddingModels
-from infra.embeddings.providers import OpenAIEmbeddingProvider
+from infra.embeddings.models import FastEmbedModels, OpenAIEmbeddingModels
+from infra.embeddings.providers import FastEmbedProvider, OpenAIEmbeddingProvider
+from infra.http_client import get_async_client
 
 
 @pytest.mark.parametrize("mock_settings", ["infra.embeddings.providers"], indirect=True)
@@ -26,7 +27,9 @@ class TestOpenAIEmbeddingProvider:
         assert provider.model == OpenAIEmbeddingModels.SMALL3
         assert provider.api_key == "test-api-key"
         mock_openai_embeddings.assert_called_once_with(
-            model=OpenAIEmbeddingModels.SMALL3, api_key="test-api-key"
+            model=OpenAIEmbeddingModels.SMALL3,
+            api_key="test-api-key",
+            http_async_client=get_async_client(),
         )
 
     def test_initialization_with_custom_params(
@@ -41,7 +44,9 @@ class TestOpenAIEmbeddingProvider:
         assert provider.model == custom_model
         assert provider.api_key == custom_api_key
         mock_openai_embeddings.assert_called_once_with(
-            model=custom_model, api_key=custom_api_key
+            model=custom_model,
+            api_key=custom_api_key,
+            http_async_client=get_async_client(),
         )
 
     def test_missing_api_key_raises_error(self, mock_settings):
@@ -63,3 +68,47 @@ class TestOpenAIEmbeddingProvider:
         embedding_model = provider.get_embedding_model()
 
         assert embedding_model == mock_openai_embeddings()
+
+
+class TestFastEmbedProvider:
+    """Test suite for FastEmbedProvider class."""
+
+    @pytest.fixture
+    def mock_fastembed_embeddings(self):
+        """Fixture to mock FastEmbedEmbeddings class."""
+        with patch("infra.embeddings.providers.FastEmbedEmbeddings") as mock:
+            mock.return_value = MagicMock(spec=Embeddings)
+            yield mock
+
+    def test_initialization_with_defaults(self, mock_fastembed_embeddings):
+        """Test initialization with default parameters."""
+        with patch("infra.embeddings.providers.os.cpu_count", return_value=8):
+            provider = FastEmbedProvider()
+
+        assert provider.model == FastEmbedModels.BGE_SMALL_EN
+        mock_fastembed_embeddings.assert_called_once_with(
+            model_name=FastEmbedModels.BGE_SMALL_EN,
+            batch_size=64,
+            parallel=8,
+            providers=["CPUExecutionProvider"],
+        )
+
+    def test_initialization_with_custom_params(self, mock_fastembed_embeddings):
+        """Test initialization with custom parameters."""
+        provider = FastEmbedProvider(
+            model=FastEmbedModels.BGE_BASE_EN, batch_size=16, parallel=0
+        )
+
+        assert provider.model == FastEmbedModels.BGE_BASE_EN
+        mock_fastembed_embeddings.assert_called_once_with(
+            model_name=FastEmbedModels.BGE_BASE_EN,
+            batch_size=16,
+            parallel=0,
+            providers=["CPUExecutionProvider"],
+        )
+
+    def test_get_embedding_model(self, mock_fastembed_embeddings):
+        """Test that get_embedding_model returns the FastEmbed model instance."""
+        provider = FastEmbedProvider()
+
+        assert provider.get_embedding_model() is mock_fastembed_embeddings.return_value
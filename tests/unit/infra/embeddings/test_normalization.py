@@ -0,0 +1,55 @@
+"""Tests for the NormalizedEmbeddings wrapper."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from infra.embeddings.normalization import NormalizedEmbeddings, normalize
+
+
+@pytest.fixture
+def embeddings():
+    """Create a mock embedding model returning unnormalized vectors."""
+    mock = MagicMock(spec=Embeddings)
+    mock.embed_documents.return_value = [[3.0, 4.0], [0.0, 0.0]]
+    mock.aembed_documents = AsyncMock(return_value=[[0.0, 2.0]])
+    mock.embed_query.return_value = [6.0, 8.0]
+    mock.aembed_query = AsyncMock(return_value=[-5.0, 0.0])
+    return mock
+
+
+class TestNormalize:
+    """Tests for the normalize function."""
+
+    def test_unit_length_and_zero_vectors(self):
+        """Vectors are scaled to unit length and zero vectors stay zero."""
+        result = normalize([[3.0, 4.0], [0.0, 0.0]])
+
+        np.testing.assert_allclose(result, [[0.6, 0.8], [0.0, 0.0]], rtol=1e-6)
+
+    def test_empty(self):
+        """An empty list normalizes to an empty list."""
+        assert normalize([]) == []
+
+
+class TestNormalizedEmbeddings:
+    """Tests for the NormalizedEmbeddings class."""
+
+    def test_embed_documents_and_query(self, embeddings):
+        """Document and query vectors are returned with unit length."""
+        wrapper = NormalizedEmbeddings(embeddings)
+
+        np.testing.assert_allclose(
+            wrapper.embed_documents(["a", "b"]), [[0.6, 0.8], [0.0, 0.0]], rtol=1e-6
+        )
+        np.testing.assert_allclose(wrapper.embed_query("q"), [0.6, 0.8], rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_async_embeddings(self, embeddings):
+        """Async document and query vectors are returned with unit length."""
+        wrapper = NormalizedEmbeddings(embeddings)
+
+        assert await wrapper.aembed_documents(["a"]) == [[0.0, 1.0]]
+        assert await wrapper.aembed_query("q") == [-1.0, 0.0]
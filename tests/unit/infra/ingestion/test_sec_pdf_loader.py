@@ -1,5 +1,6 @@
 """Tests for the EDGARPDFLoader class."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -7,6 +8,7 @@ from langchain_core.documents import Document
 
 from infra.acquisition.models import AcquisitionOutput
 from infra.acquisition.sec_fetcher import SECFiling
+from infra.databases.registry import TableNames
 from infra.ingestion.sec_pdf_loader import EDGARPDFLoader
 
 
@@ -170,6 +172,7 @@ class TestEDGARPDFLoader:
                 },
                 timeout=60,
                 binary=True,
+                session=None,
             )
 
     # @pytest.mark.asyncio
@@ -230,3 +233,54 @@ class TestEDGARPDFLoader:
     #     mock_session.get.assert_called_once()
     #     # Verify error response was read
     #     mock_response.text.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("mock_sqlalchemy_engine", "mock_cache", "mock_settings"),
+    [
+        (
+            "infra.ingestion.sec_pdf_loader",
+            "infra.ingestion.sec_pdf_loader",
+            "infra.ingestion.sec_pdf_loader",
+        )
+    ],
+    indirect=True,
+)
+class TestEDGARPDFLoaderUris:
+    """Tests for loading filings with several URIs."""
+
+    @pytest.mark.asyncio
+    async def test_uris_download_concurrently_in_order(
+        self, mock_sqlalchemy_engine, mock_cache, mock_settings, sample_sec_filing
+    ):
+        """A filing's URIs download side by side and keep their order."""
+        mock_cache.generate_id.side_effect = lambda uri: uri
+        mock_cache.get.return_value = None
+        uris = [f"https://www.sec.gov/Archives/edgar/data/1/{i}.htm" for i in range(3)]
+        output = MagicMock(spec=AcquisitionOutput)
+        output.get_uris.return_value = uris
+        output.get_metadata.return_value = sample_sec_filing
+
+        started = 0
+        all_started = asyncio.Event()
+
+        async def download(sec_url, session=None):
+            nonlocal started
+            started += 1
+            if started == len(uris):
+                all_started.set()
+            # Only completes once every download is in flight
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return f"pdf {sec_url}"
+
+        with patch.dict(
+            "infra.ingestion.sec_pdf_loader.TABLE_SCHEMAS",
+            {TableNames.PDFLoder: {}},
+        ):
+            loader = EDGARPDFLoader(api_key="test_key")
+        with patch.object(loader, "_download_filing_as_pdf", side_effect=download):
+            docs = await loader.load([output])
+
+        assert [doc.page_content for doc in docs] == [f"pdf {uri}" for uri in uris]
+        assert [doc.metadata["source"] for doc in docs] == uris
+        assert sample_sec_filing.source is None
@@ -1,5 +1,8 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
+from infra.acquisition.models import AcquisitionOutput
 from infra.ingestion.web_loader import CrawlConfig, CrawlStrategy, WebLoader
 
 
@@ -46,3 +49,40 @@ class TestWebLoader:
         assert custom_config.crawl_strategy == CrawlStrategy.ALL
         assert custom_config.max_requests_per_crawl == 100
         assert custom_config.max_crawl_depth == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_pages_as_crawled(
+        self, mock_sqlalchemy_engine, mock_cache
+    ):
+        """Test that stream() yields a document per crawled page in order."""
+        loader = WebLoader()
+        source = MagicMock(spec=AcquisitionOutput)
+        source.get_uris.return_value = ["https://example.com"]
+        source.get_metadata.return_value = {"ticker": "TEST"}
+
+        async def fake_crawl(urls, config, handle_page):
+            for i in range(3):
+                await handle_page(f"{urls[0]}/{i}", f"<html>{i}</html>")
+
+        with patch.object(loader, "_crawl_url", side_effect=fake_crawl):
+            docs = [doc async for doc in loader.stream([source])]
+
+        assert [d.page_content for d in docs] == [
+            "<html>0</html>",
+            "<html>1</html>",
+            "<html>2</html>",
+        ]
+        assert all(d.metadata == {"ticker": "TEST"} for d in docs)
+
+    @pytest.mark.asyncio
+    async def test_load_propagates_crawl_error(self, mock_sqlalchemy_engine, mock_cache):
+        """Test that errors raised while crawling are surfaced by load()."""
+        loader = WebLoader()
+        source = MagicMock(spec=AcquisitionOutput)
+        source.get_uris.return_value = ["https://example.com"]
+
+        with patch.object(
+            loader, "_crawl_url", AsyncMock(side_effect=RuntimeError("crawl failed"))
+        ):
+            with pytest.raises(RuntimeError, match="crawl failed"):
+                await loader.load([source])
@@ -1,9 +1,12 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import AIMessage
 from langchain_openai import ChatOpenAI
 
+from infra.http_client import get_async_client
 from infra.llm.models import OpenAIModels, RateLimitType
 from infra.llm.providers import OpenAIProvider
 
@@ -36,6 +39,13 @@ class TestOpenAIProvider:
         assert provider._model == OpenAIModels.GPT_O4_MINI
         assert provider._max_tokens == 4096
 
+    def test_initialization_uses_shared_http_client(self, mock_settings):
+        """Test that providers share the process-wide async HTTP client."""
+        first, second = OpenAIProvider(), OpenAIProvider()
+
+        assert first.http_async_client is get_async_client()
+        assert second.http_async_client is first.http_async_client
+
     def test_initialization_with_custom_params(self, mock_settings, mock_chat_openai):
         """Test initialization with custom parameters."""
         custom_model = OpenAIModels.GPT_4O
@@ -178,3 +188,61 @@ class TestOpenAIProvider:
             # Verify parent method was called without using rate limiting
             mock_parent_ainvoke.assert_awaited_once_with("Test prompt")
             assert result == "response"
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_bounds_concurrent_requests(
+        self, mock_settings, mock_chat_openai, mock_tiktoken
+    ):
+        """Test that concurrent calls beyond the cap wait for a free slot."""
+        in_flight = peak = 0
+
+        async def slow_ainvoke(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "response"
+
+        mock_model = MagicMock()
+        mock_model.rate_limiter = None
+
+        provider = OpenAIProvider()
+        provider._model = mock_model
+
+        with patch.object(ChatOpenAI, "ainvoke", slow_ainvoke), patch(
+            "infra.llm.providers.MAX_CONCURRENT_REQUESTS", 2
+        ), patch("infra.llm.providers._request_semaphores", {}):
+            results = await asyncio.gather(
+                *(provider.ainvoke("Test prompt") for _ in range(6))
+            )
+
+        assert results == ["response"] * 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_logs_cached_prompt_tokens(
+        self, mock_settings, mock_chat_openai, mock_tiktoken, caplog
+    ):
+        """Test that prompt cache hits reported by the API are logged."""
+        mock_model = MagicMock()
+        mock_model.rate_limiter = None
+
+        provider = OpenAIProvider()
+        provider._model = mock_model
+
+        message = AIMessage(
+            content="response",
+            usage_metadata={
+                "input_tokens": 2048,
+                "output_tokens": 10,
+                "total_tokens": 2058,
+                "input_token_details": {"cache_read": 1024},
+            },
+        )
+        with patch.object(ChatOpenAI, "ainvoke", AsyncMock(return_value=message)):
+            with caplog.at_level("DEBUG", logger="infra.llm.providers"):
+                result = await provider.ainvoke("Test prompt")
+
+        assert result is message
+        assert "Prompt tokens: 2048 (1024 cached)" in caplog.text
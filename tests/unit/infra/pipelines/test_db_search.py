@@ -0,0 +1,59 @@
+"""Tests for the SECSearch data miner."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infra.pipelines.db_search import SECSearch
+
+
+@pytest.fixture
+def hierarchy_table():
+    """Create a mock hierarchy table whose query returns the given nodes."""
+    table = MagicMock()
+    query = table.query_builder.return_value.__enter__.return_value
+    table.nodes = query.filter.return_value.all
+    return table
+
+
+@pytest.fixture
+def searcher(hierarchy_table):
+    """Create an SECSearch backed by the mock hierarchy table."""
+    searcher = SECSearch()
+    with patch.object(
+        SECSearch, "_hierarchy_table", return_value=hierarchy_table
+    ), patch.object(SECSearch, "_db_filters_from_metadata", return_value=[]):
+        yield searcher
+
+
+class TestSECSearch:
+    """Tests for the SECSearch class."""
+
+    def test_data_exists_caches_found_data(self, searcher, hierarchy_table):
+        """Repeated checks for indexed data skip the database."""
+        hierarchy_table.nodes.return_value = [MagicMock(status="complete")]
+
+        first = searcher.data_exists({"ticker": "AAPL"})
+        second = searcher.data_exists({"ticker": "AAPL"})
+
+        assert first == second
+        assert first[:2] == (True, "SUCCESS")
+        hierarchy_table.nodes.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "nodes, status",
+        [
+            ([], "NOT_FOUND"),
+            ([MagicMock(status="in-progress")], "INDEXING_IN_PROGRESS"),
+        ],
+    )
+    def test_data_exists_rechecks_unavailable_data(
+        self, searcher, hierarchy_table, nodes, status
+    ):
+        """Missing or in-progress data is checked again on the next call."""
+        hierarchy_table.nodes.return_value = nodes
+
+        assert searcher.data_exists({"ticker": "AAPL"})[:2] == (False, status)
+        searcher.data_exists({"ticker": "AAPL"})
+
+        assert hierarchy_table.nodes.call_count == 2
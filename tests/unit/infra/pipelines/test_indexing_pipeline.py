@@ -0,0 +1,156 @@
+"""Tests for the IndexingPipeline class."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.documents import Document
+
+from infra.embeddings.batching import BatchedEmbeddings
+from infra.embeddings.models import IEmbeddingProvider
+from infra.pipelines.indexing_pipeline import IndexingPipeline
+
+
+@pytest.fixture
+def filings():
+    """Create a list of fake acquisition outputs."""
+    return [MagicMock(name=f"filing-{i}") for i in range(3)]
+
+
+@pytest.fixture
+def pipeline(filings):
+    """Create an IndexingPipeline with mocked components."""
+    fetcher = MagicMock()
+    fetcher.fetch = AsyncMock(return_value=filings)
+
+    async def stream(sources):
+        for source in sources:
+            yield Document(page_content=f"raw-{filings.index(source)}")
+
+    loader = MagicMock()
+    loader.stream = MagicMock(side_effect=stream)
+
+    parser = MagicMock()
+    parser.parse = AsyncMock(
+        side_effect=lambda docs: [
+            Document(page_content=d.page_content.replace("raw", "parsed"))
+            for d in docs
+        ]
+    )
+
+    splitter = MagicMock()
+    splitter.split_documents = AsyncMock(side_effect=lambda docs: docs)
+
+    vector_store = MagicMock()
+    vector_store.collection_name = "test"
+
+    embedding_provider = MagicMock(spec=IEmbeddingProvider)
+    embedding_provider.INDEXING_BATCH_SIZE = 64
+    embedding_provider.INDEXING_MAX_CONCURRENCY = 2
+
+    return IndexingPipeline(
+        fetcher=fetcher,
+        loader=loader,
+        parser=parser,
+        splitter=splitter,
+        embedding_provider=embedding_provider,
+        vector_store=vector_store,
+    )
+
+
+class TestIndexingPipeline:
+    """Tests for the IndexingPipeline class."""
+
+    @pytest.mark.asyncio
+    async def test_run_streams_each_filing(self, pipeline, filings):
+        """Each streamed document is parsed individually, preserving order."""
+        result = await pipeline.run(identifier=["AAPL"])
+
+        pipeline.loader.stream.assert_called_once_with(filings)
+        assert pipeline.parser.parse.await_count == len(filings)
+
+        split_docs = pipeline.splitter.split_documents.await_args.args[0]
+        assert [d.page_content for d in split_docs] == [
+            "parsed-0",
+            "parsed-1",
+            "parsed-2",
+        ]
+        assert "Successfully indexed 3 document chunks" in result
+
+    @pytest.mark.asyncio
+    async def test_run_indexes_with_batched_embeddings(self, pipeline):
+        """The vector store receives a reused batching wrapper around the model."""
+        await pipeline.run(identifier=["AAPL"])
+        await pipeline.run(identifier=["AAPL"])
+
+        calls = pipeline.vector_store.add_documents.call_args_list
+        first, second = calls[0].args[1], calls[1].args[1]
+        assert isinstance(first, BatchedEmbeddings)
+        assert first.embeddings is pipeline.embedding_provider.get_embedding_model()
+        assert first is second
+        assert (first.batch_size, first.max_concurrency) == (64, 2)
+
+    @pytest.mark.asyncio
+    async def test_run_indexes_off_the_event_loop(self, pipeline):
+        """Blocking vector store writes run in a worker thread."""
+        threads = []
+        pipeline.vector_store.add_documents.side_effect = (
+            lambda *args: threads.append(threading.get_ident())
+        )
+
+        await pipeline.run(identifier=["AAPL"])
+
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_run_parses_concurrently_in_order(self, pipeline, filings):
+        """Documents are parsed with bounded concurrency, keeping load order."""
+        pipeline._PARSE_CONCURRENCY = 2
+        active, peak = 0, 0
+
+        async def parse(docs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            # Later documents finish first
+            index = int(docs[0].page_content.split("-")[1])
+            await asyncio.sleep(0.01 * (len(filings) - index))
+            active -= 1
+            return [Document(page_content=f"parsed-{index}")]
+
+        pipeline.parser.parse.side_effect = parse
+
+        await pipeline.run(identifier=["AAPL"])
+
+        assert peak == 2
+        split_docs = pipeline.splitter.split_documents.await_args.args[0]
+        assert [d.page_content for d in split_docs] == [
+            "parsed-0",
+            "parsed-1",
+            "parsed-2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_loader_error(self, pipeline):
+        """Errors raised while loading are surfaced to the caller."""
+        async def failing_stream(sources):
+            yield Document(page_content="raw-0")
+            raise RuntimeError("load failed")
+
+        pipeline.loader.stream.side_effect = failing_stream
+
+        with pytest.raises(RuntimeError, match="load failed"):
+            await pipeline.run(identifier=["AAPL"])
+
+        pipeline.vector_store.add_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_parser_error(self, pipeline):
+        """Errors raised while parsing stop the pipeline."""
+        pipeline.parser.parse.side_effect = RuntimeError("parse failed")
+
+        with pytest.raises(RuntimeError, match="parse failed"):
+            await pipeline.run(identifier=["AAPL"])
+
+        pipeline.vector_store.add_documents.assert_not_called()
@@ -0,0 +1,31 @@
+"""Tests for the shared HTTP client."""
+
+import asyncio
+
+import httpx
+
+from infra.http_client import get_async_client
+
+
+class TestGetAsyncClient:
+    """Tests for get_async_client."""
+
+    def test_returns_singleton(self):
+        """Repeated calls return the same pooled client."""
+        client = get_async_client()
+
+        assert isinstance(client, httpx.AsyncClient)
+        assert get_async_client() is client
+
+    def test_pools_connections_per_event_loop(self):
+        """Each event loop gets its own pool, reused within the loop."""
+        transport = get_async_client()._transport
+
+        async def pools():
+            return transport._transport(), transport._transport()
+
+        first, again = asyncio.run(pools())
+        second, _ = asyncio.run(pools())
+
+        assert first is again
+        assert second is not first
@@ -0,0 +1,27 @@
+"""Tests for the shared utilities."""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from infra.utils import run_async
+
+
+async def _loop_type():
+    return type(asyncio.get_running_loop()).__module__
+
+
+class TestRunAsync:
+    """Tests for run_async."""
+
+    def test_uses_uvloop_when_installed(self):
+        """The coroutine runs to completion on a uvloop event loop."""
+        pytest.importorskip("uvloop")
+        assert run_async(_loop_type()).startswith("uvloop")
+
+    def test_falls_back_to_asyncio(self):
+        """Without uvloop the coroutine runs on asyncio's default loop."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert run_async(_loop_type()).startswith("asyncio")
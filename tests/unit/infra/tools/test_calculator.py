@@ -0,0 +1,151 @@
+"""Tests for the CalculatorTool class."""
+
+import math
+from unittest.mock import AsyncMock, patch
+
+import numexpr
+import pytest
+
+from infra.tools.calculator import CalculatorTool, _compile, _fast_eval, _validate
+
+
+class TestCalculatorTool:
+    """Tests for the CalculatorTool class."""
+
+    @pytest.fixture
+    def tool(self):
+        """Create a CalculatorTool."""
+        return CalculatorTool()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("expr", "expected"),
+        [
+            ("37593 * 67", "2518731"),
+            ("37593**(1/5)", "8.222831614237718"),
+            ("2 * pi", "6.283185307179586"),
+            ("e", "2.718281828459045"),
+            ("sin(pi / 2)", "1.0"),
+            ("sqrt(16)", "4.0"),
+            ("3 > 2", "True"),
+        ],
+    )
+    async def test_execute(self, tool, expr, expected):
+        """Test that expressions evaluate to the expected string result."""
+        assert await tool.execute(expr=expr) == expected
+
+    @pytest.mark.asyncio
+    async def test_execute_strips_whitespace(self, tool):
+        """Test that surrounding whitespace is ignored."""
+        assert await tool.execute(expr="  1 + 1  ") == "2"
+
+    @pytest.mark.asyncio
+    async def test_execute_reuses_compiled_expression(self, tool):
+        """Test that repeated expressions hit the compile cache."""
+        _compile.cache_clear()
+
+        await tool.execute(expr="where(1 > 0, 40, 2)")
+        await tool.execute(expr="where(1 > 0, 40, 2)")
+
+        info = _compile.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_scalar_skips_numexpr(self, tool):
+        """Test that plain scalar arithmetic is evaluated without numexpr."""
+        _compile.cache_clear()
+
+        assert await tool.execute(expr="2 + 2 * sqrt(pi ** 2)") == str(
+            2 + 2 * math.pi
+        )
+
+        assert _compile.cache_info().misses == 0
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "__import__('os').system('echo hi')",
+            "().__class__",
+            "[1, 2][0]",
+            "10 ** 10 ** 10",
+            "((10 ** 1000) ** 1000) ** 1000",
+            "(2 * 10 ** 1000) ** 1000",
+            "abs(-1)",
+        ],
+    )
+    def test_fast_eval_rejects_unsafe_expressions(self, expr):
+        """Test that non-whitelisted syntax is rejected by the fast path."""
+        with pytest.raises(Exception):
+            _fast_eval(expr)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("expr", "error"),
+        [("1 / 0", ZeroDivisionError), ("x + 1", ValueError), ("1 +", ValueError)],
+    )
+    async def test_execute_invalid_expression_raises(self, tool, expr, error):
+        """Test that invalid expressions raise."""
+        with pytest.raises(error):
+            await tool.execute(expr=expr)
+
+    @pytest.mark.asyncio
+    async def test_execute_runs_numexpr_off_event_loop(self, tool):
+        """Test that numexpr evaluation is dispatched to a worker thread."""
+        with patch(
+            "infra.tools.calculator.asyncio.to_thread",
+            AsyncMock(return_value=42),
+        ) as to_thread:
+            result = await tool.execute(expr="where(1 > 0, 42, 0)")
+
+        assert result == "42"
+        to_thread.assert_awaited_once_with(
+            tool._evaluate_numexpr, "where(1 > 0, 42, 0)"
+        )
+
+    def test_numexpr_runs_single_threaded(self):
+        """Test that numexpr is pinned to one thread for scalar workloads."""
+        assert numexpr.get_num_threads() == 1
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "__import__('os').system('echo hi')",
+            "().__class__",
+            "[1, 2][0]",
+            "'a' + 'b'",
+            "x + 1",
+            "where(1 > 0, x, 2)",
+            "1 +",
+            "((10 ** 1000) ** 1000) ** 1000",
+            "9 ** 999999999",
+            "1 << 10 ** 12",
+        ],
+    )
+    def test_validate_rejects_unsupported_expressions(self, expr):
+        """Test that non-whitelisted syntax is rejected before evaluation."""
+        assert not _validate(expr)
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "where(1 > 0, 40, 2)",
+            "abs(-1)",
+            "(1 > 0) & ~(2 < 1)",
+            "2 ** 0.5",
+            "10 ** 1000 * 10 ** 1000",
+        ],
+    )
+    def test_validate_accepts_numexpr_expressions(self, expr):
+        """Test that numexpr functions and operators pass validation."""
+        assert _validate(expr)
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_before_numexpr(self, tool):
+        """Test that rejected expressions never reach numexpr."""
+        _compile.cache_clear()
+
+        with pytest.raises(ValueError, match="Unsupported calculator expression"):
+            await tool.execute(expr="__import__('os').getcwd()")
+
+        assert _compile.cache_info().misses == 0
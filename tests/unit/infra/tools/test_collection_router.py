@@ -4,13 +4,16 @@ import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.exceptions import OutputParserException
 from langchain_core.language_models import BaseLanguageModel
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
+from pydantic import ValidationError
 
 from infra.llm.models import ILLMProvider
 from infra.tools.collection_router import (
     CollectionRouterOutput,
     CollectionRouterTool,
+    _extract_collection_names,
 )
 
 
@@ -344,16 +347,11 @@ class TestCollectionRouterToolAdditional:
         ):
             tool = CollectionRouterTool(llm_provider=mock_llm_provider)
 
-            # Verify prompt template structure
-            assert hasattr(tool, "_prompt_template")
-            assert isinstance(tool._prompt_template, ChatPromptTemplate)
-
-            # Extract template content
-            template_str = str(tool._prompt_template)
-
-            # Verify template contains key words/phrases
-            assert "query" in template_str.lower()
-            assert "collections" in template_str.lower()
+            # Verify the pre-rendered prompt segments
+            assert isinstance(tool._system_message, SystemMessage)
+            assert "collections" in tool._system_message.content.lower()
+            assert "query" in tool._query_prefix.lower()
+            assert tool._query_suffix.strip() == ""
 
     @pytest.mark.asyncio
     async def test_with_complex_query_characters(
@@ -384,3 +382,369 @@ class TestCollectionRouterToolAdditional:
             parsed_result = json.loads(result)
             assert isinstance(parsed_result, list)
             assert len(parsed_result) == 1
+
+    @pytest.mark.asyncio
+    async def test_schemas_are_cached_across_calls(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that registry and collection schemas are serialized only once."""
+        # Arrange
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.return_value = CollectionRouterOutput(
+                collections=["SECFilings"]
+            )
+
+            # Act
+            first = await tool.execute(query="What was Apple's revenue?")
+            second = await tool.execute(query="What was Apple's net income?")
+
+            # Assert
+            assert first == second
+            mock_schema_registry.json_schema.assert_called_once()
+            mock_schema_registry.get_collection.assert_called_once_with("SECFilings")
+
+    @pytest.mark.asyncio
+    async def test_prompt_has_static_prefix_and_query_last(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that only the final message varies between calls."""
+        # Arrange
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.return_value = CollectionRouterOutput(
+                collections=[]
+            )
+
+            # Act
+            await tool.execute(query="What was Apple's revenue?")
+            await tool.execute(query="What was Tesla's revenue?")
+
+            # Assert
+            first, second = [
+                c.args[0]
+                for c in structured_output.ainvoke.call_args_list
+            ]
+            assert first[0] == second[0]
+            assert mock_schema_registry.json_schema.return_value in first[0].content
+            assert first[-1].content.strip().endswith("What was Apple's revenue?")
+            assert second[-1].content.strip().endswith("What was Tesla's revenue?")
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_skips_llm(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that a repeated (normalized) query reuses the cached routing."""
+        # Arrange
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.return_value = CollectionRouterOutput(
+                collections=["SECFilings"]
+            )
+
+            # Act
+            first = await tool.execute(query="What was Apple's revenue?")
+            second = await tool.execute(query="  what was\tapple's   REVENUE?  ")
+            await tool.execute(query="What was Tesla's revenue?")
+
+            # Assert
+            assert first == second
+            assert structured_output.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_falls_back_to_all_collections(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that a malformed LLM response returns every collection schema."""
+        # Arrange
+        sec, news = MagicMock(), MagicMock()
+        sec.name, news.name = "SECFilings", "NewsChunk"
+        mock_schema_registry.all_collections.return_value = [sec, news]
+
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.side_effect = OutputParserException("bad")
+
+            # Act
+            first = await tool.execute(query="What was Apple's revenue?")
+            second = await tool.execute(query="What was Tesla's revenue?")
+
+            # Assert
+            assert len(json.loads(first)) == 2
+            assert first is second
+            mock_schema_registry.all_collections.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_query_is_inserted_verbatim(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that template syntax in the query is not interpreted."""
+        # Arrange
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.return_value = CollectionRouterOutput(
+                collections=[]
+            )
+
+            # Act
+            await tool.execute(query="Revenue for {ticker} in {period}?")
+
+            # Assert
+            messages = structured_output.ainvoke.call_args.args[0]
+            assert "Revenue for {ticker} in {period}?" in messages[-1].content
+
+    @pytest.mark.asyncio
+    async def test_unparsed_response_recovers_collection_names(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that a bare array in the raw LLM output is used when parsing fails."""
+        # Arrange
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+            # The registry's collection names are read once at construction
+            mock_schema_registry.all_collections.reset_mock()
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.side_effect = OutputParserException(
+                "bad", llm_output='```json\n["SECChunk"]\n```'
+            )
+
+            # Act
+            result = await tool.execute(query="What was Apple's revenue?")
+
+            # Assert
+            assert len(json.loads(result)) == 1
+            mock_schema_registry.get_collection.assert_called_once_with("SECChunk")
+            mock_schema_registry.all_collections.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_collections_are_skipped(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that collection names unknown to the registry are dropped."""
+        # Arrange
+        known = mock_schema_registry.get_collection.return_value
+
+        def get_collection(name):
+            if name != "SECFilings":
+                raise ValueError(f"'{name}' is not a registered collection")
+            return known
+
+        mock_schema_registry.get_collection.side_effect = get_collection
+
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.return_value = CollectionRouterOutput(
+                collections=["SECFilings", "MadeUpChunk"]
+            )
+
+            # Act
+            first = await tool.execute(query="What was Apple's revenue?")
+            second = await tool.execute(query="What was Tesla's revenue?")
+
+            # Assert
+            assert len(json.loads(first)) == 1
+            assert first == second
+            assert mock_schema_registry.get_collection.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_only_unknown_collections_falls_back_to_all(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that routing only to unknown collections returns every schema."""
+        # Arrange
+        sec, news = MagicMock(), MagicMock()
+        sec.name, news.name = "SECFilings", "NewsChunk"
+        mock_schema_registry.all_collections.return_value = [sec, news]
+
+        def get_collection(name):
+            if name not in ("SECFilings", "NewsChunk"):
+                raise ValueError(f"'{name}' is not a registered collection")
+            return MagicMock(json_schema=MagicMock(return_value=f'"{name}"'))
+
+        mock_schema_registry.get_collection.side_effect = get_collection
+
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.return_value = CollectionRouterOutput(
+                collections=["MadeUpChunk"]
+            )
+
+            # Act
+            result = await tool.execute(query="What was Apple's revenue?")
+
+            # Assert
+            assert json.loads(result) == ["SECFilings", "NewsChunk"]
+
+    @pytest.mark.asyncio
+    async def test_similar_query_reuses_routing(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that a paraphrased query hits the semantic route cache."""
+        # Arrange
+        vectors = {
+            "market cap of JPM": [1.0, 0.0, 0.0],
+            "JPMorgan's market cap": [0.98, 0.1, 0.0],
+            "Latest Tesla news": [0.0, 1.0, 0.0],
+        }
+        embedding_provider = MagicMock()
+        embedding_model = embedding_provider.get_embedding_model.return_value
+        embedding_model.aembed_query = AsyncMock(side_effect=vectors.get)
+
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(
+                llm_provider=mock_llm_provider, embeddings=embedding_provider
+            )
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.side_effect = [
+                CollectionRouterOutput(collections=["SECFilings"]),
+                CollectionRouterOutput(collections=["NewsChunk"]),
+            ]
+
+            # Act
+            first = await tool.execute(query="market cap of JPM")
+            second = await tool.execute(query="JPMorgan's market cap")
+            await tool.execute(query="Latest Tesla news")
+
+            # Assert
+            assert first == second
+            assert structured_output.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_falls_through_to_llm(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that routing still works when the query cannot be embedded."""
+        # Arrange
+        embedding_provider = MagicMock()
+        embedding_model = embedding_provider.get_embedding_model.return_value
+        embedding_model.aembed_query = AsyncMock(side_effect=RuntimeError("down"))
+
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(
+                llm_provider=mock_llm_provider, embeddings=embedding_provider
+            )
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.return_value = CollectionRouterOutput(
+                collections=["SECFilings"]
+            )
+
+            # Act
+            result = await tool.execute(query="What was Apple's revenue?")
+
+            # Assert
+            assert len(json.loads(result)) == 1
+            structured_output.ainvoke.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_output_schema_restricts_collection_names(
+        self, mock_llm_provider, mock_schema_registry
+    ):
+        """Test that the structured output schema enumerates the collections."""
+        # Arrange
+        sec, news = MagicMock(), MagicMock()
+        sec.name, news.name = "SECFilings", "NewsChunk"
+        mock_schema_registry.all_collections.return_value = [sec, news]
+
+        with patch(
+            "infra.tools.collection_router.get_schema_registry",
+            return_value=mock_schema_registry,
+        ):
+            tool = CollectionRouterTool(llm_provider=mock_llm_provider)
+
+            mock_llm = mock_llm_provider.get_model()
+            structured_output = mock_llm.with_structured_output.return_value
+            structured_output.ainvoke.return_value = CollectionRouterOutput(
+                collections=["SECFilings"]
+            )
+
+            # Act
+            await tool.execute(query="What was Apple's revenue?")
+
+            # Assert
+            (output_model,) = mock_llm.with_structured_output.call_args.args
+            schema = output_model.model_json_schema()
+            assert schema["properties"]["collections"]["items"]["enum"] == [
+                "SECFilings",
+                "NewsChunk",
+            ]
+            with pytest.raises(ValidationError):
+                output_model(collections=["MadeUpChunk"])
+
+
+class TestExtractCollectionNames:
+    """Tests for the _extract_collection_names helper."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ('["A", "B"]', ["A", "B"]),
+            ('```json\n["A"]\n```', ["A"]),
+            ('The relevant collections are ["A", "B"].', ["A", "B"]),
+            ("[]", []),
+            (None, None),
+            ("no array here", None),
+            ("] backwards [", None),
+            ("[1, 2]", None),
+            ("[not json]", None),
+        ],
+    )
+    def test_extract(self, text, expected):
+        """Test extraction from raw LLM output."""
+        assert _extract_collection_names(text) == expected
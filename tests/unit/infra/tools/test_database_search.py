@@ -0,0 +1,110 @@
+"""Tests for the DatabaseSearchTool class and its output models."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+
+from infra.collections.registry import TraversalType
+from infra.tools.database_search import (
+    DatabaseSearchTool,
+    SearchOutput,
+    TargetQueryInfo,
+)
+
+
+@pytest.fixture
+def documents():
+    """Create retrieved documents."""
+    return [
+        Document(id="1", page_content="Net sales rose", metadata={"ticker": "AAPL"}),
+        Document(id="2", page_content="Margins fell", metadata={"ticker": "AAPL"}),
+    ]
+
+
+@pytest.fixture
+def make_tool(documents):
+    """Build DatabaseSearchTools over a mocked registry and vector store."""
+    collection = MagicMock()
+    collection.name = "SECFilings"
+    collection.traversal = TraversalType.VECTOR_SEARCH
+    collection.searcher.data_exists.return_value = (True, "SUCCESS", "found")
+    registry = MagicMock()
+    registry.get_collection.return_value = collection
+
+    vector_store = MagicMock()
+    vector_store.as_retriever.return_value.ainvoke = AsyncMock(return_value=documents)
+
+    def make(**kwargs):
+        with patch(
+            "infra.tools.database_search.get_schema_registry", return_value=registry
+        ):
+            return DatabaseSearchTool(
+                llm_provider=MagicMock(),
+                vector_store=vector_store,
+                embeddings=MagicMock(),
+                **kwargs,
+            )
+
+    return make
+
+
+_QUERY = {
+    "query": "net sales",
+    "justification": "test",
+    "collection": "SECFilings",
+    "filters": {"ticker": "AAPL"},
+}
+
+
+class TestDatabaseSearchTool:
+    """Tests for the DatabaseSearchTool class."""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_json(self, make_tool):
+        """By default the search output is returned as a JSON string."""
+        result = json.loads(await make_tool().execute(**_QUERY))
+
+        assert result["status"] == "SUCCESS"
+        assert [r["page_content"] for r in result["results"]] == [
+            "Net sales rose",
+            "Margins fell",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_structured_output(self, make_tool):
+        """Structured output returns JSON with compact results."""
+        result = json.loads(
+            await make_tool(structured_output=True).execute(**_QUERY)
+        )
+
+        assert result["query_executed"]["collection_searched"] == "SECFilings"
+        assert result["results"] == [
+            {"content": "Net sales rose", "metadata": {"ticker": "AAPL"}},
+            {"content": "Margins fell", "metadata": {"ticker": "AAPL"}},
+        ]
+
+
+class TestSearchOutput:
+    """Tests for the SearchOutput model."""
+
+    def test_results_serialize_as_documents(self):
+        """Every retrieved document is serialized with its content and metadata."""
+        output = SearchOutput(
+            query_executed=TargetQueryInfo(
+                collection_searched="SECFilings", filters_applied={"ticker": "AAPL"}
+            ),
+            results=[
+                Document(page_content="Net sales\nrose", metadata={"ticker": "AAPL"}),
+                Document(page_content="Operating income", metadata={"ticker": "AAPL"}),
+            ],
+        )
+
+        results = json.loads(output.model_dump_json())["results"]
+
+        assert [r["page_content"] for r in results] == [
+            "Net sales\nrose",
+            "Operating income",
+        ]
+        assert results[0]["metadata"] == {"ticker": "AAPL"}
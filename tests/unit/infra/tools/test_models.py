@@ -0,0 +1,119 @@
+"""Tests for the tool base classes."""
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from infra.tools.models import BaseTool
+
+
+class _EchoInput(BaseModel):
+    value: int
+
+
+class _ParsedEchoTool(BaseTool):
+    def __init__(self):
+        super().__init__(name="echo", description="echo", args_schema=_EchoInput)
+
+    async def execute(self, **kwargs):
+        return self._parse_args(_EchoInput, kwargs)
+
+
+class _NestingTool(BaseTool):
+    inner: Any = None
+
+    def __init__(self, inner):
+        super().__init__(name="nest", description="nest", args_schema=_EchoInput)
+        self.inner = inner
+
+    async def execute(self, **kwargs):
+        self._parse_args(_EchoInput, kwargs)
+        return await self.inner.execute(value="not a number")
+
+
+class _EchoTool(BaseTool):
+    def __init__(self):
+        super().__init__(name="echo", description="echo", args_schema=_EchoInput)
+
+    async def execute(self, **kwargs):
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop(), kwargs["value"]
+
+
+class TestBaseTool:
+    """Tests for the BaseTool class."""
+
+    def test_run_sync_reuses_loop(self):
+        """Synchronous runs share a single background event loop."""
+        tool = _EchoTool()
+
+        first_loop, first = tool._run(value=1)
+        second_loop, second = tool._run(value=2)
+
+        assert (first, second) == (1, 2)
+        assert first_loop is second_loop
+        assert first_loop.is_running()
+
+    @pytest.mark.asyncio
+    async def test_run_sync_inside_running_loop(self):
+        """Synchronous runs work when called from inside a running loop."""
+        tool = _EchoTool()
+
+        loop, value = tool._run(value=3)
+
+        assert value == 3
+        assert loop is not asyncio.get_running_loop()
+
+    @pytest.mark.asyncio
+    async def test_parse_args_trusts_langchain_validation(self):
+        """Arguments validated by LangChain are not validated a second time."""
+        tool = _ParsedEchoTool()
+
+        with patch.object(
+            _EchoInput, "model_construct", wraps=_EchoInput.model_construct
+        ) as construct:
+            parsed = await tool.ainvoke({"value": "3"})
+
+        assert parsed.value == 3
+        construct.assert_called_once_with(value=3)
+
+    @pytest.mark.asyncio
+    async def test_parse_args_validates_direct_calls(self):
+        """Direct execute() calls still validate their arguments."""
+        tool = _ParsedEchoTool()
+
+        assert (await tool.execute(value="4")).value == 4
+        with pytest.raises(ValidationError):
+            await tool.execute(value="not a number")
+
+    def test_parse_args_trusts_sync_langchain_validation(self):
+        """The synchronous dispatch path also skips re-validation."""
+        tool = _ParsedEchoTool()
+
+        with patch.object(
+            _EchoInput, "model_construct", wraps=_EchoInput.model_construct
+        ) as construct:
+            parsed = tool.invoke({"value": "5"})
+
+        assert parsed.value == 5
+        construct.assert_called_once_with(value=5)
+
+    @pytest.mark.asyncio
+    async def test_nested_direct_calls_validate(self):
+        """execute() calls made inside a dispatched tool still validate."""
+        tool = _NestingTool(_ParsedEchoTool())
+
+        with pytest.raises(ValidationError):
+            await tool.ainvoke({"value": 1})
+
+    @pytest.mark.asyncio
+    async def test_nested_calls_to_same_tool_validate(self):
+        """The flag is consumed, so re-entering the same tool validates."""
+        tool = _NestingTool(None)
+        tool.inner = tool
+
+        with pytest.raises(ValidationError):
+            await tool.ainvoke({"value": 1})
@@ -0,0 +1,88 @@
+"""Tests for the PipelineTool class."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from infra.tools.pipelines import IndexingPipelineTool, PipelineTool
+
+
+class _PipelineInput(BaseModel):
+    ticker: str
+
+
+class TestPipelineTool:
+    """Tests for the PipelineTool class."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """Create a mocked pipeline."""
+        pipeline = MagicMock()
+        pipeline.run = AsyncMock(return_value="done")
+        return pipeline
+
+    @pytest.mark.asyncio
+    async def test_execute_maps_arguments(self, pipeline):
+        """Mapped tool arguments are renamed and unmapped ones are dropped."""
+        tool = PipelineTool(
+            name="test",
+            description="test",
+            args_schema=_PipelineInput,
+            arg_mapping={"ticker": "identifier", "form": "filing_type"},
+        )
+        tool.pipeline = pipeline
+
+        result = await tool.execute(ticker="AAPL", extra="ignored")
+
+        assert result == "done"
+        pipeline.run.assert_awaited_once_with(identifier="AAPL")
+
+    @pytest.mark.asyncio
+    async def test_execute_without_mapping_passes_through(self, pipeline):
+        """Without a mapping the arguments are forwarded unchanged."""
+        tool = PipelineTool(name="test", description="test", args_schema=_PipelineInput)
+        tool.pipeline = pipeline
+
+        await tool.execute(ticker="AAPL", extra="kept")
+
+        pipeline.run.assert_awaited_once_with(ticker="AAPL", extra="kept")
+
+    @pytest.mark.asyncio
+    async def test_execute_propagates_pipeline_error(self, pipeline):
+        """Errors raised by the pipeline are re-raised."""
+        pipeline.run.side_effect = RuntimeError("boom")
+        tool = PipelineTool(name="test", description="test", args_schema=_PipelineInput)
+        tool.pipeline = pipeline
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await tool.execute(ticker="AAPL")
+
+
+class TestIndexingPipelineTool:
+    """Tests for the IndexingPipelineTool class."""
+
+    @pytest.mark.asyncio
+    async def test_query_mode_caches_schema(self, monkeypatch):
+        """Query mode serializes each collection's indexer schema only once."""
+        monkeypatch.setattr(IndexingPipelineTool, "_SCHEMA_CACHE", {})
+        collection = MagicMock()
+        collection.name = "SECFilings"
+        collection.indexer_schema = _PipelineInput
+        registry = MagicMock()
+        registry.get_collection.return_value = collection
+
+        with patch("infra.tools.pipelines.get_schema_registry", return_value=registry):
+            tool = IndexingPipelineTool(
+                vector_store=MagicMock(), embeddings=MagicMock()
+            )
+        with patch.object(
+            _PipelineInput, "model_json_schema", wraps=_PipelineInput.model_json_schema
+        ) as model_json_schema:
+            first = await tool.execute(collection="SECFilings", is_query_mode=True)
+            second = await tool.execute(collection="SECFilings", is_query_mode=True)
+
+        assert json.loads(first)["properties"].keys() == {"ticker"}
+        assert second is first
+        model_json_schema.assert_called_once()
@@ -0,0 +1,86 @@
+"""Tests for the SummarizerTool class."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import AIMessage
+
+from infra.llm.models import ILLMProvider
+from infra.tools.summarizer import SummarizerInput, SummarizerTool
+
+
+@pytest.fixture
+def llm():
+    """Create a mock language model."""
+    mock = MagicMock(spec=BaseLanguageModel)
+    mock.ainvoke = AsyncMock(return_value=AIMessage(content=" summary "))
+    mock.abatch = AsyncMock(
+        side_effect=lambda prompts, config: [
+            AIMessage(content=f" summary {i} ") for i in range(len(prompts))
+        ]
+    )
+    return mock
+
+
+@pytest.fixture
+def tool(llm):
+    """Create a SummarizerTool backed by the mock language model."""
+    provider = MagicMock(spec=ILLMProvider)
+    provider.get_model.return_value = llm
+    return SummarizerTool(llm_provider=provider)
+
+
+class TestSummarizerTool:
+    """Tests for the SummarizerTool class."""
+
+    @pytest.mark.asyncio
+    async def test_execute(self, tool, llm):
+        """A single input is summarized with one LLM call."""
+        assert await tool.execute(input="table") == "summary"
+        llm.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_batch(self, tool, llm):
+        """Inputs are summarized through one bounded-concurrency batch call."""
+        inputs = [SummarizerInput(input=f"table {i}") for i in range(3)]
+
+        summaries = await tool.run_batch(inputs)
+
+        assert summaries == ["summary 0", "summary 1", "summary 2"]
+        llm.abatch.assert_awaited_once()
+        prompts = llm.abatch.await_args.args[0]
+        for i, prompt in enumerate(prompts):
+            assert f"table {i}" in prompt.to_messages()[0].content
+        assert llm.abatch.await_args.kwargs["config"] == {"max_concurrency": 8}
+        llm.ainvoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_batch_empty(self, tool, llm):
+        """An empty batch makes no LLM call."""
+        assert await tool.run_batch([]) == []
+        llm.abatch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_reuses_cached_summary(self, tool, llm):
+        """Repeated inputs are answered from the summary cache."""
+        assert await tool.execute(input="table") == "summary"
+        assert await tool.execute(input="table") == "summary"
+        assert await tool.execute(input="table", custom_instructions="x") == "summary"
+
+        assert llm.ainvoke.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_batch_skips_duplicates_and_cached(self, tool, llm):
+        """Only distinct, uncached inputs are sent to the LLM."""
+        await tool.execute(input="cached")
+        inputs = [
+            SummarizerInput(input="table"),
+            SummarizerInput(input="cached"),
+            SummarizerInput(input="table"),
+        ]
+
+        summaries = await tool.run_batch(inputs)
+
+        assert summaries == ["summary 0", "summary", "summary 0"]
+        assert len(llm.abatch.await_args.args[0]) == 1
@@ -0,0 +1,33 @@
+"""Tests for vector store backend selection."""
+
+from unittest.mock import patch
+
+import pytest
+
+from infra.vector_stores.backends import create_vector_store
+
+
+class TestCreateVectorStore:
+    """Tests for create_vector_store."""
+
+    def test_creates_named_backend(self):
+        """An explicit backend name selects that store."""
+        pytest.importorskip("faiss")
+
+        with patch("infra.vector_stores.faiss.FaissVectorStore") as store:
+            assert create_vector_store("faiss") is store.return_value
+
+    @pytest.mark.parametrize(
+        "mock_settings", ["infra.vector_stores.backends"], indirect=True
+    )
+    def test_defaults_to_configured_backend(self, mock_settings):
+        """Without a name, the VECTOR_STORE_BACKEND setting is used."""
+        mock_settings.return_value.VECTOR_STORE_BACKEND = "weaviate"
+
+        with patch("infra.vector_stores.weaviate.WeaviateVectorStore") as store:
+            assert create_vector_store() is store.return_value
+
+    def test_unknown_backend_raises(self):
+        """Unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown vector store backend"):
+            create_vector_store("pinecone")
@@ -0,0 +1,231 @@
+"""Tests for the ChromaVectorStore class."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from infra.embeddings.normalization import NormalizedEmbeddings
+from infra.vector_stores.chromadb import ChromaVectorStore, _compile_filter
+from infra.vector_stores.models import SearchKwargs
+from infra.vector_stores.quantization import QuantizedIndex, QuantizedRetriever
+
+
+@pytest.fixture
+def mock_chroma():
+    """Patch the LangChain Chroma class used by the vector store."""
+    with patch("infra.vector_stores.chromadb.Chroma") as mock:
+        instance = MagicMock(spec=Chroma)
+        mock.return_value = instance
+        instance.add_documents.side_effect = lambda docs, ids: ids
+        yield instance
+
+
+@pytest.fixture
+def vector_store(tmp_path):
+    """Create a ChromaVectorStore persisted under a temp directory."""
+    return ChromaVectorStore(persist_directory=str(tmp_path / "chroma"))
+
+
+class TestChromaVectorStore:
+    """Tests for the ChromaVectorStore class."""
+
+    def test_add_documents_in_batches(self, vector_store, mock_chroma):
+        """Documents are written in batches of at most batch_size."""
+        vector_store.batch_size = 2
+        docs = [Document(page_content=str(i)) for i in range(5)]
+
+        vector_store.add_documents(docs, MagicMock(spec=Embeddings))
+
+        batches = [c.args[0] for c in mock_chroma.add_documents.call_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert [d for b in batches for d in b] == docs
+
+    def test_add_documents_retries_batch_once(self, vector_store, mock_chroma):
+        """A failed batch is retried once with the same document IDs."""
+        mock_chroma.add_documents.side_effect = [ConnectionError("busy"), ["a"]]
+        docs = [Document(page_content="a")]
+
+        vector_store.add_documents(docs, MagicMock(spec=Embeddings))
+
+        first, second = mock_chroma.add_documents.call_args_list
+        assert first.kwargs["ids"] == second.kwargs["ids"]
+
+    def test_batch_size_must_be_positive(self, tmp_path):
+        """A non-positive batch size is rejected."""
+        with pytest.raises(ValueError):
+            ChromaVectorStore(persist_directory=str(tmp_path), batch_size=0)
+
+    def test_add_documents_empty(self, vector_store, mock_chroma):
+        """No write is attempted when there are no documents."""
+        vector_store.add_documents([], MagicMock(spec=Embeddings))
+
+        mock_chroma.add_documents.assert_not_called()
+
+    def test_add_documents_wraps_errors(self, vector_store, mock_chroma):
+        """Backend failures are surfaced as RuntimeError."""
+        mock_chroma.add_documents.side_effect = ValueError("bad metadata")
+
+        with pytest.raises(RuntimeError, match="Failed to add documents"):
+            vector_store.add_documents(
+                [Document(page_content="a")], MagicMock(spec=Embeddings)
+            )
+
+    def test_set_collection_resets_vectorstore(self, vector_store, mock_chroma):
+        """Switching collections reinitializes Chroma for the new collection."""
+        embeddings = MagicMock(spec=Embeddings)
+        vector_store.get_vectorstore(embeddings)
+
+        vector_store.set_collection("SECFilings", {})
+
+        assert vector_store.collection_name == "SECFilings"
+        assert vector_store._vectorstore is None
+
+    def test_initialize_normalizes_embeddings(self, vector_store):
+        """Chroma receives normalized embeddings and an inner product space."""
+        embeddings = MagicMock(spec=Embeddings)
+
+        with patch("infra.vector_stores.chromadb.Chroma") as chroma:
+            vector_store.get_vectorstore(embeddings)
+            vector_store.get_vectorstore(embeddings)
+
+        chroma.assert_called_once()
+        kwargs = chroma.call_args.kwargs
+        assert isinstance(kwargs["embedding_function"], NormalizedEmbeddings)
+        assert kwargs["embedding_function"].embeddings is embeddings
+        assert kwargs["collection_metadata"] == {"hnsw:space": "ip"}
+
+    def test_as_retriever_default_search_kwargs(self, vector_store, mock_chroma):
+        """Retrievers use the shared default search kwargs when none are given."""
+        vector_store.as_retriever(MagicMock(spec=Embeddings))
+
+        mock_chroma.as_retriever.assert_called_once_with(
+            search_type="similarity", search_kwargs={"k": 10}
+        )
+        assert vector_store.DEFAULT_SEARCH_KWARGS == {"k": 10}
+
+    def test_as_retriever_caches_retrievers(self, vector_store, mock_chroma):
+        """Equal search kwargs reuse a retriever until documents are added."""
+        embeddings = MagicMock(spec=Embeddings)
+        mock_chroma.as_retriever.side_effect = lambda **kwargs: MagicMock()
+        search_kwargs = {"k": 3, "filter": {"ticker": ["AAPL", "MSFT"]}}
+
+        first = vector_store.as_retriever(embeddings, search_kwargs=search_kwargs)
+        second = vector_store.as_retriever(
+            embeddings, search_kwargs=dict(search_kwargs)
+        )
+        other = vector_store.as_retriever(embeddings, search_kwargs={"k": 4})
+        vector_store.add_documents([Document(page_content="b")], embeddings)
+        third = vector_store.as_retriever(embeddings, search_kwargs=search_kwargs)
+
+        assert first is second
+        assert other is not first
+        assert third is not first
+        assert mock_chroma.as_retriever.call_count == 3
+
+    def test_as_retriever_quantized(self, tmp_path, mock_chroma):
+        """Quantized stores search through a shared, lazily built index."""
+        mock_chroma.get.return_value = {"ids": ["a"], "embeddings": [[0.5, -0.5]]}
+        vector_store = ChromaVectorStore(
+            persist_directory=str(tmp_path), quantization="binary"
+        )
+        embeddings = MagicMock(spec=Embeddings)
+
+        first = vector_store.as_retriever(embeddings)
+        second = vector_store.as_retriever(embeddings, search_kwargs={"k": 3})
+
+        assert isinstance(first, QuantizedRetriever)
+        assert first.index is second.index
+        assert second.k == 3
+        mock_chroma.get.assert_called_once()
+
+    def test_add_documents_invalidates_quantized_index(self, tmp_path, mock_chroma):
+        """New writes rebuild the quantized index on the next query."""
+        mock_chroma.get.return_value = {"ids": ["a"], "embeddings": [[0.5, -0.5]]}
+        vector_store = ChromaVectorStore(
+            persist_directory=str(tmp_path), quantization="int8"
+        )
+        embeddings = MagicMock(spec=Embeddings)
+
+        vector_store.as_retriever(embeddings)
+        vector_store.add_documents([Document(page_content="b")], embeddings)
+        vector_store.as_retriever(embeddings)
+
+        assert mock_chroma.get.call_count == 2
+
+    def test_add_documents_invalidates_memmapped_vectors(
+        self, tmp_path, mock_chroma
+    ):
+        """Writes drop the on-disk vectors, which may be upserted by ID."""
+        mock_chroma.get.return_value = {"ids": ["a"], "embeddings": [[0.5, -0.5]]}
+        vector_store = ChromaVectorStore(
+            persist_directory=str(tmp_path), quantization="int8"
+        )
+        embeddings = MagicMock(spec=Embeddings)
+        vector_store.as_retriever(embeddings)
+        ids_file = vector_store._quantized_cache_dir() / QuantizedIndex.IDS_FILE
+        assert ids_file.exists()
+
+        vector_store.add_documents([Document(page_content="a")], embeddings)
+
+        assert not ids_file.exists()
+
+    def test_as_retriever_quantized_with_filter_uses_chroma(
+        self, tmp_path, mock_chroma
+    ):
+        """Searches the quantized index cannot serve fall back to Chroma."""
+        vector_store = ChromaVectorStore(
+            persist_directory=str(tmp_path), quantization="binary"
+        )
+        search_kwargs = {"k": 3, "filter": {"ticker": "AAPL"}}
+
+        vector_store.as_retriever(
+            MagicMock(spec=Embeddings), search_kwargs=search_kwargs
+        )
+
+        mock_chroma.as_retriever.assert_called_once_with(
+            search_type="similarity",
+            search_kwargs={"k": 3, "filter": {"ticker": {"$eq": "AAPL"}}},
+        )
+
+    def test_as_retriever_compiles_search_kwargs_filters(
+        self, vector_store, mock_chroma
+    ):
+        """SearchKwargs filters are compiled into a Chroma where clause."""
+        search_kwargs = SearchKwargs(
+            k=5, filters={"ticker": "AMZN", "form_type": ["10-K", "10-Q"]}
+        )
+
+        vector_store.as_retriever(
+            MagicMock(spec=Embeddings), search_type="mmr", search_kwargs=search_kwargs
+        )
+
+        mock_chroma.as_retriever.assert_called_once_with(
+            search_type="mmr",
+            search_kwargs={
+                "k": 5,
+                "fetch_k": 20,
+                "filter": {
+                    "$and": [
+                        {"ticker": {"$eq": "AMZN"}},
+                        {"form_type": {"$in": ["10-K", "10-Q"]}},
+                    ]
+                },
+            },
+        )
+
+
+class TestCompileFilter:
+    """Tests for the Chroma where clause compiler."""
+
+    def test_single_condition_is_not_wrapped(self):
+        """A single filter compiles to a bare condition."""
+        assert _compile_filter({"year": 2024}) == {"year": {"$eq": 2024}}
+
+    def test_where_clause_passes_through(self):
+        """Filters already written with Chroma operators are left unchanged."""
+        where = {"$or": [{"ticker": "AAPL"}, {"ticker": "MSFT"}]}
+
+        assert _compile_filter(where) is where
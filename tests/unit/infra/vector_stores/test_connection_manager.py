@@ -0,0 +1,66 @@
+"""Tests for the Weaviate connection manager."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infra.vector_stores import connection_manager
+from infra.vector_stores.connection_manager import (
+    close_weaviate_clients,
+    get_weaviate_client,
+)
+
+
+@pytest.fixture
+def connect():
+    """Patch the Weaviate connect call and start with no shared clients."""
+    connection_manager._clients.clear()
+    with patch(
+        "infra.vector_stores.connection_manager.weaviate.connect_to_custom",
+        side_effect=lambda **kwargs: MagicMock(),
+    ) as mock:
+        yield mock
+    connection_manager._clients.clear()
+
+
+class TestGetWeaviateClient:
+    """Tests for get_weaviate_client."""
+
+    def test_reuses_client_per_host(self, connect):
+        """Each deployment is connected to once and shared afterwards."""
+        first = get_weaviate_client("http-a", "grpc-a")
+        second = get_weaviate_client("http-a", "grpc-a")
+        other = get_weaviate_client("http-b", "grpc-b")
+
+        assert first is second
+        assert other is not first
+        assert connect.call_count == 2
+
+    def test_concurrent_first_use_connects_once(self, connect):
+        """Threads racing on first use share a single connection."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(
+                executor.map(
+                    lambda _: get_weaviate_client("http-a", "grpc-a"), range(32)
+                )
+            )
+
+        assert connect.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+    def test_reconnects_closed_client(self, connect):
+        """A client that lost its connection is replaced."""
+        first = get_weaviate_client("http-a", "grpc-a")
+        first.is_connected.return_value = False
+
+        assert get_weaviate_client("http-a", "grpc-a") is not first
+
+    def test_close_weaviate_clients(self, connect):
+        """Closing releases every shared client."""
+        client = get_weaviate_client("http-a", "grpc-a")
+
+        close_weaviate_clients()
+
+        client.close.assert_called_once()
+        assert get_weaviate_client("http-a", "grpc-a") is not client
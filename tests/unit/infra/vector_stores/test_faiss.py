@@ -0,0 +1,171 @@
+"""Tests for the FaissVectorStore class."""
+
+import hashlib
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+
+pytest.importorskip("faiss")
+
+from infra.vector_stores.faiss import FaissVectorStore  # noqa: E402
+from infra.vector_stores.models import SearchKwargs  # noqa: E402
+
+
+class _HashEmbeddings(Embeddings):
+    """Deterministic embeddings derived from a hash of the text."""
+
+    dim = 16
+
+    def _embed(self, text):
+        seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).standard_normal(self.dim).tolist()
+
+    def embed_documents(self, texts):
+        return [self._embed(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a FaissVectorStore small enough to train in tests."""
+    return FaissVectorStore(persist_directory=str(tmp_path), nlist=4, pq_m=4, nprobe=4)
+
+
+def _docs(n):
+    return [
+        Document(page_content=f"chunk {i}", metadata={"ticker": f"T{i % 3}"})
+        for i in range(n)
+    ]
+
+
+class TestFaissVectorStore:
+    """Tests for the FaissVectorStore class."""
+
+    def test_search_flat_index(self, store):
+        """Small collections are searched exactly."""
+        store.add_documents(_docs(20), _HashEmbeddings())
+
+        docs = store.as_retriever(_HashEmbeddings()).invoke("chunk 7")
+
+        assert docs[0].page_content == "chunk 7"
+
+    def test_search_trained_index(self, store):
+        """Collections past the training threshold switch to IVF+PQ."""
+        import faiss
+
+        store.add_documents(_docs(300), _HashEmbeddings())
+
+        assert isinstance(store._collection.index, faiss.IndexRefine)
+        docs = store.as_retriever(
+            _HashEmbeddings(), search_kwargs=SearchKwargs(k=3)
+        ).invoke("chunk 42")
+        assert len(docs) == 3
+        assert docs[0].page_content == "chunk 42"
+
+    def test_search_applies_filters(self, store):
+        """Metadata filters are applied to the candidates."""
+        store.add_documents(_docs(30), _HashEmbeddings())
+
+        docs = store.as_retriever(
+            _HashEmbeddings(),
+            search_kwargs=SearchKwargs(k=5, filters={"ticker": ["T1", "T2"]}),
+        ).invoke("chunk 3")
+
+        assert docs
+        assert all(d.metadata["ticker"] in ("T1", "T2") for d in docs)
+
+    def test_collection_is_persisted(self, store, tmp_path):
+        """A new store instance loads the persisted collection."""
+        store.add_documents(_docs(10), _HashEmbeddings())
+
+        reloaded = FaissVectorStore(persist_directory=str(tmp_path))
+        docs = reloaded.as_retriever(_HashEmbeddings()).invoke("chunk 4")
+
+        assert docs[0].page_content == "chunk 4"
+
+    def test_empty_collection_returns_nothing(self, store):
+        """Searching a collection with no documents returns no results."""
+        assert store.as_retriever(_HashEmbeddings()).invoke("anything") == []
+
+    def test_adds_are_saved_incrementally(self, store, tmp_path):
+        """Small adds append to the log instead of rewriting the index."""
+        store.add_documents(_docs(20), _HashEmbeddings())
+        index_path = tmp_path / store.collection_name / "index.faiss"
+        saved = index_path.read_bytes()
+
+        store.add_documents(
+            [Document(page_content="late chunk", metadata={"ticker": "T0"})],
+            _HashEmbeddings(),
+        )
+
+        assert index_path.read_bytes() == saved
+        reloaded = FaissVectorStore(persist_directory=str(tmp_path))
+        docs = reloaded.as_retriever(_HashEmbeddings()).invoke("late chunk")
+        assert docs[0].page_content == "late chunk"
+        assert reloaded._collection.index.ntotal == 21
+
+    def test_large_log_rewrites_index(self, store, tmp_path):
+        """The index is rewritten once the log outgrows CHECKPOINT_RATIO."""
+        store.add_documents(_docs(8), _HashEmbeddings())
+        store.add_documents(_docs(4), _HashEmbeddings())
+
+        assert store._collection.saved_ntotal == 12
+        wal = (tmp_path / store.collection_name / "vectors.wal").read_bytes()
+        assert int.from_bytes(wal, "little") == 12
+
+    def test_torn_batch_is_dropped_on_load(self, store, tmp_path):
+        """A partially written document batch is truncated away on load."""
+        store.add_documents(_docs(20), _HashEmbeddings())
+        with open(tmp_path / store.collection_name / "index.pkl", "ab") as f:
+            f.write(b"\x80\x04\x95garbage")
+
+        reloaded = FaissVectorStore(persist_directory=str(tmp_path))
+        reloaded.add_documents(
+            [Document(page_content="late chunk", metadata={})], _HashEmbeddings()
+        )
+
+        again = FaissVectorStore(persist_directory=str(tmp_path))
+        assert len(again._load().documents) == 21
+        assert again._collection.index.ntotal == 21
+
+    @pytest.mark.parametrize("n", [20, 300])
+    def test_interrupted_rewrite_drops_orphaned_vectors(self, store, tmp_path, n):
+        """An index rewritten without its documents is truncated on load."""
+        store.add_documents(_docs(n), _HashEmbeddings())
+        # Rewrite the index with a batch whose documents are never appended
+        orphans = np.asarray(
+            _HashEmbeddings().embed_documents(["orphan"] * 5), dtype="float32"
+        )
+        store._collection.index.add(orphans)
+        store._write_index()
+
+        reloaded = FaissVectorStore(
+            persist_directory=str(tmp_path), nlist=4, pq_m=4, nprobe=4
+        )
+        assert reloaded._load().index.ntotal == n
+        reloaded.add_documents(
+            [Document(page_content="late chunk", metadata={})], _HashEmbeddings()
+        )
+
+        again = FaissVectorStore(
+            persist_directory=str(tmp_path), nlist=4, pq_m=4, nprobe=4
+        )
+        docs = again.as_retriever(_HashEmbeddings()).invoke("late chunk")
+        assert docs[0].page_content == "late chunk"
+        assert again._collection.index.ntotal == n + 1
+
+    def test_get_vectorstore_searches_collection(self, store):
+        """The LangChain wrapper searches the store's index and documents."""
+        store.add_documents(_docs(20), _HashEmbeddings())
+
+        docs = store.get_vectorstore(_HashEmbeddings()).similarity_search(
+            "chunk 7", k=2
+        )
+
+        assert docs[0].page_content == "chunk 7"
+        assert len(docs) == 2
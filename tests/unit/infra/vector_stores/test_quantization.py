@@ -0,0 +1,178 @@
+"""Tests for quantized retrieval."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from langchain_chroma import Chroma
+from langchain_core.embeddings import Embeddings
+
+from infra.vector_stores.quantization import (
+    QuantizedIndex,
+    QuantizedRetriever,
+    calibration_ranges,
+    quantize_embeddings,
+)
+
+
+def _normalized(rng, n, dim=64):
+    vectors = rng.standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+@pytest.fixture
+def corpus():
+    """Create normalized document vectors and a fake Chroma store over them."""
+    vectors = _normalized(np.random.default_rng(0), 500)
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+    by_id = dict(zip(ids, vectors))
+
+    def get(ids=None, include=()):
+        selected = ids if ids is not None else list(by_id)
+        return {
+            "ids": selected,
+            "embeddings": [by_id[i] for i in selected],
+            "documents": [f"text of {i}" for i in selected],
+            "metadatas": [{"id": i} for i in selected],
+        }
+
+    vectorstore = MagicMock(spec=Chroma)
+    vectorstore.get.side_effect = get
+    return vectors, ids, vectorstore
+
+
+class TestQuantizeEmbeddings:
+    """Tests for the quantize_embeddings function."""
+
+    def test_int8_codes_span_range(self):
+        """int8 codes map each dimension's range onto [-128, 127]."""
+        vectors = np.array([[0.0, -1.0], [1.0, 1.0]], dtype=np.float32)
+
+        codes = quantize_embeddings(vectors, "int8", calibration_ranges(vectors))
+
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [[-128, -128], [127, 127]]
+
+    def test_binary_packs_sign_bits(self):
+        """Binary quantization keeps one bit per dimension."""
+        vectors = np.array([[0.5, -0.5] * 8], dtype=np.float32)
+
+        codes = quantize_embeddings(vectors, "binary")
+
+        assert codes.dtype == np.uint8
+        assert codes.shape == (1, 2)
+        assert codes.tolist() == [[0b10101010, 0b10101010]]
+
+    def test_int8_requires_ranges(self):
+        """int8 quantization without calibration ranges is rejected."""
+        with pytest.raises(ValueError):
+            quantize_embeddings(np.zeros((1, 2)), "int8")
+
+
+class TestQuantizedRetriever:
+    """Tests for the QuantizedRetriever class."""
+
+    @pytest.mark.parametrize("precision", ["int8", "binary"])
+    def test_rescored_results_match_exact_search(self, corpus, precision):
+        """Rescoring the shortlist recovers the exact top results."""
+        vectors, ids, vectorstore = corpus
+        query = vectors[7] + 0.05 * _normalized(np.random.default_rng(1), 1)[0]
+        embeddings = MagicMock(spec=Embeddings)
+        embeddings.embed_query.return_value = query.tolist()
+
+        retriever = QuantizedRetriever(
+            vectorstore=vectorstore,
+            embeddings=embeddings,
+            index=QuantizedIndex.from_vectorstore(vectorstore, precision),
+            k=5,
+            rescore_multiplier=10,
+        )
+        docs = retriever.invoke("query")
+
+        exact = [ids[i] for i in np.argsort(-(vectors @ query))[:5]]
+        assert [d.id for d in docs][0] == "doc-7"
+        assert len({d.id for d in docs} & set(exact)) >= 4
+        assert docs[0].page_content == "text of doc-7"
+        assert docs[0].metadata == {"id": "doc-7"}
+
+    def test_empty_index_returns_nothing(self):
+        """An empty store yields no documents without embedding the query."""
+        vectorstore = MagicMock(spec=Chroma)
+        vectorstore.get.return_value = {"ids": [], "embeddings": []}
+        embeddings = MagicMock(spec=Embeddings)
+
+        retriever = QuantizedRetriever(
+            vectorstore=vectorstore,
+            embeddings=embeddings,
+            index=QuantizedIndex.from_vectorstore(vectorstore, "binary"),
+        )
+
+        assert retriever.invoke("query") == []
+        embeddings.embed_query.assert_not_called()
+
+    @pytest.mark.parametrize("precision", ["int8", "binary"])
+    def test_memmapped_rescoring(self, corpus, precision, tmp_path):
+        """Memmapped vectors rescore the shortlist and only top k are fetched."""
+        vectors, ids, vectorstore = corpus
+        query = vectors[7] + 0.05 * _normalized(np.random.default_rng(1), 1)[0]
+        embeddings = MagicMock(spec=Embeddings)
+        embeddings.embed_query.return_value = query.tolist()
+        index = QuantizedIndex.from_vectorstore(vectorstore, precision, tmp_path)
+
+        retriever = QuantizedRetriever(
+            vectorstore=vectorstore,
+            embeddings=embeddings,
+            index=index,
+            k=5,
+            rescore_multiplier=10,
+        )
+        docs = retriever.invoke("query")
+
+        assert isinstance(index.vectors, np.memmap)
+        exact = [ids[i] for i in np.argsort(-(vectors @ query))[:5]]
+        assert [d.id for d in docs][0] == "doc-7"
+        assert len({d.id for d in docs} & set(exact)) >= 4
+        assert docs[0].metadata == {"id": "doc-7"}
+        last_get = vectorstore.get.call_args
+        assert len(last_get.kwargs["ids"]) == 5
+        assert "embeddings" not in last_get.kwargs["include"]
+
+
+class TestQuantizedIndex:
+    """Tests for the QuantizedIndex class."""
+
+    def test_reuses_memmapped_vectors(self, corpus, tmp_path):
+        """A rebuilt index reads unchanged vectors from disk, not from Chroma."""
+        vectors, ids, vectorstore = corpus
+        QuantizedIndex.from_vectorstore(vectorstore, "binary", tmp_path)
+        vectorstore.get.reset_mock()
+
+        index = QuantizedIndex.from_vectorstore(vectorstore, "binary", tmp_path)
+
+        vectorstore.get.assert_called_once_with(include=[])
+        np.testing.assert_array_equal(index.vectors, vectors)
+
+    def test_rewrites_vectors_when_ids_change(self, corpus, tmp_path):
+        """Stale memmapped vectors are replaced after the collection changes."""
+        vectors, ids, vectorstore = corpus
+        QuantizedIndex.from_vectorstore(vectorstore, "int8", tmp_path)
+        get = vectorstore.get.side_effect
+        vectorstore.get.side_effect = lambda ids=None, include=(): get(
+            ids=ids if ids is not None else [f"doc-{i}" for i in range(10)]
+        )
+
+        index = QuantizedIndex.from_vectorstore(vectorstore, "int8", tmp_path)
+
+        assert len(index) == 10
+        np.testing.assert_array_equal(index.vectors, vectors[:10])
+
+    def test_invalidated_cache_is_rewritten(self, corpus, tmp_path):
+        """Vectors upserted under the same IDs are refetched once invalidated."""
+        vectors, ids, vectorstore = corpus
+        QuantizedIndex.from_vectorstore(vectorstore, "binary", tmp_path)
+        vectors[:] = -vectors
+
+        QuantizedIndex.invalidate_cache(tmp_path)
+        index = QuantizedIndex.from_vectorstore(vectorstore, "binary", tmp_path)
+
+        np.testing.assert_array_equal(index.vectors, vectors)
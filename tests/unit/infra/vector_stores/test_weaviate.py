@@ -0,0 +1,379 @@
+"""Tests for the WeaviateVectorStore class."""
+
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from weaviate.classes.config import VectorDistances
+
+from infra.vector_stores import weaviate
+from infra.vector_stores.models import SearchKwargs
+from infra.vector_stores.weaviate import (
+    WeaviateRetriever,
+    WeaviateVectorStore,
+    _content_uuid,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    """Forget schemas ensured by earlier tests."""
+    weaviate._ensured_schemas.clear()
+    yield
+    weaviate._ensured_schemas.clear()
+
+
+@pytest.fixture
+def client():
+    """Create a mock Weaviate client whose inserts succeed."""
+    client = MagicMock()
+    insert_many = client.collections.get.return_value.data.insert_many
+    insert_many.return_value.has_errors = False
+    return client
+
+
+@pytest.fixture
+def embeddings():
+    """Create a mock embedding model."""
+    mock = MagicMock(spec=Embeddings)
+    mock.embed_documents.side_effect = lambda texts: [
+        [float(i)] for i in range(len(texts))
+    ]
+    return mock
+
+
+class TestWeaviateVectorStore:
+    """Tests for the WeaviateVectorStore class."""
+
+    def test_add_documents_inserts_in_batches(self, client, embeddings):
+        """Documents are embedded once and written with batched insert_many."""
+        store = WeaviateVectorStore(
+            index_name="SECFilings",
+            client=client,
+            batch_size=2,
+            num_workers=2,
+            insert_retries=0,
+        )
+        filed = datetime(2025, 5, 2)
+        documents = [
+            Document(page_content=f"chunk {i}", metadata={"filed": filed})
+            for i in range(3)
+        ]
+
+        store.add_documents(documents, embeddings)
+
+        embeddings.embed_documents.assert_called_once()
+        client.collections.get.assert_called_once_with("SECFilings")
+        insert_many = client.collections.get.return_value.data.insert_many
+        batches = sorted(
+            (c.args[0] for c in insert_many.call_args_list), key=len, reverse=True
+        )
+        assert [len(b) for b in batches] == [2, 1]
+        first = batches[0][0]
+        assert first.properties == {
+            "filed": "2025-05-02T00:00:00",
+            "page_content": "chunk 0",
+        }
+        assert first.vector == [0.0]
+        client.close.assert_not_called()
+
+    def test_batches_are_capped_by_payload_size(self, client):
+        """Large objects start a new batch before the byte budget is exceeded."""
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+        store.MAX_BATCH_BYTES = 1000
+        objects = [
+            store._data_object(Document(page_content="x" * 300), [0.0] * 50)
+            for _ in range(4)
+        ]
+
+        assert [len(batch) for batch in store._batches(objects)] == [2, 2]
+
+    def test_add_documents_uses_stable_ids(self, client, embeddings):
+        """Re-adding the same chunk produces the same object UUID."""
+        store = WeaviateVectorStore(
+            client=client, batch_size=2, num_workers=1, insert_retries=0
+        )
+        document = Document(page_content="chunk", metadata={"ticker": "AAPL"})
+
+        first = store._data_object(document, [0.0])
+        second = store._data_object(document, [1.0])
+
+        assert first.uuid == second.uuid
+
+    def test_content_uuid_is_canonical(self):
+        """Content UUIDs ignore key order and change with the content."""
+        first = _content_uuid({"ticker": "AAPL", "page_content": "chunk"})
+        second = _content_uuid({"page_content": "chunk", "ticker": "AAPL"})
+        other = _content_uuid({"page_content": "other", "ticker": "AAPL"})
+
+        assert first == second != other
+        assert uuid.UUID(first).version == 8
+
+    def test_add_documents_retries_failed_objects(self, client, embeddings):
+        """Only the objects that failed are sent again."""
+        failed = MagicMock(has_errors=True, errors={1: MagicMock(message="timeout")})
+        succeeded = MagicMock(has_errors=False)
+        insert_many = client.collections.get.return_value.data.insert_many
+        insert_many.side_effect = [failed, succeeded]
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=1
+        )
+        documents = [Document(page_content=f"chunk {i}") for i in range(2)]
+
+        store.add_documents(documents, embeddings)
+
+        retried = insert_many.call_args_list[1].args[0]
+        assert [o.properties["page_content"] for o in retried] == ["chunk 1"]
+
+    def test_add_documents_raises_on_insert_errors(self, client, embeddings):
+        """Objects failing every retry surface as an error, not dropped."""
+        result = client.collections.get.return_value.data.insert_many.return_value
+        result.has_errors = True
+        result.errors = {0: MagicMock(message="bad property")}
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=1
+        )
+
+        with pytest.raises(RuntimeError, match="bad property"):
+            store.add_documents([Document(page_content="chunk")], embeddings)
+
+        insert_many = client.collections.get.return_value.data.insert_many
+        assert insert_many.call_count == 2
+
+    @pytest.mark.parametrize(
+        "mock_settings", ["infra.vector_stores.weaviate"], indirect=True
+    )
+    def test_batch_settings_default_from_settings(self, mock_settings, client):
+        """Unset batch parameters are read from the application settings."""
+        settings = mock_settings.return_value
+        settings.WEAVIATE_BATCH_SIZE = 50
+        settings.WEAVIATE_NUM_WORKERS = 4
+        settings.WEAVIATE_INSERT_RETRIES = 3
+
+        store = WeaviateVectorStore(client=client)
+
+        assert (store.batch_size, store.num_workers, store.insert_retries) == (50, 4, 3)
+
+    @pytest.mark.parametrize(
+        "mock_settings", ["infra.vector_stores.weaviate"], indirect=True
+    )
+    def test_stores_share_connection(self, mock_settings, client, embeddings):
+        """Writes from several stores reuse one shared client."""
+        stores = [
+            WeaviateVectorStore(batch_size=10, num_workers=1, insert_retries=0)
+            for _ in range(2)
+        ]
+
+        with patch(
+            "infra.vector_stores.weaviate.get_weaviate_client", return_value=client
+        ) as get_client:
+            for store in stores:
+                store.add_documents([Document(page_content="a")], embeddings)
+                store.add_documents([Document(page_content="b")], embeddings)
+
+        assert get_client.call_count == 2
+        client.close.assert_not_called()
+
+    def test_set_collection_checks_schema_once(self, client):
+        """Repeated set_collection calls skip the schema round trips."""
+        client.collections.exists.return_value = False
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+        other = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        store.set_collection("SECFilings", {"ticker": "AAPL"})
+        store.set_collection("SECFilings", {"ticker": "MSFT"})
+        other.set_collection("SECFilings", {"ticker": "AAPL"})
+
+        client.collections.exists.assert_called_once_with("SECFilings")
+        client.collections.create.assert_called_once()
+
+    def test_existing_collection_gets_missing_properties(self, client):
+        """Existing collections are checked by name and only gain new properties."""
+        client.collections.exists.return_value = True
+        config = client.collections.get.return_value.config
+        config.get.return_value.properties = [MagicMock()]
+        config.get.return_value.properties[0].name = "ticker"
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        store.set_collection("SECFilings", {"ticker": "AAPL", "year": 2024})
+
+        client.collections.list_all.assert_not_called()
+        client.collections.create.assert_not_called()
+        added = [call.args[0].name for call in config.add_property.call_args_list]
+        assert added == ["year", "page_content"]
+
+    def test_new_collections_use_scalar_quantization(self, client):
+        """Collections are created with an int8 scalar-quantized HNSW index."""
+        client.collections.exists.return_value = False
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        store.set_collection("SECFilings", {"ticker": "AAPL"})
+
+        config = client.collections.create.call_args.kwargs["vector_index_config"]
+        assert config.quantizer.rescoreLimit == store.SQ_RESCORE_LIMIT
+        assert config.distance == VectorDistances.COSINE
+
+    def test_set_collection_fast_path_skips_property_models(self, client):
+        """A store that already ensured a schema skips rebuilding it."""
+        client.collections.exists.return_value = False
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+        store.set_collection("SECFilings", {"ticker": "AAPL"})
+
+        with patch("infra.vector_stores.weaviate.Property") as property_model:
+            store.set_collection("SECFilings", {"ticker": "MSFT"})
+
+        property_model.assert_not_called()
+
+    def test_set_collection_rechecks_new_properties(self, client):
+        """A new metadata property triggers another schema check."""
+        client.collections.exists.return_value = False
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        store.set_collection("SECFilings", {"ticker": "AAPL"})
+        store.set_collection("SECFilings", {"ticker": "AAPL", "year": 2024})
+
+        assert client.collections.exists.call_count == 2
+
+    def test_vectorstore_reused_across_queries(self, client, embeddings):
+        """The LangChain store is only rebuilt for new collections or embeddings."""
+        client.collections.exists.return_value = False
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        with patch("infra.vector_stores.weaviate.LCWeaviate") as lc_weaviate:
+            store.set_collection("SECFilings", {"ticker": "AAPL"})
+            first = store.get_vectorstore(embeddings)
+            store.set_collection("SECFilings", {"ticker": "AAPL"})
+            assert store.get_vectorstore(embeddings) is first
+            assert lc_weaviate.call_count == 1
+
+            store.get_vectorstore(MagicMock(spec=Embeddings))
+            store.set_collection("Transcripts", {"ticker": "AAPL"})
+            store.get_vectorstore(embeddings)
+            assert lc_weaviate.call_count == 3
+
+    def test_delete_uses_batched_delete_many(self, client):
+        """IDs are deleted with one delete_many request per batch."""
+        delete_many = client.collections.get.return_value.data.delete_many
+        delete_many.return_value.successful = 2
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+        store.DELETE_BATCH_SIZE = 2
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+
+        assert store.delete(ids) == 4
+        assert delete_many.call_count == 2
+
+    def test_delete_without_ids_is_a_no_op(self, client):
+        """Deleting no IDs makes no requests."""
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        assert store.delete([]) == 0
+        client.collections.get.assert_not_called()
+
+    def test_hybrid_search_runs_server_side(self, client, embeddings):
+        """Hybrid retrievers issue one hybrid query and map objects to documents."""
+        embeddings.embed_query.return_value = [0.1, 0.2]
+        query = client.collections.get.return_value.query
+        query.hybrid.return_value.objects = [
+            MagicMock(
+                uuid=uuid.UUID(int=1),
+                properties={"page_content": "revenue grew", "ticker": "AAPL"},
+            )
+        ]
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        retriever = store.as_retriever(
+            embeddings, search_type="hybrid", search_kwargs=SearchKwargs(k=3)
+        )
+        documents = retriever.invoke("revenue")
+
+        assert isinstance(retriever, WeaviateRetriever)
+        query.hybrid.assert_called_once_with(
+            query="revenue", vector=[0.1, 0.2], alpha=0.5, limit=3, filters=None
+        )
+        assert documents == [
+            Document(
+                id=str(uuid.UUID(int=1)),
+                page_content="revenue grew",
+                metadata={"ticker": "AAPL"},
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_embeds_query_async(self, client, embeddings):
+        """Async hybrid retrievers embed with aembed_query and pass filters."""
+        embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2])
+        query = client.collections.get.return_value.query
+        query.hybrid.return_value.objects = []
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        retriever = store.as_retriever(
+            embeddings,
+            search_type="hybrid",
+            search_kwargs=SearchKwargs(k=2, filters={"ticker": "AAPL"}),
+        )
+        assert await retriever.ainvoke("revenue") == []
+
+        kwargs = query.hybrid.call_args.kwargs
+        assert kwargs["vector"] == [0.1, 0.2]
+        assert kwargs["limit"] == 2
+        assert kwargs["filters"] is not None
+        embeddings.embed_query.assert_not_called()
+
+    def test_mmr_search_uses_langchain_retriever(self, client, embeddings):
+        """MMR retrievers go through the LangChain Weaviate store."""
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+
+        with patch("infra.vector_stores.weaviate.LCWeaviate") as lc_weaviate:
+            retriever = store.as_retriever(
+                embeddings, search_type="mmr", search_kwargs=SearchKwargs(k=2)
+            )
+
+        lc_weaviate.return_value.as_retriever.assert_called_once_with(
+            search_type="mmr", search_kwargs={"k": 2}
+        )
+        assert retriever is lc_weaviate.return_value.as_retriever.return_value
+
+    def test_filters_are_compiled_once(self, client):
+        """Repeated metadata filters reuse one compiled filter tree."""
+        store = WeaviateVectorStore(
+            client=client, batch_size=10, num_workers=1, insert_retries=0
+        )
+        filters = {"ticker": ["AAPL", "MSFT"], "year": 2024}
+
+        first = store._convert_filters_to_where_clause(filters)
+        second = store._convert_filters_to_where_clause(dict(filters))
+        as_bool = store._convert_filters_to_where_clause({"year": True})
+        as_int = store._convert_filters_to_where_clause({"year": 1})
+
+        assert first is second
+        assert as_bool.value is True
+        assert as_int.value == 1 and as_int.value is not True